@@ -10,11 +10,14 @@ except ImportError:
     pass
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, scrolledtext, messagebox
 import json
+import logging
 import os
+import random
+import re
 import sys
-import time
 import threading
 import uuid
 from dictionary_engine import DictionaryEngine
@@ -57,6 +60,112 @@ except ImportError:
         pyperclip = DummyClipboard
         print("Using dummy clipboard implementation")
 
+# Cheap clipboard change counter so polling only reads the clipboard when it changed.
+# Linux has no equivalent without extra dependencies, so it keeps plain polling.
+_clipboard_sequence = None
+if sys.platform == 'win32':
+    try:
+        import ctypes
+        _clipboard_sequence = ctypes.windll.user32.GetClipboardSequenceNumber
+    except Exception:
+        pass
+elif sys.platform == 'darwin':
+    try:
+        from AppKit import NSPasteboard
+        _clipboard_sequence = lambda: NSPasteboard.generalPasteboard().changeCount()
+    except ImportError:
+        pass
+
+log = logging.getLogger(__name__)
+
+# Characters that make up a word when double-clicking in the sentence context
+_WORD_RE = re.compile(r"[\w'\-]+")
+
+def _previous_word_start(text):
+    """Return the index where the last word of text starts, skipping trailing whitespace"""
+    stripped = text.rstrip()
+    if not stripped:
+        return 0
+    return len(stripped) - len(stripped.rsplit(None, 1)[-1])
+
+def _is_read_only(widget):
+    """Return True for Text widgets that are disabled and so must not be edited"""
+    return isinstance(widget, tk.Text) and widget.cget("state") == tk.DISABLED
+
+def _select_all_entry(event):
+    """Select all text in an Entry widget (Ctrl+A)"""
+    event.widget.select_range(0, tk.END)
+    event.widget.icursor(tk.END)  # Set cursor position to the end
+    return "break"
+
+def _select_all_text(event):
+    """Select all text in a Text widget (Ctrl+A)"""
+    event.widget.tag_add(tk.SEL, "1.0", tk.END)
+    event.widget.mark_set(tk.INSERT, tk.END)
+    return "break"
+
+def _get_selection(widget):
+    """Return the selected text of an Entry or Text widget, or None"""
+    if isinstance(widget, tk.Text):
+        if widget.tag_ranges(tk.SEL):
+            return widget.get(tk.SEL_FIRST, tk.SEL_LAST)
+    elif widget.selection_present():
+        return widget.selection_get()
+    return None
+
+def _copy_selection(event):
+    """Copy selected text (Ctrl+C)"""
+    try:
+        selected_text = _get_selection(event.widget)
+        if selected_text is not None:
+            event.widget.clipboard_clear()
+            event.widget.clipboard_append(selected_text)
+    except Exception:
+        log.exception("Error copying text")
+    return "break"
+
+def _cut_selection(event):
+    """Cut selected text (Ctrl+X), leaving read-only widgets untouched"""
+    if _is_read_only(event.widget):
+        return "break"
+    try:
+        selected_text = _get_selection(event.widget)
+        if selected_text is not None:
+            event.widget.clipboard_clear()
+            event.widget.clipboard_append(selected_text)
+            event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
+    except Exception:
+        log.exception("Error cutting text")
+    return "break"
+
+def _paste_text(event):
+    """Paste text (Ctrl+V), replacing any selection, except in read-only widgets"""
+    if _is_read_only(event.widget):
+        return "break"
+    try:
+        clipboard_text = event.widget.clipboard_get()
+        if not clipboard_text:
+            return "break"
+        
+        if _get_selection(event.widget) is not None:
+            event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
+        event.widget.insert(tk.INSERT, clipboard_text)
+    except Exception as e:
+        # clipboard_get raises when the clipboard is empty or holds no text
+        log.debug("Error pasting text: %s", e)
+    return "break"
+
+# Named fonts used by the entry display tags: (base size, weight, slant)
+_TAG_FONT_SPECS = {
+    "f10": (10, "normal", "roman"),
+    "f10b": (10, "bold", "roman"),
+    "f10i": (10, "normal", "italic"),
+    "f12": (12, "normal", "roman"),
+    "f12b": (12, "bold", "roman"),
+    "f12i": (12, "normal", "italic"),
+    "f16b": (16, "bold", "roman"),
+}
+
 class DictionaryApp:
     def __init__(self, root):
         self.root = root
@@ -79,6 +188,13 @@ class DictionaryApp:
         
         # Queue status update interval (ms)
         self.queue_update_interval = 250
+        self.queue_idle_interval = 1000
+        
+        # Last (pending, active) counts shown in the queue status bar
+        self._last_queue_state = (-1, -1)
+        
+        # Whether the queue progress bar is currently animating
+        self._progress_running = False
         
         # Dictionary to map request IDs to operations
         self.pending_requests = {}
@@ -86,6 +202,16 @@ class DictionaryApp:
         # Load existing dictionary data from database
         self.filtered_data = []
         
+        # Headwords currently shown in the recent lookups list
+        self._recent_displayed = []
+        
+        # Cached language sets, refreshed by update_language_options
+        self._lang_cache = None
+        self._lang_sorted_available = None
+        self._removed_cache = None
+        self._custom_display_cache = None
+        self._custom_index_cache = None
+        
         # Store the current entry for delete/regenerate operations
         self.current_entry = None
         
@@ -97,7 +223,37 @@ class DictionaryApp:
         # Clipboard monitoring state
         self.clipboard_monitoring = False
         self.last_clipboard_content = ""
-        self.clipboard_check_interval = 500  # milliseconds
+        self.last_clipboard_key = (0, hash(""))
+        self.last_clipboard_sequence = None
+        # Poll less often where every check has to read the whole clipboard
+        self.clipboard_check_interval = 500 if _clipboard_sequence else 1000  # milliseconds
+        
+        # Scaled Font objects shared between widgets, keyed by (size, weight, slant)
+        self._font_cache = {}
+        self._font_scale = None
+        
+        # Font shared by the headword and recent lookups lists, resized in place
+        self._list_font = tkfont.Font(root=self.root, family="Arial", size=10)
+        
+        # Fonts for the entry display tags, resized in place when the scale changes
+        self._tag_fonts = {
+            name: tkfont.Font(root=self.root, family="Arial", size=size, weight=weight, slant=slant)
+            for name, (size, weight, slant) in _TAG_FONT_SPECS.items()
+        }
+        
+        # Anki field mappers keyed by (note_type, settings version)
+        self._mapper_cache = {}
+        
+        # Widgets whose font follows the text scale, keyed by (base_size, weight)
+        self._scale_registry = {}
+        
+        # Pending debounced text scaling callback
+        self._scale_after_id = None
+        
+        # Shared ttk style, with the export result button styles configured once
+        self._style = ttk.Style(self.root)
+        self._style.configure("Success.TButton", background="green", foreground="white")
+        self._style.configure("Danger.TButton", background="red", foreground="white")
         
         # Initialize Anki connector
         self.anki_connector = None
@@ -110,6 +266,7 @@ class DictionaryApp:
         
         # Setup the GUI layout
         self.setup_gui()
+        self.bind_standard_text_shortcuts()
         
         # Apply saved user settings
         self.apply_saved_settings()
@@ -120,7 +277,7 @@ class DictionaryApp:
         # Apply text scaling if saved in settings
         settings = self.user_settings.get_settings()
         text_scale = settings.get('text_scale_factor', 1.0)
-        self.apply_text_scaling(text_scale)
+        self._apply_text_scaling_now(text_scale)
         
         # Load initial data
         self.reload_data()
@@ -282,6 +439,7 @@ class DictionaryApp:
         self.search_entry = ttk.Entry(self.left_panel, textvariable=self.search_var)
         self.search_entry.pack(fill=tk.X, padx=5, pady=5)
         self.search_entry.bind("<KeyRelease>", self.filter_headwords)
+        self._register_scaled(self.search_entry, 10)
         # Add standard text editing shortcuts
         self.add_standard_text_bindings(self.search_entry)
         
@@ -290,12 +448,12 @@ class DictionaryApp:
         self.recent_lookups_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
         
         # Recent lookups list
-        self.recent_lookups_list = tk.Listbox(self.recent_lookups_frame, height=5)
+        self.recent_lookups_list = tk.Listbox(self.recent_lookups_frame, height=5, font=self._list_font)
         self.recent_lookups_list.pack(expand=False, fill=tk.X, padx=5, pady=5)
         self.recent_lookups_list.bind("<<ListboxSelect>>", self.show_recent_lookup)
         
         # Headword list (main dictionary list)
-        self.headword_list = tk.Listbox(self.left_panel)
+        self.headword_list = tk.Listbox(self.left_panel, font=self._list_font)
         self.headword_list.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
         self.headword_list.bind("<<ListboxSelect>>", self.show_entry)
         
@@ -304,7 +462,9 @@ class DictionaryApp:
         self.language_filter_frame.pack(fill=tk.X, padx=5, pady=5)
         
         # Target language dropdown (learning language)
-        tk.Label(self.language_filter_frame, text="Learning Language:").pack(anchor=tk.W)
+        target_lang_label = tk.Label(self.language_filter_frame, text="Learning Language:")
+        target_lang_label.pack(anchor=tk.W)
+        self._register_scaled(target_lang_label, 10)
         self.target_lang_var = tk.StringVar()
         self.target_lang_dropdown = ttk.Combobox(
             self.language_filter_frame, 
@@ -319,7 +479,9 @@ class DictionaryApp:
         self.source_lang_var = tk.StringVar(value="English")
         
         # Definition language dropdown
-        tk.Label(self.language_filter_frame, text="Definition Language:").pack(anchor=tk.W)
+        definition_lang_label = tk.Label(self.language_filter_frame, text="Definition Language:")
+        definition_lang_label.pack(anchor=tk.W)
+        self._register_scaled(definition_lang_label, 10)
         self.definition_lang_var = tk.StringVar()
         self.definition_lang_dropdown = ttk.Combobox(
             self.language_filter_frame, 
@@ -352,6 +514,7 @@ class DictionaryApp:
         )
         self.entry_display.pack(expand=True, fill=tk.BOTH)
         self.entry_display.config(state=tk.DISABLED)
+        self._register_scaled(self.entry_display, 12)
         
         # Add standard text editing shortcuts for selection and copying
         self.add_standard_text_bindings(self.entry_display)
@@ -381,16 +544,18 @@ class DictionaryApp:
         )
         self.regenerate_button.pack(side=tk.RIGHT, padx=5)
         
-        # Configure tags for formatting
-        self.entry_display.tag_config("language_header", font=("Arial", 10), foreground="gray")
-        self.entry_display.tag_config("context_header", font=("Arial", 10, "bold"), foreground="#008800")  # Green for context
+        # Configure tags for formatting; scaled tags use the shared named fonts
+        fonts = self._tag_fonts
+        self.entry_display.tag_config("language_header", font=fonts["f10"], foreground="gray")
+        self.entry_display.tag_config("context_header", font=fonts["f10b"], foreground="#008800")  # Green for context
         
         # Add divider for visual separation
         self.entry_display.tag_config("divider", foreground="#cccccc")
         
         # Improved headword styling for better visual impact
-        self.entry_display.tag_config("headword", font=("Arial", 18, "bold"), foreground="#333333")
-        self.entry_display.tag_config("pos", font=("Arial", 12, "italic"), foreground="#555555")
+        self.entry_display.tag_config("headword", font=fonts["f16b"], foreground="#333333")
+        self.entry_display.tag_config("pos", font=fonts["f12i"], foreground="#555555")
+        self.entry_display.tag_config("definition", font=fonts["f12b"])
         
         # Create dedicated tags for definition number and content for better styling
         self.entry_display.tag_config("definition_number", 
@@ -400,23 +565,23 @@ class DictionaryApp:
         
         # Content tag has specialized margins for proper wrapping
         self.entry_display.tag_config("definition_content", 
-            font=("Arial", 12, "bold"),  # Bold font for better emphasis and readability
+            font=fonts["f12b"],  # Bold font for better emphasis and readability
             lmargin1=40,  # Left margin for first line
             lmargin2=40,  # Left margin for wrapped lines
             rmargin=20,   # Right margin
             wrap="word"   # Ensure word wrapping for this tag
         )
         
-        self.entry_display.tag_config("grammar", font=("Arial", 10), foreground="gray")
-        self.entry_display.tag_config("example_label", font=("Arial", 11, "italic", "bold"))
-        self.entry_display.tag_config("context_example_label", font=("Arial", 11, "italic", "bold"), foreground="#008800")  # Green for context examples
+        self.entry_display.tag_config("grammar", font=fonts["f10"], foreground="gray")
+        self.entry_display.tag_config("example_label", font=fonts["f10i"])
+        self.entry_display.tag_config("context_example_label", font=fonts["f10i"], foreground="#008800")  # Green for context examples
         
         # Add a bullet tag for better formatting
         self.entry_display.tag_config("example_bullet", font=("Arial", 10), foreground="#666666")
         
         # Improve example styling
         self.entry_display.tag_config("example", 
-            font=("Arial", 11),
+            font=fonts["f12"],
             lmargin1=60,  # Indentation for first line
             lmargin2=60,  # Indentation for wrapped lines
             wrap="word"   # Ensure word wrapping
@@ -424,7 +589,7 @@ class DictionaryApp:
         
         # Context examples have a distinct styling
         self.entry_display.tag_config("context_example", 
-            font=("Arial", 11),
+            font=fonts["f12"],
             background="#f0fff0",  # Light green background 
             lmargin1=60,  # Indentation for first line
             lmargin2=60,  # Indentation for wrapped lines
@@ -432,13 +597,13 @@ class DictionaryApp:
         )
         self.entry_display.tag_config("translation_indent", font=("Arial", 10))
         self.entry_display.tag_config("translation", 
-            font=("Arial", 10, "italic"), 
-            foreground="#666666",  # Softer color for better contrast
+            font=fonts["f10i"], 
+            foreground="blue",
             lmargin1=70,           # Maintain indentation
             lmargin2=70
         )
-        self.entry_display.tag_config("status", font=("Arial", 12), foreground="green")
-        self.entry_display.tag_config("multiword_headword", font=("Arial", 18, "bold"), foreground="#0066aa")
+        self.entry_display.tag_config("status", font=fonts["f12"], foreground="green")
+        self.entry_display.tag_config("multiword_headword", font=fonts["f16b"], foreground="navy")
     
     def create_search_bar(self):
         # Bottom search bar for new entries
@@ -495,18 +660,22 @@ class DictionaryApp:
         self.cancel_queue_btn.pack_forget()
         
         # Title for the search area to make it more visible
-        search_title = tk.Label(search_frame, text="Add New Word to Dictionary", font=("Arial", 11, "bold"))
-        search_title.pack(pady=(3, 5))
+        self._add_new_word_label = tk.Label(search_frame, text="Add New Word to Dictionary", font=("Arial", 11, "bold"))
+        self._add_new_word_label.pack(pady=(3, 5))
+        self._register_scaled(self._add_new_word_label, 12, "bold")
         
         # Input area with clear label
         input_frame = tk.Frame(search_frame)
         input_frame.pack(fill=tk.X, padx=20, pady=3)
         
-        tk.Label(input_frame, text="Enter word:", font=("Arial", 10)).pack(side=tk.LEFT, padx=(0, 5))
+        self._enter_word_label = tk.Label(input_frame, text="Enter word:", font=("Arial", 10))
+        self._enter_word_label.pack(side=tk.LEFT, padx=(0, 5))
+        self._register_scaled(self._enter_word_label, 10)
         
         self.new_word_var = tk.StringVar()
         self.new_word_entry = ttk.Entry(input_frame, textvariable=self.new_word_var, width=30, font=("Arial", 12))
         self.new_word_entry.pack(side=tk.LEFT, padx=5, ipady=3)  # Add some padding to make the entry larger
+        self._register_scaled(self.new_word_entry, 12)
         
         self.search_btn = ttk.Button(input_frame, text="Search", command=self.search_new_word)
         self.search_btn.pack(side=tk.LEFT, padx=5)
@@ -527,6 +696,7 @@ class DictionaryApp:
         
         self.hint_label = tk.Label(hint_frame, text="Using your selected language preferences", font=("Arial", 8), fg="gray")
         self.hint_label.pack(side=tk.LEFT)
+        self._register_scaled(self.hint_label, 8)
         
         # Bind Enter key to search
         self.new_word_entry.bind("<Return>", lambda event: self.search_new_word())
@@ -763,19 +933,40 @@ class DictionaryApp:
         except Exception as e:
             print(f"Error reloading data: {e}")
     
+    def _get_all_languages(self):
+        """Get database and custom languages, cached until the language options are refreshed"""
+        if self._lang_cache is None:
+            languages = self.db_manager.get_all_languages()
+            self._lang_cache = (frozenset(languages["target_languages"])
+                                | frozenset(languages["definition_languages"])
+                                | frozenset(self.load_custom_languages()))
+            self._lang_sorted_available = None
+        return self._lang_cache
+    
+    def _get_sorted_available_languages(self):
+        """Get a sorted tuple of the languages that have not been removed"""
+        if self._lang_sorted_available is None:
+            removed_languages = set(self.load_removed_languages())
+            self._lang_sorted_available = tuple(sorted(self._get_all_languages() - removed_languages))
+        return self._lang_sorted_available
+    
+    def _invalidate_language_cache(self):
+        """Drop the cached language sets so they are rebuilt on next use"""
+        self._lang_cache = None
+        self._lang_sorted_available = None
+    
     def update_language_options(self):
         """Update the available options in language dropdowns"""
-        languages = self.db_manager.get_all_languages()
+        # The database or settings may have changed, so rebuild the language cache
+        self._invalidate_language_cache()
         
         # Get languages from database and custom languages from settings
-        db_languages = set(languages["target_languages"]).union(set(languages["definition_languages"]))
-        custom_languages = set(self.load_custom_languages())
         removed_languages = set(self.load_removed_languages())
         
         # Debug info removed for production
         
         # Combine all languages and remove the ones marked as removed
-        all_languages = db_languages.union(custom_languages) - removed_languages
+        all_languages = self._get_all_languages() - removed_languages
         
         # Get the raw custom language data for handling standardized names
         raw_custom_languages = self.user_settings.get_setting('custom_languages', [])
@@ -1298,6 +1489,7 @@ class DictionaryApp:
         # Add application title to top left
         self.title_label = ttk.Label(self.top_panel, text="AI-Powered Dictionary", font=("Arial", 14, "bold"))
         self.title_label.pack(side=tk.LEFT, padx=5, pady=5)
+        self._register_scaled(self.title_label, 14, "bold")
         
         # Bind key events to show/hide admin buttons
         self.root.bind("<Alt-KeyPress>", self.show_admin_buttons)
@@ -1432,8 +1624,7 @@ class DictionaryApp:
             dialog.update_idletasks()  # Force UI update
             
             # Check if language already exists
-            languages = self.db_manager.get_all_languages()
-            all_current_languages = set(languages["target_languages"]) | set(languages["definition_languages"]) | set(self.load_custom_languages())
+            all_current_languages = self._get_all_languages()
             
             if new_language in all_current_languages:
                 status_var.set(f"Language '{new_language}' already exists")
@@ -1456,14 +1647,18 @@ class DictionaryApp:
             if restore_var and restore_combo:
                 language_to_restore = restore_var.get().strip()
                 if language_to_restore:
-                    # Remove from the removed_languages list
-                    self.remove_from_removed_languages(language_to_restore)
+                    def apply_restore():
+                        # Remove from the removed_languages list
+                        self.remove_from_removed_languages(language_to_restore)
+                        
+                        # Update language options
+                        self.update_language_options()
+                        
+                        # Show success message
+                        self.show_status_message(f"Restored language: {language_to_restore}")
                     
-                    # Update language options
-                    self.update_language_options()
-                    
-                    # Show success message
-                    self.show_status_message(f"Restored language: {language_to_restore}")
+                    # Apply the change in a single idle cycle once the dialog is gone
+                    self.root.after_idle(apply_restore)
                     
                     dialog.destroy()
         
@@ -1508,16 +1703,13 @@ class DictionaryApp:
         ttk.Label(frame, text="Select language to remove:").pack(pady=(0, 5))
         
         # Get current languages
-        languages = self.db_manager.get_all_languages()
-        all_languages = set(languages["target_languages"]) | set(languages["definition_languages"]) | set(self.load_custom_languages())
-        removed_languages = set(self.load_removed_languages())
-        available_languages = all_languages - removed_languages
+        available_languages = self._get_sorted_available_languages()
         
         if not available_languages:
             ttk.Label(frame, text="No languages to remove", foreground="red").pack(pady=(0, 10))
         else:
             language_var = tk.StringVar()
-            language_combo = ttk.Combobox(frame, textvariable=language_var, values=sorted(available_languages), state="readonly", width=28)
+            language_combo = ttk.Combobox(frame, textvariable=language_var, values=available_languages, state="readonly", width=28)
             language_combo.pack(pady=(0, 15))
             language_combo.focus()
         
@@ -1529,14 +1721,18 @@ class DictionaryApp:
             if available_languages:
                 language_to_remove = language_var.get().strip()
                 if language_to_remove:
-                    # Add to removed languages list
-                    self.save_removed_language(language_to_remove)
-                    
-                    # Update language options
-                    self.update_language_options()
+                    def apply_removal():
+                        # Add to removed languages list
+                        self.save_removed_language(language_to_remove)
+                        
+                        # Update language options
+                        self.update_language_options()
+                        
+                        # Show success message
+                        self.show_status_message(f"Removed language: {language_to_remove}")
                     
-                    # Show success message
-                    self.show_status_message(f"Removed language: {language_to_remove}")
+                    # Apply the change in a single idle cycle once the dialog is gone
+                    self.root.after_idle(apply_removal)
                 
                 dialog.destroy()
         
@@ -1577,37 +1773,48 @@ class DictionaryApp:
         }
         
         # Check if language already exists (by standardized name)
-        for i, lang in enumerate(custom_languages):
-            if isinstance(lang, dict) and lang.get("standardized_name") == standardized_name:
-                # Update existing entry
-                custom_languages[i] = language_entry
-                self.user_settings.update_settings({'custom_languages': custom_languages})
-                return
-            elif not isinstance(lang, dict) and lang == standardized_name:
-                # Replace string entry with dict entry
-                custom_languages[i] = language_entry
-                self.user_settings.update_settings({'custom_languages': custom_languages})
-                return
+        index = self._get_custom_language_index().get(standardized_name)
+        if index is None:
+            # Language doesn't exist, so add it
+            custom_languages.append(language_entry)
+        elif custom_languages[index] == language_entry:
+            # Nothing changed, so skip the settings write
+            return
+        else:
+            # Update existing entry (also replaces old string entries)
+            custom_languages[index] = language_entry
         
-        # If we get here, language doesn't exist, so add it
-        custom_languages.append(language_entry)
         self.user_settings.update_settings({'custom_languages': custom_languages})
+        self._custom_display_cache = None
+        self._custom_index_cache = None
+        self._invalidate_language_cache()
+    
+    def _get_custom_language_index(self):
+        """Map standardized names to their position in the custom_languages setting"""
+        if self._custom_index_cache is None:
+            languages = self.user_settings.get_setting('custom_languages', [])
+            
+            index = {}
+            for i, lang in enumerate(languages):
+                # Plain strings are the old format and act as their own standardized name
+                std_name = lang.get("standardized_name") if isinstance(lang, dict) else lang
+                index.setdefault(std_name, i)
+            self._custom_index_cache = index
+        
+        return self._custom_index_cache
     
     def load_custom_languages(self):
-        """Load custom languages from user settings"""
-        languages = self.user_settings.get_setting('custom_languages', [])
+        """Load custom languages from user settings as a cached tuple of display names"""
+        if self._custom_display_cache is None:
+            languages = self.user_settings.get_setting('custom_languages', [])
+            
+            # Use the display name for dict entries; plain strings are the old format
+            self._custom_display_cache = tuple(
+                lang.get("display_name", "") if isinstance(lang, dict) else lang
+                for lang in languages
+            )
         
-        # Ensure we return a list of strings for compatibility
-        result = []
-        for lang in languages:
-            if isinstance(lang, dict):
-                # Add the display name for UI
-                result.append(lang.get("display_name", ""))
-            else:
-                # For backward compatibility with old string-based format
-                result.append(lang)
-                
-        return result
+        return self._custom_display_cache
         
     def get_standardized_language_name(self, display_name):
         """Get standardized name for a language display name"""
@@ -1630,17 +1837,25 @@ class DictionaryApp:
         # Get standardized name for this language (if it exists)
         standardized_name = self.get_standardized_language_name(language)
         
+        changed = False
+        
         # Store both display name and standardized name to ensure proper removal
         if language not in removed_languages:
             removed_languages.append(language)
-            self.user_settings.update_settings({'removed_languages': removed_languages})
-            print(f"Added '{language}' to removed languages list.")
+            changed = True
+            log.debug("Added '%s' to removed languages list.", language)
         
         # Also add standardized version if different and not already in list
         if standardized_name != language and standardized_name not in removed_languages:
             removed_languages.append(standardized_name)
+            changed = True
+            log.debug("Added standardized name '%s' to removed languages list.", standardized_name)
+        
+        # Write settings once for both additions
+        if changed:
             self.user_settings.update_settings({'removed_languages': removed_languages})
-            print(f"Added standardized name '{standardized_name}' to removed languages list.")
+            self._removed_cache = None
+            self._lang_sorted_available = None
     
     def remove_from_removed_languages(self, language):
         """Remove a language from the removed languages list"""
@@ -1649,31 +1864,31 @@ class DictionaryApp:
         # Get standardized name for this language (if it exists)
         standardized_name = self.get_standardized_language_name(language)
         
-        removed = False
-        
-        # Remove display name if present
-        if language in removed_languages:
-            removed_languages.remove(language)
-            removed = True
-            print(f"Removed '{language}' from removed languages list.")
-        
-        # Also remove standardized version if present
-        if standardized_name != language and standardized_name in removed_languages:
-            removed_languages.remove(standardized_name)
-            removed = True
-            print(f"Removed standardized name '{standardized_name}' from removed languages list.")
+        # Drop display name and standardized name in a single pass
+        current = set(removed_languages)
+        remaining = current - {language, standardized_name}
         
         # Update settings if anything was removed
-        if removed:
-            self.user_settings.update_settings({'removed_languages': removed_languages})
+        if remaining != current:
+            self.user_settings.update_settings({'removed_languages': sorted(remaining)})
+            self._removed_cache = None
+            self._lang_sorted_available = None
+            log.debug("Removed '%s' from removed languages list.", language)
             return True
         else:
-            print(f"Warning: '{language}' not found in removed languages list.")
+            log.warning("'%s' not found in removed languages list.", language)
             return False
     
     def load_removed_languages(self):
-        """Load removed languages from user settings"""
-        return self.user_settings.get_setting('removed_languages', [])
+        """
+        Load removed languages from user settings
+        
+        The list is cached until the removed languages change, so callers
+        must copy it before modifying it.
+        """
+        if self._removed_cache is None:
+            self._removed_cache = list(self.user_settings.get_setting('removed_languages', []))
+        return self._removed_cache
     
     def show_admin_buttons(self, event=None):
         """Show admin buttons when ALT key is pressed"""
@@ -1696,8 +1911,15 @@ class DictionaryApp:
         top_bar.pack(fill=tk.X, padx=5, pady=(3, 0))
         
         self.char_count_var = tk.StringVar(value="0/150")
-        ttk.Label(top_bar, text="Enter/paste a sentence (max 150 chars):").pack(side=tk.LEFT)
-        ttk.Label(top_bar, textvariable=self.char_count_var).pack(side=tk.RIGHT)
+        self._last_char_count = 0
+        # Text index of the first character past the 150 character limit
+        self._limit_index = "1.0 + 150 chars"
+        sentence_hint_label = ttk.Label(top_bar, text="Enter/paste a sentence (max 150 chars):")
+        sentence_hint_label.pack(side=tk.LEFT)
+        char_count_label = ttk.Label(top_bar, textvariable=self.char_count_var)
+        char_count_label.pack(side=tk.RIGHT)
+        self._register_scaled(sentence_hint_label, 8)
+        self._register_scaled(char_count_label, 8)
         
         # Middle section with text entry and scrollbar
         text_frame = tk.Frame(self.sentence_frame)
@@ -1710,13 +1932,16 @@ class DictionaryApp:
         
         self.sentence_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._register_scaled(self.sentence_text, 10)
         
         # Bottom bar with buttons
         button_bar = tk.Frame(self.sentence_frame)
         button_bar.pack(fill=tk.X, padx=5, pady=(0, 5))
         
         # Instruction label
-        ttk.Label(button_bar, text="Double-click or select text to lookup:", font=("Arial", 8)).pack(side=tk.LEFT)
+        lookup_hint_label = ttk.Label(button_bar, text="Double-click or select text to lookup:", font=("Arial", 8))
+        lookup_hint_label.pack(side=tk.LEFT)
+        self._register_scaled(lookup_hint_label, 8)
         
         # Clear button on the right
         self.clear_btn = ttk.Button(button_bar, text="Clear", width=8, command=self.clear_sentence_context)
@@ -1743,18 +1968,20 @@ class DictionaryApp:
         text = self.sentence_text.get("1.0", "end-1c")
         count = len(text)
         
-        # Update the count display
-        self.char_count_var.set(f"{count}/150")
-        
         # Limit to 150 characters
         if count > 150:
             # Delete the excess characters
-            self.sentence_text.delete("1.0 + 150 chars", "end-1c")
-            # Update the count again
-            self.char_count_var.set("150/150")
+            self.sentence_text.delete(self._limit_index, "end-1c")
+            text = text[:150]
+            count = 150
+        
+        # Update the count display only when it changed
+        if count != self._last_char_count:
+            self.char_count_var.set(f"{count}/150")
+            self._last_char_count = count
             
         # Store current context
-        self.current_sentence_context = self.sentence_text.get("1.0", "end-1c").strip()
+        self.current_sentence_context = text.strip() or None
         
     def clear_sentence_context(self):
         """Clear the sentence context field"""
@@ -1779,13 +2006,11 @@ class DictionaryApp:
             # Find word boundaries
             left = right = char
             
-            # Find the start of the word
-            while left > 0 and line_content[left-1].isalnum() or line_content[left-1] in "-_'":
-                left -= 1
-                
-            # Find the end of the word
-            while right < len(line_content) and (line_content[right].isalnum() or line_content[right] in "-_'"):
-                right += 1
+            # Find the word covering the clicked position
+            for match in _WORD_RE.finditer(line_content):
+                if match.start() <= char <= match.end():
+                    left, right = match.span()
+                    break
                 
             # Select the word
             self.sentence_text.tag_remove(tk.SEL, "1.0", tk.END)
@@ -1880,12 +2105,15 @@ class DictionaryApp:
         
         # Get initial clipboard content
         try:
+            if _clipboard_sequence:
+                self.last_clipboard_sequence = _clipboard_sequence()
             self.last_clipboard_content = pyperclip.paste()
             # Reduce debug output
             # print(f"Initial clipboard content: '{self.last_clipboard_content}'")
         except Exception as e:
             print(f"Error accessing clipboard: {e}")
             self.last_clipboard_content = ""
+        self.last_clipboard_key = (len(self.last_clipboard_content), hash(self.last_clipboard_content))
         
         # Add info to the status area
         self.show_status_message(f"Clipboard monitoring enabled. Checking every {self.clipboard_check_interval/1000} seconds.")
@@ -1904,25 +2132,32 @@ class DictionaryApp:
             return
             
         try:
-            # Get current clipboard content
-            clipboard_content = pyperclip.paste()
-            
-            # Remove excessive debug printing
-            # Only log when content actually changes
-            
-            # If content has changed and isn't empty
-            if clipboard_content != self.last_clipboard_content and clipboard_content.strip():
-                print(f"New clipboard content detected: '{clipboard_content}'")
-                self.last_clipboard_content = clipboard_content
+            # Skip reading the clipboard if the OS change counter hasn't moved
+            sequence = _clipboard_sequence() if _clipboard_sequence else None
+            if sequence is None or sequence != self.last_clipboard_sequence:
+                self.last_clipboard_sequence = sequence
                 
-                # Update the entry box with new content
-                self.update_entry_from_clipboard(clipboard_content)
+                # Get current clipboard content
+                clipboard_content = pyperclip.paste()
                 
-                # Give visual feedback that clipboard content was detected
-                self.new_word_entry.focus_set()
-                self.new_word_entry.selection_range(0, 'end')
+                # Compare length and hash rather than the full strings
+                clipboard_key = (len(clipboard_content), hash(clipboard_content))
+                
+                # If content has changed and isn't empty
+                if clipboard_key != self.last_clipboard_key and clipboard_content.strip():
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("New clipboard content detected: '%s'", clipboard_content)
+                    self.last_clipboard_key = clipboard_key
+                    self.last_clipboard_content = clipboard_content
+                    
+                    # Update the entry box with new content
+                    self.update_entry_from_clipboard(clipboard_content)
+                    
+                    # Give visual feedback that clipboard content was detected
+                    self.new_word_entry.focus_set()
+                    self.new_word_entry.selection_range(0, 'end')
         except Exception as e:
-            print(f"Error checking clipboard: {e}")
+            log.warning("Error checking clipboard: %s", e)
             # Try to continue anyway
             pass
         
@@ -2030,8 +2265,6 @@ class DictionaryApp:
         self.show_status_message(f"Queued: Regenerating '{headword}'...")
         
         # Add random seed to ensure variation
-        import random
-        random.seed(time.time())
         variation_seed = random.randint(1, 10000)
         
         # Prepare parameters for async request
@@ -2067,7 +2300,7 @@ class DictionaryApp:
             
     def _process_regenerated_entry(self, new_entry, headword):
         """Process regenerated entry on main thread"""
-        print(f"SEARCH: Processing regenerated entry for '{headword}'")
+        log.debug("SEARCH: Processing regenerated entry for '%s'", headword)
         
         # Update current entry
         self.current_entry = new_entry
@@ -2075,19 +2308,22 @@ class DictionaryApp:
         # Show status in the status bar
         self.show_status_message(f"Regenerated entry for '{headword}'")
         
-        # Reload data FIRST to ensure the entry is in the list
+        # Update the listed entry in place; only reload everything if it isn't listed
         try:
-            self.reload_data()
-            print(f"SEARCH: Data reloaded for regenerated '{headword}'")
+            if self._update_headword_in_list(headword, new_entry):
+                log.debug("SEARCH: Updated regenerated '%s' in headword list", headword)
+            else:
+                self.reload_data()
+                log.debug("SEARCH: Data reloaded for regenerated '%s'", headword)
         except Exception as e:
-            print(f"SEARCH: Error reloading data: {e}")
+            log.warning("SEARCH: Error reloading data: %s", e)
         
         # Force select the entry in the list BEFORE displaying content
         try:
             self.select_and_show_headword(headword.lower())
-            print(f"SEARCH: Selected regenerated '{headword}' in headword list")
+            log.debug("SEARCH: Selected regenerated '%s' in headword list", headword)
         except Exception as e:
-            print(f"SEARCH: Error selecting in list: {e}")
+            log.warning("SEARCH: Error selecting in list: %s", e)
         
         # Clear and enable the display
         self.entry_display.config(state=tk.NORMAL)
@@ -2095,7 +2331,7 @@ class DictionaryApp:
         
         # Display the entry as the LAST operation
         self.display_entry(new_entry)
-        print(f"SEARCH: Displayed regenerated entry for '{headword}'")
+        log.debug("SEARCH: Displayed regenerated entry for '%s'", headword)
         
         # Make sure the display gets focus
         self.entry_display.focus_set()
@@ -2103,6 +2339,28 @@ class DictionaryApp:
         # Update and ensure the UI refreshes
         self.root.update_idletasks()
     
+    def _update_headword_in_list(self, headword, entry):
+        """
+        Replace a single entry in the filtered data after it was regenerated
+        
+        The headword itself is unchanged, so the listbox rows stay as they are.
+        
+        Returns:
+            True if the entry was found in the current list, False otherwise
+        """
+        metadata = entry.get("metadata", {})
+        language_keys = ("source_language", "target_language", "definition_language")
+        
+        for i, listed in enumerate(self.filtered_data):
+            if listed["headword"].lower() != headword.lower():
+                continue
+            listed_metadata = listed.get("metadata", {})
+            if all(listed_metadata.get(key) == metadata.get(key) for key in language_keys):
+                self.filtered_data[i] = entry
+                return True
+        
+        return False
+    
     def _on_regenerate_error(self, error, headword):
         """Handle entry regeneration error"""
         self.root.after(0, lambda: self.show_status_message(
@@ -2154,112 +2412,84 @@ class DictionaryApp:
         # Show status message
         self.show_status_message(f"Text scaling set to {text_scale:.2f}x")
         
+    def _font(self, size, weight="normal", slant="roman"):
+        """Get a shared Arial Font object for the given size and style"""
+        key = (size, weight, slant)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = tkfont.Font(root=self.root, family="Arial", size=size, weight=weight, slant=slant)
+            self._font_cache[key] = font
+        return font
+    
+    def _register_scaled(self, widget, base_size, weight="normal"):
+        """Register a widget whose font should follow the text scale factor"""
+        self._scale_registry.setdefault((base_size, weight), []).append(widget)
+    
     def apply_text_scaling(self, scale_factor):
-        """Apply text scaling to all UI elements"""
-        # Update font sizes based on the scale factor
-        self.update_tag_fonts(scale_factor)
-        
-        # Update entry display font
-        base_entry_size = 12
-        new_entry_size = int(base_entry_size * scale_factor)
-        self.entry_display.config(font=("Arial", new_entry_size))
-        
-        # Update search elements
-        self.new_word_entry.config(font=("Arial", int(12 * scale_factor)))
-        self.hint_label.config(font=("Arial", int(8 * scale_factor)))
+        """Apply text scaling to all UI elements once scale changes settle"""
+        # Only the last of several quick scale changes triggers the reconfigure
+        if self._scale_after_id:
+            self.root.after_cancel(self._scale_after_id)
+        self._scale_after_id = self.root.after(120, lambda: self._apply_text_scaling_now(scale_factor))
+    
+    def _apply_text_scaling_now(self, scale_factor):
+        """Apply text scaling to all UI elements immediately"""
+        self._scale_after_id = None
         
-        # Update toolbar title
-        self.title_label.config(font=("Arial", int(14 * scale_factor), "bold"))
+        # Fonts for a previous scale are no longer needed
+        if scale_factor != self._font_scale:
+            self._font_cache.clear()
+            self._font_scale = scale_factor
         
-        # Update headword list
-        self.headword_list.config(font=("Arial", int(10 * scale_factor)))
+        # Scaled size for each base font size used in the UI
+        sizes = {base: int(base * scale_factor) for base in (8, 10, 12, 14, 16)}
         
-        # Update recent lookups list
-        self.recent_lookups_list.config(font=("Arial", int(10 * scale_factor)))
+        # Update font sizes based on the scale factor
+        self.update_tag_fonts(sizes)
         
-        # Update search entry
-        self.search_entry.config(font=("Arial", int(10 * scale_factor)))
+        # Update every widget registered for scaling
+        for (base_size, weight), widgets in self._scale_registry.items():
+            font = self._font(sizes[base_size], weight=weight)
+            for widget in widgets:
+                widget.configure(font=font)
         
-        # Update language filter labels and dropdowns
-        for child in self.language_filter_frame.winfo_children():
-            if isinstance(child, tk.Label):
-                child.config(font=("Arial", int(10 * scale_factor)))
+        # Both lists share one Font, so resizing it updates them together
+        self._list_font.configure(size=sizes[10])
         
         # Update target and definition language dropdowns
-        style = ttk.Style()
-        style.configure("TCombobox", font=("Arial", int(10 * scale_factor)))
-        
-        # Update sentence context panel
-        if hasattr(self, 'sentence_text'):
-            self.sentence_text.config(font=("Arial", int(10 * scale_factor)))
-            
-            # Update char count and instructions label
-            for child in self.sentence_frame.winfo_children():
-                if isinstance(child, tk.Frame):
-                    for subchild in child.winfo_children():
-                        if isinstance(subchild, ttk.Label):
-                            subchild.config(font=("Arial", int(8 * scale_factor)))
-                            
-        # Update search bar title and label
-        for child in self.bottom_panel.winfo_children():
-            if isinstance(child, tk.Frame):  # This should be the search_frame
-                for subchild in child.winfo_children():
-                    if isinstance(subchild, tk.Label) and "Add New Word" in subchild["text"]:
-                        subchild.config(font=("Arial", int(12 * scale_factor), "bold"))
-                    elif isinstance(subchild, tk.Frame):  # input_frame or hint_frame
-                        for sub_subchild in subchild.winfo_children():
-                            if isinstance(sub_subchild, tk.Label) and "Enter word" in sub_subchild["text"]:
-                                sub_subchild.config(font=("Arial", int(10 * scale_factor)))
-        
-        # Update example text in entries with the newly scaled fonts
-        if self.current_entry:
-            self.display_entry(self.current_entry)
+        self._style.configure("TCombobox", font=self._font(sizes[10]))
         
-    def update_tag_fonts(self, scale_factor):
-        """Update all tag fonts with the new scale factor"""
-        # Calculate new font sizes
-        size_10 = int(10 * scale_factor)
-        size_12 = int(12 * scale_factor)
-        size_16 = int(16 * scale_factor)
-        
-        # Update tag configurations
-        self.entry_display.tag_config("language_header", font=("Arial", size_10), foreground="gray")
-        self.entry_display.tag_config("context_header", font=("Arial", size_10, "bold"), foreground="#008800")
-        self.entry_display.tag_config("headword", font=("Arial", size_16, "bold"))
-        self.entry_display.tag_config("pos", font=("Arial", size_12, "italic"))
-        self.entry_display.tag_config("definition", font=("Arial", size_12, "bold"))
-        self.entry_display.tag_config("definition_content", font=("Arial", size_12, "bold"))
-        self.entry_display.tag_config("grammar", font=("Arial", size_10), foreground="gray")
-        self.entry_display.tag_config("example_label", font=("Arial", size_10, "italic"))
-        self.entry_display.tag_config("context_example_label", font=("Arial", size_10, "italic"), foreground="#008800")
-        self.entry_display.tag_config("example", font=("Arial", size_12))
-        self.entry_display.tag_config("context_example", font=("Arial", size_12), background="#f0fff0")
-        self.entry_display.tag_config("translation", font=("Arial", size_10, "italic"), foreground="blue")
-        self.entry_display.tag_config("status", font=("Arial", size_12), foreground="green")
-        self.entry_display.tag_config("multiword_headword", font=("Arial", size_16, "bold"), foreground="navy")
+    def update_tag_fonts(self, sizes):
+        """Resize the named tag fonts with the scaled sizes from _apply_text_scaling_now"""
+        # Every tag already refers to one of these fonts, so no tag_config is needed
+        for name, font in self._tag_fonts.items():
+            font.configure(size=sizes[_TAG_FONT_SPECS[name][0]])
         
     def update_recent_lookups_list(self):
         """Update the recent lookups listbox with the most recent lookups"""
-        # Clear the current content
-        self.recent_lookups_list.delete(0, tk.END)
-        
         # Get recent lookups from user settings
         recent_lookups = self.user_settings.get_recent_lookups()
         
-        if not recent_lookups:
-            self.recent_lookups_list.insert(tk.END, "No recent lookups")
+        # Display only the headword without language information
+        if recent_lookups:
+            headwords = [lookup.get('headword', '') for lookup in recent_lookups]
+        else:
+            headwords = ["No recent lookups"]
+        
+        # Find the first row that differs from what is already shown
+        displayed = self._recent_displayed
+        first_changed = 0
+        while (first_changed < len(displayed) and first_changed < len(headwords)
+               and displayed[first_changed] == headwords[first_changed]):
+            first_changed += 1
+        
+        if first_changed == len(displayed) == len(headwords):
             return
-            
-        # Add each recent lookup to the listbox
-        for lookup in recent_lookups:
-            headword = lookup.get('headword', '')
-            
-            # Display only the headword without language information
-            self.recent_lookups_list.insert(tk.END, headword)
-            
-        # Apply same font as main headword list
-        font = self.headword_list.cget("font")
-        self.recent_lookups_list.config(font=font)
+        
+        # Replace only the changed rows, inserting them in a single call
+        self.recent_lookups_list.delete(first_changed, tk.END)
+        self.recent_lookups_list.insert(tk.END, *headwords[first_changed:])
+        self._recent_displayed = headwords
             
     def add_to_recent_lookups(self, entry):
         """Add an entry to the recent lookups list"""
@@ -2292,11 +2522,20 @@ class DictionaryApp:
         pending_count = self.request_manager.get_pending_count()
         active_count = self.request_manager.get_active_count()
         
+        # Nothing to redraw if the counts haven't changed
+        state = (pending_count, active_count)
+        if state == self._last_queue_state:
+            return
+        self._last_queue_state = state
+        
         # Update status label
         if pending_count == 0 and active_count == 0:
             self.queue_status_label.config(text="API Queue: Idle", fg="#555555")
             self.queue_active_label.config(text="")
-            self.queue_progress.pack_forget()
+            if self._progress_running:
+                self.queue_progress.pack_forget()
+                self.queue_progress.stop()
+                self._progress_running = False
             self.cancel_queue_btn.pack_forget()
         else:
             total = pending_count + active_count
@@ -2308,15 +2547,18 @@ class DictionaryApp:
                 text=f"Active: {active_count} | Pending: {pending_count}"
             )
             
-            # Show progress bar if operations are in progress
+            # Show progress bar if operations are in progress, starting and
+            # stopping the animation only when that changes
             if active_count > 0:
-                if not self.queue_progress.winfo_ismapped():
+                if not self._progress_running:
                     self.queue_progress.pack(side=tk.LEFT, padx=5)
                     # Start the indeterminate progress animation
-                    self.queue_progress.start(15)  # Speed in ms
-            else:
+                    self.queue_progress.start(50)  # Speed in ms
+                    self._progress_running = True
+            elif self._progress_running:
                 self.queue_progress.pack_forget()
                 self.queue_progress.stop()
+                self._progress_running = False
             
             # Show cancel button if there are operations
             if not self.cancel_queue_btn.winfo_ismapped():
@@ -2327,8 +2569,12 @@ class DictionaryApp:
         # Update the UI with current queue status
         self._update_queue_status_ui()
         
-        # Schedule the next update
-        self.root.after(self.queue_update_interval, self.periodic_ui_update)
+        # Schedule the next update, polling less often while the queue is idle
+        if self._last_queue_state == (0, 0):
+            interval = self.queue_idle_interval
+        else:
+            interval = self.queue_update_interval
+        self.root.after(interval, self.periodic_ui_update)
     
     def cancel_all_requests(self):
         """Cancel all pending API requests"""
@@ -2415,27 +2661,52 @@ class DictionaryApp:
         except (IndexError, KeyError) as e:
             self.show_status_message(f"Error selecting example: {str(e)}")
             
+    def _get_mapper(self, note_type):
+        """Get the field mapper for a note type, rebuilt only when settings have been saved"""
+        key = (note_type, self.user_settings.version)
+        mapper = self._mapper_cache.get(key)
+        if mapper is None:
+            note_config = self.user_settings.get_settings().get('note_types', {}).get(note_type, {})
+            field_mappings = note_config.get('field_mappings', {})
+            empty_handling = note_config.get('empty_field_handling', {})
+            
+            mapper = AnkiFieldMapper(field_mappings, empty_handling)
+            # Mappers for older settings versions can never be hit again
+            for stale in [k for k in self._mapper_cache if k[1] != key[1]]:
+                del self._mapper_cache[stale]
+            self._mapper_cache[key] = mapper
+        return mapper
+    
     def direct_export_to_anki(self, focused_entry):
         """Export entry directly to Anki without confirmation"""
         settings = self.user_settings.get_settings()
         note_type = settings.get('default_note_type', 'Example-Based')
-        note_config = settings.get('note_types', {}).get(note_type, {})
-        
-        field_mappings = note_config.get('field_mappings', {})
-        empty_handling = note_config.get('empty_field_handling', {})
-        
-        mapper = AnkiFieldMapper(field_mappings, empty_handling)
+        mapper = self._get_mapper(note_type)
+        headword = focused_entry['headword']
         
         try:
             exporter = AnkiExporter(self.anki_connector, mapper, settings)
-            note_id = exporter.export_entry(focused_entry, note_type)
-            
-            if note_id:
-                self.show_status_message(f"Successfully exported '{focused_entry['headword']}' to Anki!")
-            else:
-                self.show_status_message("Export failed: No note ID returned")
         except Exception as e:
             self.show_status_message(f"Export failed: {str(e)}")
+            return
+        
+        self.show_status_message(f"Exporting '{headword}' to Anki...")
+        
+        # Run the AnkiConnect call on the request manager so the UI stays responsive
+        self.request_manager.add_request(
+            'anki_export',
+            {'exporter': exporter, 'entry': focused_entry, 'note_type': note_type},
+            success_callback=lambda note_id: self.root.after(0, lambda: self._on_direct_export_done(note_id, headword)),
+            error_callback=lambda error: self.root.after(0, lambda: self.show_status_message(f"Export failed: {error}")),
+            max_retries=0
+        )
+    
+    def _on_direct_export_done(self, note_id, headword):
+        """Report the result of a direct Anki export (called on main thread)"""
+        if note_id:
+            self.show_status_message(f"Successfully exported '{headword}' to Anki!")
+        else:
+            self.show_status_message("Export failed: No note ID returned")
             
     def delete_previous_word(self, event):
         """Handle Ctrl+Backspace to delete the previous word in an entry widget"""
@@ -2454,35 +2725,38 @@ class DictionaryApp:
         text_before_cursor = full_text[:cursor_pos]
         
         # Find the start of the previous word
-        word_start = cursor_pos
-        
-        # Skip any spaces directly to the left of the cursor
-        for i in range(cursor_pos - 1, -1, -1):
-            if text_before_cursor[i].isspace():
-                word_start = i
-            else:
-                break
-                
-        # Now find the actual beginning of the word
-        for i in range(word_start - 1, -1, -1):
-            if text_before_cursor[i].isspace():
-                word_start = i + 1
-                break
-            if i == 0:
-                word_start = 0
-                break
+        word_start = _previous_word_start(text_before_cursor)
         
         # Delete from the start of the word to cursor position
         entry_widget.delete(word_start, cursor_pos)
         
         return "break"  # Prevents default Backspace behavior
         
-    def add_standard_text_bindings(self, widget):
+    def bind_standard_text_shortcuts(self):
         """
-        Add standard text editing keyboard shortcuts to an Entry or Text widget
+        Bind standard text editing keyboard shortcuts once for every Entry and Text widget
         This makes text editing behavior more consistent with standard editors
+        """
+        for widget_class in ("TEntry", "Text"):
+            select_all = _select_all_entry if widget_class == "TEntry" else _select_all_text
+            delete_word = self.delete_previous_word if widget_class == "TEntry" else self.delete_previous_word_text
+            
+            for key in ("a", "A"):
+                self.root.bind_class(widget_class, f"<Control-{key}>", select_all)
+            for key in ("c", "C"):
+                self.root.bind_class(widget_class, f"<Control-{key}>", _copy_selection)
+            for key in ("x", "X"):
+                self.root.bind_class(widget_class, f"<Control-{key}>", _cut_selection)
+            for key in ("v", "V"):
+                self.root.bind_class(widget_class, f"<Control-{key}>", _paste_text)
+            self.root.bind_class(widget_class, "<Control-BackSpace>", delete_word)
+    
+    def add_standard_text_bindings(self, widget):
+        """
+        Enhance text widgets to ensure they properly handle long text with wrapping
         
-        Also enhances text widgets to ensure they properly handle long text with wrapping
+        Keyboard shortcuts are bound for all Entry and Text widgets by
+        bind_standard_text_shortcuts.
         """
         # For Text widgets, ensure they're configured for optimal text display
         if isinstance(widget, tk.Text):
@@ -2494,120 +2768,6 @@ class DictionaryApp:
             
             # Ensure proper spacing
             widget.config(padx=10, pady=10)
-        # Select all text (Ctrl+A)
-        if isinstance(widget, tk.Entry):
-            def select_all_entry(event):
-                event.widget.select_range(0, tk.END)
-                event.widget.icursor(tk.END)  # Set cursor position to the end
-                return "break"
-            widget.bind("<Control-a>", select_all_entry)
-            widget.bind("<Control-A>", select_all_entry)
-            
-        elif isinstance(widget, tk.Text):
-            def select_all_text(event):
-                event.widget.tag_add(tk.SEL, "1.0", tk.END)
-                event.widget.mark_set(tk.INSERT, tk.END)
-                return "break"
-            widget.bind("<Control-a>", select_all_text)
-            widget.bind("<Control-A>", select_all_text)
-        
-        # Copy selected text (Ctrl+C)
-        def copy_selection(event):
-            try:
-                if isinstance(event.widget, tk.Entry):
-                    if event.widget.selection_present():
-                        selected_text = event.widget.selection_get()
-                        event.widget.clipboard_clear()
-                        event.widget.clipboard_append(selected_text)
-                elif isinstance(event.widget, tk.Text):
-                    if event.widget.tag_ranges(tk.SEL):
-                        selected_text = event.widget.get(tk.SEL_FIRST, tk.SEL_LAST)
-                        event.widget.clipboard_clear()
-                        event.widget.clipboard_append(selected_text)
-            except Exception as e:
-                print(f"Error copying text: {e}")
-            return "break"
-        
-        widget.bind("<Control-c>", copy_selection)
-        widget.bind("<Control-C>", copy_selection)
-        
-        # Delete previous word (Ctrl+Backspace)
-        if isinstance(widget, tk.Entry):
-            widget.bind("<Control-BackSpace>", self.delete_previous_word)
-        elif isinstance(widget, tk.Text):
-            widget.bind("<Control-BackSpace>", self.delete_previous_word_text)
-        
-        # Cut selected text (Ctrl+X)
-        def cut_selection(event):
-            try:
-                if isinstance(event.widget, tk.Entry):
-                    if event.widget.selection_present():
-                        selected_text = event.widget.selection_get()
-                        event.widget.clipboard_clear()
-                        event.widget.clipboard_append(selected_text)
-                        event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
-                elif isinstance(event.widget, tk.Text):
-                    if event.widget.tag_ranges(tk.SEL):
-                        selected_text = event.widget.get(tk.SEL_FIRST, tk.SEL_LAST)
-                        event.widget.clipboard_clear()
-                        event.widget.clipboard_append(selected_text)
-                        # Make sure text is editable before trying to cut
-                        state = event.widget.cget("state")
-                        if state == tk.DISABLED:
-                            event.widget.config(state=tk.NORMAL)
-                            event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
-                            event.widget.config(state=tk.DISABLED)
-                        else:
-                            event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
-            except Exception as e:
-                print(f"Error cutting text: {e}")
-            return "break"
-            
-        # Only bind cut to editable widgets
-        if isinstance(widget, tk.Entry) or (isinstance(widget, tk.Text) and widget.cget("state") != tk.DISABLED):
-            widget.bind("<Control-x>", cut_selection)
-            widget.bind("<Control-X>", cut_selection)
-        
-        # Paste text (Ctrl+V)
-        def paste_text(event):
-            try:
-                clipboard_text = event.widget.clipboard_get()
-                if not clipboard_text:
-                    return "break"
-                    
-                if isinstance(event.widget, tk.Entry):
-                    if event.widget.selection_present():
-                        event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
-                    event.widget.insert(tk.INSERT, clipboard_text)
-                elif isinstance(event.widget, tk.Text):
-                    if event.widget.tag_ranges(tk.SEL):
-                        # Make sure text is editable before trying to paste
-                        state = event.widget.cget("state")
-                        if state == tk.DISABLED:
-                            event.widget.config(state=tk.NORMAL)
-                            event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
-                            event.widget.insert(tk.INSERT, clipboard_text)
-                            event.widget.config(state=tk.DISABLED)
-                        else:
-                            event.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
-                            event.widget.insert(tk.INSERT, clipboard_text)
-                    else:
-                        # Make sure text is editable before trying to paste
-                        state = event.widget.cget("state")
-                        if state == tk.DISABLED:
-                            event.widget.config(state=tk.NORMAL)
-                            event.widget.insert(tk.INSERT, clipboard_text)
-                            event.widget.config(state=tk.DISABLED)
-                        else:
-                            event.widget.insert(tk.INSERT, clipboard_text)
-            except Exception as e:
-                print(f"Error pasting text: {e}")
-            return "break"
-            
-        # Only bind paste to editable widgets
-        if isinstance(widget, tk.Entry) or (isinstance(widget, tk.Text) and widget.cget("state") != tk.DISABLED):
-            widget.bind("<Control-v>", paste_text)
-            widget.bind("<Control-V>", paste_text)
             
     def delete_previous_word_text(self, event):
         """Handle Ctrl+Backspace to delete the previous word in a Text widget"""
@@ -2634,30 +2794,12 @@ class DictionaryApp:
             if line > 1:
                 prev_line = line - 1
                 prev_line_end = text_widget.index(f"{prev_line}.end")
-                # Extract end column of previous line
-                _, prev_col = map(int, prev_line_end.split('.'))
                 
                 # Get the text from previous line
                 prev_line_text = text_widget.get(f"{prev_line}.0", prev_line_end)
                 
                 # Find the start of the last word in the previous line
-                word_start = prev_col
-                
-                # Skip any spaces at the end
-                for i in range(prev_col - 1, -1, -1):
-                    if prev_line_text[i].isspace():
-                        word_start = i
-                    else:
-                        break
-                
-                # Now find the beginning of the word
-                for i in range(word_start - 1, -1, -1):
-                    if prev_line_text[i].isspace():
-                        word_start = i + 1
-                        break
-                    if i == 0:
-                        word_start = 0
-                        break
+                word_start = _previous_word_start(prev_line_text)
                 
                 # Delete from word start to the current cursor position
                 text_widget.delete(f"{prev_line}.{word_start}", cursor_pos)
@@ -2667,23 +2809,7 @@ class DictionaryApp:
             text_before_cursor = text_widget.get(f"{line}.0", cursor_pos)
             
             # Find the start of the previous word
-            word_start = col
-            
-            # Skip any spaces directly to the left of the cursor
-            for i in range(col - 1, -1, -1):
-                if text_before_cursor[i].isspace():
-                    word_start = i
-                else:
-                    break
-                
-            # Now find the actual beginning of the word
-            for i in range(word_start - 1, -1, -1):
-                if text_before_cursor[i].isspace():
-                    word_start = i + 1
-                    break
-                if i == 0:
-                    word_start = 0
-                    break
+            word_start = _previous_word_start(text_before_cursor)
             
             # Delete from word start to the current cursor position
             text_widget.delete(f"{line}.{word_start}", cursor_pos)
@@ -2706,23 +2832,21 @@ class DictionaryApp:
         note_type = settings.get('default_note_type', 'Example-Based')
         note_config = settings.get('note_types', {}).get(note_type, {})
         
-        field_mappings = note_config.get('field_mappings', {})
-        empty_handling = note_config.get('empty_field_handling', {})
-        
-        mapper = AnkiFieldMapper(field_mappings, empty_handling)
+        mapper = self._get_mapper(note_type)
         fields = mapper.map_entry_to_fields(focused_entry)
         
         # Display preview
         preview_text = scrolledtext.ScrolledText(preview_frame, height=10)
         preview_text.pack(fill=tk.BOTH, expand=True)
         
-        preview_text.insert(tk.END, f"Note Type: {note_type}\n\n")
-        preview_text.insert(tk.END, f"Deck: {note_config.get('deck', settings.get('default_deck', 'Default'))}\n\n")
-        preview_text.insert(tk.END, "Fields:\n\n")
-        
-        for field_name, value in fields.items():
-            if value:
-                preview_text.insert(tk.END, f"{field_name}:\n{value}\n\n")
+        # Build the whole preview first so the Text widget is laid out only once
+        parts = [
+            f"Note Type: {note_type}\n\n",
+            f"Deck: {note_config.get('deck', settings.get('default_deck', 'Default'))}\n\n",
+            "Fields:\n\n",
+        ]
+        parts.extend(f"{field_name}:\n{value}\n\n" for field_name, value in fields.items() if value)
+        preview_text.insert(tk.END, "".join(parts))
         
         preview_text.config(state=tk.DISABLED)
         
@@ -2736,38 +2860,51 @@ class DictionaryApp:
         button_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Export button
+        def on_export_done(note_id):
+            if not dialog.winfo_exists():
+                return
+            
+            if note_id:
+                status_var.set("Successfully exported to Anki!")
+                export_btn.config(state=tk.NORMAL)
+                
+                # Change button color to green to indicate success
+                export_btn.config(style="Success.TButton")
+                
+                # Close dialog once the success status has briefly shown
+                dialog.after(300, dialog.destroy)
+            else:
+                status_var.set("Export failed: No note ID returned")
+                export_btn.config(state=tk.NORMAL)
+        
+        def on_export_error(error):
+            if not dialog.winfo_exists():
+                return
+            
+            status_var.set(f"Export failed: {error}")
+            export_btn.config(state=tk.NORMAL)
+            
+            # Change button color to red to indicate failure
+            export_btn.config(style="Danger.TButton")
+        
         def do_export():
             export_btn.config(state=tk.DISABLED)
             status_var.set("Exporting...")
-            dialog.update_idletasks()
             
             try:
                 exporter = AnkiExporter(self.anki_connector, mapper, settings)
-                note_id = exporter.export_entry(focused_entry, note_type)
-                
-                if note_id:
-                    status_var.set("Successfully exported to Anki!")
-                    export_btn.config(state=tk.NORMAL)
-                    
-                    # Change button color to green to indicate success
-                    export_btn.config(style="Success.TButton")
-                    
-                    # Close dialog after a delay
-                    dialog.after(1500, dialog.destroy)
-                else:
-                    status_var.set("Export failed: No note ID returned")
-                    export_btn.config(state=tk.NORMAL)
             except Exception as e:
-                status_var.set(f"Export failed: {str(e)}")
-                export_btn.config(state=tk.NORMAL)
-                
-                # Change button color to red to indicate failure
-                export_btn.config(style="Danger.TButton")
-        
-        # Create button styles
-        style = ttk.Style()
-        style.configure("Success.TButton", background="green", foreground="white")
-        style.configure("Danger.TButton", background="red", foreground="white")
+                on_export_error(str(e))
+                return
+            
+            # Run the AnkiConnect call off the UI thread and report back on it
+            self.request_manager.add_request(
+                'anki_export',
+                {'exporter': exporter, 'entry': focused_entry, 'note_type': note_type},
+                success_callback=lambda note_id: self.root.after(0, lambda: on_export_done(note_id)),
+                error_callback=lambda error: self.root.after(0, lambda: on_export_error(error)),
+                max_retries=0
+            )
         
         export_btn = ttk.Button(button_frame, text="Export", command=do_export)
         export_btn.pack(side=tk.RIGHT, padx=5)
@@ -2840,9 +2977,10 @@ if __name__ == "__main__":
     
     # Handle window close event to clean up resources
     def on_closing():
-        # Set maximum thread join timeout to 0.5 seconds to prevent closing lag
+        # Stop the request manager in the background so the window closes at once;
+        # its daemon threads end with the process if they are still running
         if hasattr(app, 'request_manager'):
-            app.request_manager.shutdown(timeout=0.5)
+            threading.Thread(target=app.request_manager.shutdown, kwargs={'timeout': 0.5}, daemon=True).start()
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -5,11 +5,213 @@ This module provides the main application controller, which coordinates
 the overall application flow, initialization, and shutdown.
 """
 
+import contextlib
+import functools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
 import tkinter as tk
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from tkinter import filedialog, messagebox, ttk
+from typing import Dict, Any, Optional, List, Callable, Iterable, Iterator, Tuple
+
+if sys.platform == 'win32':
+    import winreg
 
 from .base_controller import BaseController
 
+# orjson serializes and parses entries several times faster than json when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson parses import files incrementally instead of loading them whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Read buffer size for streaming import files
+_IMPORT_BUFFER_SIZE = 64 * 1024
+
+# Bytes read from the start of an import file for the quick structure check
+_IMPORT_HEADER_SIZE = 4 * 1024
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: The object to serialize
+        
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse a UTF-8 encoded JSON document.
+    
+    Args:
+        data: The JSON document as bytes
+        
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=1)
+def _detect_system_theme() -> str:
+    """
+    Detect whether the operating system uses a light or dark theme.
+    
+    The result is cached for the lifetime of the process, since detection
+    reads the registry on Windows and runs a subprocess on macOS.
+    Call _detect_system_theme.cache_clear() to detect again.
+    
+    Returns:
+        'light' or 'dark'
+    """
+    # On Windows, check registry
+    if platform.system() == 'Windows':
+        try:
+            registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
+            key = winreg.OpenKey(registry, r'Software\\Microsoft\\Windows\\CurrentVersion\\Themes\\Personalize')
+            # AppsUseLightTheme = 0 means dark theme
+            use_light_theme = winreg.QueryValueEx(key, 'AppsUseLightTheme')[0]
+            return 'light' if use_light_theme else 'dark'
+        except:
+            # If any error occurs, fall back to light theme
+            return 'light'
+            
+    # On macOS, check dark mode
+    elif platform.system() == 'Darwin':
+        try:
+            result = subprocess.run(
+                ['defaults', 'read', '-g', 'AppleInterfaceStyle'],
+                capture_output=True, text=True
+            )
+            # If 'Dark' is returned, use dark theme
+            return 'dark' if 'dark' in result.stdout.lower() else 'light'
+        except:
+            # If any error occurs, fall back to light theme
+            return 'light'
+            
+    # For all other platforms or if detection fails, use light theme
+    return 'light'
+
+# Color schemes for each theme
+# Each theme defines colors for various UI elements
+_COLOR_SCHEMES = {
+    'light': {
+        'bg': '#FFFFFF',  # Background
+        'fg': '#000000',  # Foreground text
+        'select_bg': '#CCE4F7',  # Selection background
+        'select_fg': '#000000',  # Selection text
+        'button': '#F0F0F0',  # Button background
+        'button_active': '#E0E0E0',  # Button when pressed
+        'entry_bg': '#FFFFFF',  # Entry field background
+        'entry_fg': '#000000',  # Entry field text
+        'highlight_bg': '#E8F0F8',  # Highlight background
+        'highlight_fg': '#000000',  # Highlight text
+        'listbox_bg': '#FFFFFF',  # Listbox background
+        'frame_bg': '#F5F5F5',  # Frame background
+        'scrollbar': '#C0C0C0',  # Scrollbar color
+        'heading_fg': '#000000',  # Heading text
+        'border': '#C0C0C0',  # Border color
+    },
+    'dark': {
+        'bg': '#2E2E2E',  # Background
+        'fg': '#E0E0E0',  # Foreground text
+        'select_bg': '#4A6984',  # Selection background
+        'select_fg': '#FFFFFF',  # Selection text
+        'button': '#3E3E3E',  # Button background
+        'button_active': '#505050',  # Button when pressed
+        'entry_bg': '#3E3E3E',  # Entry field background
+        'entry_fg': '#E0E0E0',  # Entry field text
+        'highlight_bg': '#404D5D',  # Highlight background
+        'highlight_fg': '#E0E0E0',  # Highlight text
+        'listbox_bg': '#2E2E2E',  # Listbox background
+        'frame_bg': '#2A2A2A',  # Frame background
+        'scrollbar': '#505050',  # Scrollbar color
+        'heading_fg': '#E0E0E0',  # Heading text
+        'border': '#505050',  # Border color
+    },
+}
+
+def _build_theme_settings(colors: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build ttk theme settings for a color scheme.
+    
+    Args:
+        colors: Color scheme from _COLOR_SCHEMES
+        
+    Returns:
+        Settings in the form accepted by ttk.Style.theme_create
+    """
+    return {
+        'TFrame': {'configure': {'background': colors['frame_bg']}},
+        'TLabel': {'configure': {'background': colors['bg'], 'foreground': colors['fg']}},
+        'TButton': {
+            'configure': {
+                'background': colors['button'],
+                'foreground': colors['fg'],
+                'bordercolor': colors['border']
+            },
+            'map': {'background': [('active', colors['button_active'])]}
+        },
+        'TEntry': {'configure': {
+            'fieldbackground': colors['entry_bg'],
+            'foreground': colors['entry_fg'],
+            'bordercolor': colors['border']
+        }},
+        'TCombobox': {'configure': {
+            'fieldbackground': colors['entry_bg'],
+            'foreground': colors['entry_fg'],
+            'selectbackground': colors['select_bg'],
+            'selectforeground': colors['select_fg']
+        }},
+        'TScrollbar': {'configure': {'background': colors['scrollbar'], 'troughcolor': colors['bg']}},
+        'TNotebook': {'configure': {'background': colors['bg']}},
+        'TNotebook.Tab': {
+            'configure': {
+                'background': colors['bg'],
+                'foreground': colors['fg'],
+                'padding': [5, 2]
+            },
+            'map': {
+                'background': [('selected', colors['highlight_bg'])],
+                'foreground': [('selected', colors['highlight_fg'])]
+            }
+        },
+    }
+
+# ttk theme settings for each theme, built once at import
+_THEME_SETTINGS = {name: _build_theme_settings(colors) for name, colors in _COLOR_SCHEMES.items()}
+
+def _register_themes(style: ttk.Style) -> None:
+    """
+    Register a ttk theme for each color scheme.
+    
+    The themes derive from the theme in use when they are registered, so
+    widgets keep the platform look and only the colors change.
+    
+    Args:
+        style: Style object of the root window
+    """
+    parent = style.theme_use()
+    for name, settings in _THEME_SETTINGS.items():
+        style.theme_create(f'deepdict_{name}', parent=parent, settings=settings)
+
 class AppController(BaseController):
     """
     Main application controller.
@@ -26,6 +228,12 @@ class AppController(BaseController):
         event_bus: Event system for controller-related notifications
     """
     
+    # File types offered by the export and import file dialogs
+    _JSON_FILETYPES = (
+        ("JSON files", "*.json"),
+        ("All files", "*.*")
+    )
+    
     def __init__(self, root, models=None, views=None, event_bus=None):
         """
         Initialize the application controller.
@@ -41,6 +249,34 @@ class AppController(BaseController):
         self.root = root
         self.controllers = {}
         
+        # Entries written by a running background export, None when idle
+        self._io_progress = None
+        
+        # Theme whose styles are currently applied
+        self._current_theme = None
+        self._themes_registered = False
+        
+        # Copy of the user settings used while the application initializes
+        self._settings_snapshot = None
+        
+        # Scale factor waiting to be applied once rapid size changes settle
+        self._pending_scale = None
+        self._scale_after_id = None
+        
+        # Status messages are held back during initialization and only the
+        # last one is shown, so the status bar is redrawn once
+        self._status_buffer: List[str] = []
+        self._defer_status = True
+        
+        # Handles to the models and views used most often, looked up once
+        self._main_window = self.get_view('main_window')
+        self._search_panel = self.get_view('search_panel')
+        self._user_model = self.get_model('user')
+        self._dictionary_model = self.get_model('dictionary')
+        self._api_model = self.get_model('api')
+        self._anki_model = self.get_model('anki')
+        self._async_service = self.get_model('async_service')
+        
         # Initialize application
         self._initialize_application()
     
@@ -58,15 +294,26 @@ class AppController(BaseController):
         self.register_event_handler('action:open_settings', self._on_open_settings)
         self.register_event_handler('action:export_dictionary', self._on_export_dictionary)
         self.register_event_handler('action:import_dictionary', self._on_import_dictionary)
+        
+        # Register background task handlers
+        self.register_event_handler('dictionary:import_progress', self._on_import_progress)
     
     def _initialize_application(self):
         """Initialize the application components."""
         # Set up window close handler
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_close_button)
         
-        # Apply initial user settings
-        self._apply_user_settings()
+        # Read settings once for the whole initialization
+        user_model = self._user_model
+        self._settings_snapshot = dict(user_model.get_settings()) if user_model else {}
         
+        # Deliver the theme, scale and settings events once each, after all
+        # settings are applied; other events are delivered as they happen
+        batch = self.event_bus.batched() if self.event_bus else contextlib.nullcontext()
+        with batch:
+            # Apply initial user settings
+            self._apply_user_settings()
+            
         # Initialize database and language data
         self._load_language_data()
         
@@ -75,25 +322,25 @@ class AppController(BaseController):
         
         # Apply any other initialization
         self._post_initialization()
+        
+        # Later reads go to the user model, which other controllers may update
+        self._settings_snapshot = None
     
     def _apply_user_settings(self):
         """Apply user settings to the application."""
-        user_model = self.get_model('user')
+        user_model = self._user_model
         if not user_model:
             return
             
         # Apply text scaling
-        scale_factor = user_model.get_setting('text_scale_factor', 1.0)
+        scale_factor = self._get_setting('text_scale_factor', 1.0)
         self._update_text_scaling(scale_factor)
         
-        # Apply language settings
-        main_window = self.get_view('main_window')
-        if main_window:
-            # Update UI status based on settings
-            main_window.set_status_message("Applying settings...")
+        # Update UI status based on settings
+        self._set_status("Applying settings...")
         
         # Apply theme settings
-        theme = user_model.get_setting('theme', 'system')
+        theme = self._get_setting('theme', 'system')
         self._apply_theme(theme)
         
         # Notify that settings have been applied
@@ -105,13 +352,11 @@ class AppController(BaseController):
     
     def _load_language_data(self):
         """Load language data from the database."""
-        dictionary_model = self.get_model('dictionary')
+        dictionary_model = self._dictionary_model
         if not dictionary_model:
             return
             
-        main_window = self.get_view('main_window')
-        if main_window:
-            main_window.set_status_message("Loading language data...")
+        self._set_status("Loading language data...")
             
         # Get all available languages
         try:
@@ -134,17 +379,16 @@ class AppController(BaseController):
                     'message': f"Failed to load language data: {str(e)}"
                 })
         finally:
-            if main_window:
-                main_window.set_status_message("Ready")
+            self._set_status("Ready")
     
     def _layout_views(self):
         """Layout the main application views."""
-        main_window = self.get_view('main_window')
+        main_window = self._main_window
         if not main_window:
             return
             
         # Get the main views
-        search_panel = self.get_view('search_panel')
+        search_panel = self._search_panel
         entry_display = self.get_view('entry_display')
         language_filter = self.get_view('language_filter')
         
@@ -173,23 +417,86 @@ class AppController(BaseController):
         # Update API connection status
         self._update_api_status()
         
-        # Update Anki connection status
+        # Update Anki connection status in the background
         self._update_anki_status()
         
         # Check if any recent lookups to display
         self._load_recent_lookups()
         
         # Start background monitoring for clipboard if enabled
-        user_model = self.get_model('user')
-        if user_model and user_model.get_setting('monitor_clipboard', False):
-            search_panel = self.get_view('search_panel')
+        if self._get_setting('monitor_clipboard', False):
+            search_panel = self._search_panel
             if search_panel:
                 search_panel.start_clipboard_monitoring()
+                
+        # Show the final initialization status
+        self._flush_status()
+    
+    def _get_setting(self, key: str, default: Any = None) -> Any:
+        """
+        Get a user setting, from the initialization snapshot while it exists.
+        
+        Args:
+            key: The setting key to retrieve
+            default: Default value if setting doesn't exist
+            
+        Returns:
+            The setting value or default
+        """
+        if self._settings_snapshot is not None:
+            return self._settings_snapshot.get(key, default)
+            
+        user_model = self._user_model
+        return user_model.get_setting(key, default) if user_model else default
+    
+    def _set_setting(self, key: str, value: Any):
+        """
+        Set and save a user setting, keeping the initialization snapshot in step.
+        
+        During initialization, values that match the snapshot are not saved
+        again, which avoids rewriting the settings file at startup.
+        
+        Args:
+            key: The setting key to set
+            value: The value to set
+        """
+        snapshot = self._settings_snapshot
+        if snapshot is not None:
+            if key in snapshot and snapshot[key] == value:
+                return
+            snapshot[key] = value
+            
+        user_model = self._user_model
+        if user_model:
+            user_model.set_setting(key, value)
+    
+    def _set_status(self, message: str):
+        """
+        Set the status bar message, or hold it back during initialization.
+        
+        Args:
+            message: Message to display
+        """
+        if self._defer_status:
+            self._status_buffer.append(message)
+            return
+            
+        main_window = self._main_window
+        if main_window:
+            main_window.set_status_message(message)
+    
+    def _flush_status(self):
+        """Stop deferring status messages and show the last one held back."""
+        self._defer_status = False
+        if self._status_buffer:
+            message = self._status_buffer[-1]
+            self._status_buffer.clear()
+            self._set_status(message)
     
     def _update_api_status(self):
         """Update the API connection status in the UI."""
-        api_model = self.get_model('api')
-        main_window = self.get_view('main_window')
+        api_model = self._api_model
+        main_window = self._main_window
         
         if not api_model or not main_window:
             return
@@ -202,22 +509,40 @@ class AppController(BaseController):
     
     def _update_anki_status(self):
         """Update the Anki connection status in the UI."""
-        anki_model = self.get_model('anki')
-        main_window = self.get_view('main_window')
+        anki_model = self._anki_model
+        main_window = self._main_window
         
         if not anki_model or not main_window:
             return
             
-        # Test Anki connection
-        connected = anki_model.test_connection()
+        # Test Anki connection off the main loop, since AnkiConnect may take
+        # seconds to time out when Anki isn't running
+        self._run_in_background(
+            self._probe_anki,
+            main_window.set_anki_status,
+            lambda error: main_window.set_anki_status(False, error),
+            anki_model
+        )
+    
+    def _probe_anki(self, anki_model, progress_callback=None) -> bool:
+        """
+        Test the Anki connection.
         
-        # Update main window status
-        main_window.set_anki_status(connected)
+        Runs on a background thread.
+        
+        Args:
+            anki_model: The Anki model to test
+            progress_callback: Progress callback supplied by the async service (unused)
+            
+        Returns:
+            True if Anki is reachable, False otherwise
+        """
+        return anki_model.test_connection()
     
     def _load_recent_lookups(self):
         """Load recent lookups from user settings."""
-        user_model = self.get_model('user')
-        search_panel = self.get_view('search_panel')
+        user_model = self._user_model
+        search_panel = self._search_panel
         
         if not user_model or not search_panel:
             return
@@ -236,20 +561,10 @@ class AppController(BaseController):
         Args:
             scale_factor: The text scale factor to apply
         """
-        # Update scale factor in all views
-        for view_name, view in self.views.items():
-            if hasattr(view, 'scale_factor'):
-                view.scale_factor = scale_factor
-                
-            if hasattr(view, 'update_scale'):
-                view.update_scale()
-                
         # Save the scale factor to user settings
-        user_model = self.get_model('user')
-        if user_model:
-            user_model.set_setting('text_scale_factor', scale_factor)
+        self._set_setting('text_scale_factor', scale_factor)
             
-        # Notify of scale factor change
+        # Notify of scale factor change; views subscribe to this to rescale
         if self.event_bus:
             self.event_bus.publish('ui:scale_factor_changed', {
                 'scale_factor': scale_factor
@@ -262,155 +577,43 @@ class AppController(BaseController):
         Args:
             theme: The theme to apply ('light', 'dark', or 'system')
         """
-        import platform
-        import tkinter as tk
-        from tkinter import ttk
-        
-        # Define color schemes for each theme
-        # Each theme defines colors for various UI elements
-        color_schemes = {
-            'light': {
-                'bg': '#FFFFFF',  # Background
-                'fg': '#000000',  # Foreground text
-                'select_bg': '#CCE4F7',  # Selection background
-                'select_fg': '#000000',  # Selection text
-                'button': '#F0F0F0',  # Button background
-                'button_active': '#E0E0E0',  # Button when pressed
-                'entry_bg': '#FFFFFF',  # Entry field background
-                'entry_fg': '#000000',  # Entry field text
-                'highlight_bg': '#E8F0F8',  # Highlight background
-                'highlight_fg': '#000000',  # Highlight text
-                'listbox_bg': '#FFFFFF',  # Listbox background
-                'frame_bg': '#F5F5F5',  # Frame background
-                'scrollbar': '#C0C0C0',  # Scrollbar color
-                'heading_fg': '#000000',  # Heading text
-                'border': '#C0C0C0',  # Border color
-            },
-            'dark': {
-                'bg': '#2E2E2E',  # Background
-                'fg': '#E0E0E0',  # Foreground text
-                'select_bg': '#4A6984',  # Selection background
-                'select_fg': '#FFFFFF',  # Selection text
-                'button': '#3E3E3E',  # Button background
-                'button_active': '#505050',  # Button when pressed
-                'entry_bg': '#3E3E3E',  # Entry field background
-                'entry_fg': '#E0E0E0',  # Entry field text
-                'highlight_bg': '#404D5D',  # Highlight background
-                'highlight_fg': '#E0E0E0',  # Highlight text
-                'listbox_bg': '#2E2E2E',  # Listbox background
-                'frame_bg': '#2A2A2A',  # Frame background
-                'scrollbar': '#505050',  # Scrollbar color
-                'heading_fg': '#E0E0E0',  # Heading text
-                'border': '#505050',  # Border color
-            },
-            'system': {}  # Will be determined based on system settings
-        }
-        
         # Determine system theme if 'system' is selected
         if theme == 'system':
-            # Try to detect system theme (this is platform-specific)
-            system_theme = 'light'  # Default to light
-            
-            # On Windows, check registry
-            if platform.system() == 'Windows':
-                try:
-                    import winreg
-                    registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-                    key = winreg.OpenKey(registry, r'Software\\Microsoft\\Windows\\CurrentVersion\\Themes\\Personalize')
-                    # AppsUseLightTheme = 0 means dark theme
-                    use_light_theme = winreg.QueryValueEx(key, 'AppsUseLightTheme')[0]
-                    system_theme = 'light' if use_light_theme else 'dark'
-                except:
-                    # If any error occurs, fall back to light theme
-                    system_theme = 'light'
-                    
-            # On macOS, check dark mode
-            elif platform.system() == 'Darwin':
-                try:
-                    import subprocess
-                    result = subprocess.run(
-                        ['defaults', 'read', '-g', 'AppleInterfaceStyle'],
-                        capture_output=True, text=True
-                    )
-                    # If 'Dark' is returned, use dark theme
-                    system_theme = 'dark' if 'dark' in result.stdout.lower() else 'light'
-                except:
-                    # If any error occurs, fall back to light theme
-                    system_theme = 'light'
-                    
-            # For all other platforms or if detection fails, use light theme
-            
-            # Use the detected system theme
-            theme = system_theme
+            theme = _detect_system_theme()
+            
+        # Nothing to restyle if this theme is already applied
+        if theme == self._current_theme:
+            return
             
-        # Get the theme colors
-        colors = color_schemes.get(theme, color_schemes['light'])
-        
         # Get the root window
         root = self.root
         if not root:
             return
             
-        # Apply theme to the root window
-        style = ttk.Style(root)
+        # Get the theme colors
+        if theme not in _COLOR_SCHEMES:
+            theme = 'light'
+        colors = _COLOR_SCHEMES[theme]
         
-        # Configure ttk styles for various widgets
-        style.configure('TFrame', background=colors['frame_bg'])
-        style.configure('TLabel', background=colors['bg'], foreground=colors['fg'])
-        style.configure('TButton', 
-                        background=colors['button'],
-                        foreground=colors['fg'],
-                        bordercolor=colors['border'])
-        style.map('TButton',
-                 background=[('active', colors['button_active'])])
-        style.configure('TEntry',
-                        fieldbackground=colors['entry_bg'],
-                        foreground=colors['entry_fg'],
-                        bordercolor=colors['border'])
-        style.configure('TCombobox',
-                        fieldbackground=colors['entry_bg'],
-                        foreground=colors['entry_fg'],
-                        selectbackground=colors['select_bg'],
-                        selectforeground=colors['select_fg'])
-        style.configure('TScrollbar', background=colors['scrollbar'], troughcolor=colors['bg'])
-        style.configure('TNotebook', background=colors['bg'])
-        style.configure('TNotebook.Tab', 
-                        background=colors['bg'],
-                        foreground=colors['fg'],
-                        padding=[5, 2])
-        style.map('TNotebook.Tab',
-                 background=[('selected', colors['highlight_bg'])],
-                 foreground=[('selected', colors['highlight_fg'])])
+        # Switch to the registered ttk theme, registering them on first use
+        style = ttk.Style(root)
+        if not self._themes_registered:
+            _register_themes(style)
+            self._themes_registered = True
+        style.theme_use(f'deepdict_{theme}')
                  
         # Apply theme to tk widgets that aren't covered by ttk styling
         root.configure(background=colors['bg'])
         
-        # Set theme configuration for text widgets (used in many views)
-        text_config = {
-            'background': colors['bg'],
-            'foreground': colors['fg'],
-            'selectbackground': colors['select_bg'],
-            'selectforeground': colors['select_fg'],
-            'insertbackground': colors['fg'],  # Text cursor color
-        }
-        
-        # Apply theme to all views
-        for view_name, view in self.views.items():
-            # If view has a method to apply theme, call it
-            if hasattr(view, 'apply_theme'):
-                view.apply_theme(theme, colors)
-            # Otherwise, try to set colors on common widgets
-            elif hasattr(view, 'frame'):
-                view.frame.configure(background=colors['bg'])
+        self._current_theme = theme
                 
         # Save the theme setting
-        user_model = self.get_model('user')
-        if user_model:
-            user_model.set_setting('theme', theme)
+        self._set_setting('theme', theme)
             
-        # Notify of theme change
+        # Notify of theme change; views subscribe to this to restyle
         self.publish_event('ui:theme_changed', {
-            'theme': theme
+            'theme': theme,
+            'colors': colors
         })
     
     def add_controller(self, name: str, controller):
@@ -494,7 +697,7 @@ class AppController(BaseController):
         self.log_debug("Cleaning up application resources")
         
         # Save user settings
-        user_model = self.get_model('user')
+        user_model = self._user_model
         if user_model:
             self.log_debug("Saving user settings")
             user_model.save_settings()
@@ -512,25 +715,30 @@ class AppController(BaseController):
         
     def _cleanup_temp_files(self):
         """Clean up temporary files created by the application."""
-        import os
-        import tempfile
-        import glob
+        removed_count = 0
+        failed_files = []
         
         try:
-            # Clean up temp files with our app prefix
-            temp_dir = tempfile.gettempdir()
-            temp_files = glob.glob(os.path.join(temp_dir, "deepdict_temp_*"))
-            
-            if temp_files:
-                self.log_debug(f"Cleaning up {len(temp_files)} temporary files")
-                
-                for temp_file in temp_files:
+            # Clean up temp files with our app prefix in a single directory pass
+            with os.scandir(tempfile.gettempdir()) as entries:
+                for entry in entries:
+                    if not entry.name.startswith("deepdict_temp_"):
+                        continue
+                        
                     try:
-                        os.remove(temp_file)
-                    except Exception as e:
-                        self.log_warning(f"Failed to remove temp file {temp_file}", error=str(e))
+                        os.unlink(entry.path)
+                        removed_count += 1
+                    except OSError:
+                        failed_files.append(entry.name)
         except Exception as e:
             self.log_warning("Error during temp file cleanup", error=str(e))
+            
+        if removed_count:
+            self.log_debug(f"Cleaned up {removed_count} temporary files")
+            
+        # Report all failures together rather than one warning per file
+        if failed_files:
+            self.log_warning(f"Failed to remove {len(failed_files)} temp files", files=failed_files)
     
     # Event handlers
     
@@ -561,7 +769,7 @@ class AppController(BaseController):
         severity = data.get('severity', 'error')
         
         # Update status message
-        main_window = self.get_view('main_window')
+        main_window = self._main_window
         if main_window:
             main_window.set_status_message(f"Error: {message}")
             
@@ -575,38 +783,76 @@ class AppController(BaseController):
     
     def _on_increase_text_size(self, data: Optional[Dict[str, Any]] = None):
         """Handle increase text size action."""
-        user_model = self.get_model('user')
+        user_model = self._user_model
         if not user_model:
             return
             
-        # Get current scale factor
-        scale_factor = user_model.get_setting('text_scale_factor', 1.0)
+        # Get current scale factor, including a change not yet applied
+        scale_factor = self._current_scale_factor(user_model)
         
         # Increase by 10%, max 2.0
         scale_factor = min(2.0, scale_factor + 0.1)
         
         # Update scaling
-        self._update_text_scaling(scale_factor)
+        self._schedule_text_scaling(scale_factor)
     
     def _on_decrease_text_size(self, data: Optional[Dict[str, Any]] = None):
         """Handle decrease text size action."""
-        user_model = self.get_model('user')
+        user_model = self._user_model
         if not user_model:
             return
             
-        # Get current scale factor
-        scale_factor = user_model.get_setting('text_scale_factor', 1.0)
+        # Get current scale factor, including a change not yet applied
+        scale_factor = self._current_scale_factor(user_model)
         
         # Decrease by 10%, min 0.5
         scale_factor = max(0.5, scale_factor - 0.1)
         
         # Update scaling
-        self._update_text_scaling(scale_factor)
+        self._schedule_text_scaling(scale_factor)
     
     def _on_reset_text_size(self, data: Optional[Dict[str, Any]] = None):
         """Handle reset text size action."""
         # Reset to default scale factor (1.0)
-        self._update_text_scaling(1.0)
+        self._schedule_text_scaling(1.0)
+    
+    def _current_scale_factor(self, user_model) -> float:
+        """
+        Get the scale factor that text size changes should build on.
+        
+        Args:
+            user_model: The user model holding the saved scale factor
+            
+        Returns:
+            The pending scale factor if one is scheduled, otherwise the saved one
+        """
+        if self._pending_scale is not None:
+            return self._pending_scale
+        return user_model.get_setting('text_scale_factor', 1.0)
+    
+    def _schedule_text_scaling(self, scale_factor: float):
+        """
+        Apply a scale factor once no further change arrives for 100 ms.
+        
+        Holding down a text size shortcut then causes one relayout instead of
+        one per key repeat.
+        
+        Args:
+            scale_factor: The text scale factor to apply
+        """
+        self._pending_scale = scale_factor
+        if self._scale_after_id:
+            self.root.after_cancel(self._scale_after_id)
+        self._scale_after_id = self.root.after(100, self._flush_scale)
+    
+    def _flush_scale(self):
+        """Apply the pending scale factor."""
+        scale_factor = self._pending_scale
+        self._pending_scale = None
+        self._scale_after_id = None
+        
+        if scale_factor is not None:
+            self._update_text_scaling(scale_factor)
     
     def _on_toggle_fullscreen(self, data: Optional[Dict[str, Any]] = None):
         """Handle toggle fullscreen action."""
@@ -618,8 +864,11 @@ class AppController(BaseController):
         """Handle open settings action."""
         self.log_info("Opening settings dialog")
         
-        # Get the settings controller
+        # Get the settings controller, creating it the first time settings are opened
         settings_controller = self.get_controller('settings')
+        if not settings_controller:
+            settings_controller = self._create_settings_controller()
+            
         if settings_controller:
             # Show settings dialog
             settings_controller.show_settings_dialog(self.root)
@@ -630,6 +879,23 @@ class AppController(BaseController):
                 'parent_window': self.root
             })
     
+    def _create_settings_controller(self):
+        """
+        Create and register the settings controller.
+        
+        Returns:
+            The new settings controller, or None if it could not be created
+        """
+        try:
+            from .settings_controller import SettingsController
+            settings_controller = SettingsController(self.models, self.views, self.event_bus)
+        except Exception as e:
+            self.log_error("Failed to create settings controller", exc_info=True, error=str(e))
+            return None
+            
+        self.add_controller('settings', settings_controller)
+        return settings_controller
+    
     def _on_export_dictionary(self, data: Optional[Dict[str, Any]] = None):
         """
         Handle export dictionary action.
@@ -637,7 +903,7 @@ class AppController(BaseController):
         Exports dictionary entries to a JSON file selected by the user.
         """
         # Get the main window for dialog parent
-        main_window = self.get_view('main_window')
+        main_window = self._main_window
         if not main_window or not main_window.root:
             self.publish_event('error:dialog', {
                 'message': "Cannot export dictionary: No window available"
@@ -645,7 +911,7 @@ class AppController(BaseController):
             return
             
         # Get dictionary model
-        dictionary_model = self.get_model('dictionary')
+        dictionary_model = self._dictionary_model
         if not dictionary_model:
             self.publish_event('error:dialog', {
                 'message': "Cannot export dictionary: Dictionary model not available"
@@ -653,22 +919,16 @@ class AppController(BaseController):
             return
         
         # Get user settings for default directory
-        user_model = self.get_model('user')
+        user_model = self._user_model
         last_export_dir = user_model.get_setting('last_export_dir', '') if user_model else ''
         
-        # Import tkinter file dialog here to avoid global import
-        from tkinter import filedialog
-        
         # Show file dialog
         file_path = filedialog.asksaveasfilename(
             parent=main_window.root,
             title="Export Dictionary", 
             defaultextension=".json",
             initialdir=last_export_dir if last_export_dir else None,
-            filetypes=[
-                ("JSON files", "*.json"),
-                ("All files", "*.*")
-            ]
+            filetypes=self._JSON_FILETYPES
         )
         
         # If user canceled, exit
@@ -677,63 +937,82 @@ class AppController(BaseController):
             
         # Remember the directory for next time
         if user_model:
-            import os
             user_model.set_setting('last_export_dir', os.path.dirname(file_path))
         
         # Show an indeterminate progress indicator
         main_window.set_status_message("Exporting dictionary...")
         
-        try:
-            # Get all entries
-            # First get all languages to create filters
-            languages = dictionary_model.get_all_languages()
-            target_languages = languages.get('target_languages', [])
-            
-            all_entries = []
-            
-            # For each target language, get entries
-            for target_lang in target_languages:
-                entries = dictionary_model.search_entries({
-                    'target_language': target_lang
-                })
-                all_entries.extend(entries)
-            
-            # Create export data
-            export_data = {
-                'entries': all_entries,
-                'metadata': {
-                    'export_date': self._get_current_datetime(),
-                    'entry_count': len(all_entries)
-                }
-            }
-            
-            # Save to file
-            import json
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+        def on_export_done(entry_count):
+            self._io_progress = None
             
             # Show success message
-            main_window.set_status_message(f"Exported {len(all_entries)} entries to {file_path}")
+            main_window.set_status_message(f"Exported {entry_count} entries to {file_path}")
             
             # Publish export completed event
             self.publish_event('dictionary:export_completed', {
                 'file_path': file_path,
-                'entry_count': len(all_entries)
+                'entry_count': entry_count
             })
+        
+        def on_export_error(error):
+            self._io_progress = None
             
-        except Exception as e:
             # Show error message
             main_window.set_status_message("Export failed")
             
             self.publish_event('error:dialog', {
-                'message': f"Export failed: {str(e)}"
+                'message': f"Export failed: {error}"
             })
             
             # Publish export failed event
             self.publish_event('dictionary:export_failed', {
                 'file_path': file_path,
-                'error': str(e)
+                'error': error
             })
+        
+        # Write the file off the main loop and report progress while it runs
+        self._io_progress = 0
+        self._run_in_background(self._export_worker, on_export_done, on_export_error,
+                                file_path, dictionary_model)
+        self._poll_io_progress("Exporting... {count} entries")
+    
+    def _export_worker(self, file_path: str, dictionary_model, progress_callback=None) -> int:
+        """
+        Write all dictionary entries to a JSON export file.
+        
+        Runs on a background thread.
+        
+        Args:
+            file_path: Path of the file to write
+            dictionary_model: The dictionary model to read entries from
+            progress_callback: Progress callback supplied by the async service (unused)
+            
+        Returns:
+            Number of entries exported
+        """
+        # Metadata goes first so importers can read the entry count
+        # without scanning the entries
+        metadata = {
+            'export_date': self._get_current_datetime(),
+            'entry_count': dictionary_model.count_entries()
+        }
+        
+        # Stream entries to the file one at a time instead of building
+        # the whole export in memory first
+        entry_count = 0
+        with open(file_path, 'wb') as f:
+            f.write(b'{"metadata": ')
+            f.write(_dumps(metadata))
+            f.write(b', "entries": [\n')
+            for entry in dictionary_model.get_all_entries():
+                if entry_count:
+                    f.write(b',\n')
+                f.write(_dumps(entry))
+                entry_count += 1
+                self._io_progress = entry_count
+            f.write(b'\n]}\n')
+        
+        return entry_count
     
     def _on_import_dictionary(self, data: Optional[Dict[str, Any]] = None):
         """
@@ -742,7 +1021,7 @@ class AppController(BaseController):
         Imports dictionary entries from a JSON file selected by the user.
         """
         # Get the main window for dialog parent
-        main_window = self.get_view('main_window')
+        main_window = self._main_window
         if not main_window or not main_window.root:
             self.publish_event('error:dialog', {
                 'message': "Cannot import dictionary: No window available"
@@ -750,7 +1029,7 @@ class AppController(BaseController):
             return
             
         # Get dictionary model
-        dictionary_model = self.get_model('dictionary')
+        dictionary_model = self._dictionary_model
         if not dictionary_model:
             self.publish_event('error:dialog', {
                 'message': "Cannot import dictionary: Dictionary model not available"
@@ -758,21 +1037,15 @@ class AppController(BaseController):
             return
         
         # Get user settings for default directory
-        user_model = self.get_model('user')
+        user_model = self._user_model
         last_import_dir = user_model.get_setting('last_import_dir', '') if user_model else ''
         
-        # Import tkinter file dialog and messagebox here to avoid global import
-        from tkinter import filedialog, messagebox
-        
         # Show file dialog
         file_path = filedialog.askopenfilename(
             parent=main_window.root,
             title="Import Dictionary", 
             initialdir=last_import_dir if last_import_dir else None,
-            filetypes=[
-                ("JSON files", "*.json"),
-                ("All files", "*.*")
-            ]
+            filetypes=self._JSON_FILETYPES
         )
         
         # If user canceled, exit
@@ -781,26 +1054,28 @@ class AppController(BaseController):
             
         # Remember the directory for next time
         if user_model:
-            import os
             user_model.set_setting('last_import_dir', os.path.dirname(file_path))
         
         # Show an indeterminate progress indicator
         main_window.set_status_message("Importing dictionary...")
         
-        try:
-            # Load the file
-            import json
-            with open(file_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+        def on_import_error(error):
+            # Show error message
+            main_window.set_status_message("Import failed")
             
-            # Extract entries
-            if 'entries' not in import_data:
-                raise ValueError("Invalid import file: 'entries' key not found")
-                
-            entries = import_data['entries']
+            self.publish_event('error:dialog', {
+                'message': f"Import failed: {error}"
+            })
             
+            # Publish import failed event
+            self.publish_event('dictionary:import_failed', {
+                'file_path': file_path,
+                'error': error
+            })
+        
+        def on_file_loaded(result):
             # Confirm import with user
-            entry_count = len(entries)
+            entry_count, entries = result
             confirm = messagebox.askyesno(
                 "Confirm Import",
                 f"Import {entry_count} entries from {file_path}?\n\n"
@@ -813,56 +1088,262 @@ class AppController(BaseController):
                 main_window.set_status_message("Import canceled")
                 return
             
-            # Import entries
-            success_count = 0
-            skip_count = 0
+            def on_import_done(counts):
+                success_count, skip_count, fail_count = counts
+                
+                # Show success message
+                message = f"Imported {success_count} entries, skipped {skip_count} entries"
+                if fail_count:
+                    message += f", failed to save {fail_count} entries"
+                main_window.set_status_message(message)
+                
+                # Publish import completed event
+                self.publish_event('dictionary:import_completed', {
+                    'file_path': file_path,
+                    'success_count': success_count,
+                    'skip_count': skip_count,
+                    'fail_count': fail_count,
+                    'total_count': entry_count
+                })
+                
+                # Refresh the UI
+                self.publish_event('dictionary:data_changed', {})
             
-            for entry in entries:
-                # Validate entry
-                if dictionary_model.is_valid_entry(entry):
-                    # Add entry
-                    try:
-                        # Try to save the entry
-                        entry_id = dictionary_model.save_entry(entry)
-                        
-                        if entry_id:
-                            success_count += 1
-                        else:
-                            skip_count += 1
-                    except Exception:
-                        skip_count += 1
-                else:
-                    skip_count += 1
+            # Save the entries off the main loop; it reports progress through events
+            self._run_in_background(self._import_worker, on_import_done, on_import_error,
+                                    entries, entry_count, dictionary_model)
+        
+        # Read and parse the file off the main loop, then confirm on it
+        self._run_in_background(self._load_import_file, on_file_loaded, on_import_error, file_path)
+    
+    def _on_import_progress(self, data: Dict[str, Any]):
+        """
+        Handle import progress events.
+        
+        Published from the import worker thread, so the status bar is
+        updated on the Tk main loop.
+        
+        Args:
+            data: Event data with 'done' and 'total' entry counts
+        """
+        main_window = self._main_window
+        if main_window:
+            self.root.after(0, main_window.set_status_message,
+                            f"Importing... {data['done']} of {data['total']} entries")
+    
+    def _load_import_file(self, file_path: str, progress_callback=None) -> Tuple[int, Iterable[Dict[str, Any]]]:
+        """
+        Count the entries in a JSON import file and prepare to read them.
+        
+        Runs on a background thread. With ijson installed the file is only
+        scanned here, and the entries are parsed one at a time as the
+        returned iterator is consumed. Exports that list their entry count
+        in metadata ahead of the entries are only scanned up to the entries.
+        
+        Args:
+            file_path: Path of the file to read
+            progress_callback: Progress callback supplied by the async service (unused)
             
-            # Show success message
-            main_window.set_status_message(
-                f"Imported {success_count} entries, skipped {skip_count} entries"
-            )
+        Returns:
+            Tuple of (entry_count, entries)
             
-            # Publish import completed event
-            self.publish_event('dictionary:import_completed', {
-                'file_path': file_path,
-                'success_count': success_count,
-                'skip_count': skip_count,
-                'total_count': entry_count
-            })
+        Raises:
+            ValueError: If the file has no 'entries' key
+        """
+        # Reject files that are obviously not exports before parsing them
+        self._check_import_file_header(file_path)
+        
+        if ijson is None:
+            with open(file_path, 'rb') as f:
+                import_data = _loads(f.read())
             
-            # Refresh the UI
-            self.publish_event('dictionary:data_changed', {})
+            # Extract entries
+            if 'entries' not in import_data:
+                raise ValueError("Invalid import file: 'entries' key not found")
+                
+            entries = import_data['entries']
+            return len(entries), entries
+        
+        # Use the count from metadata if it comes first, otherwise count the
+        # top-level items of the entries array without building them
+        entry_count = 0
+        declared_count = None
+        found_entries = False
+        with open(file_path, 'rb', buffering=_IMPORT_BUFFER_SIZE) as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'metadata.entry_count' and event == 'number':
+                    declared_count = int(value)
+                elif prefix == 'entries' and event == 'start_array':
+                    found_entries = True
+                    if declared_count is not None:
+                        entry_count = declared_count
+                        break
+                elif prefix == 'entries.item' and event != 'map_key' and not event.startswith('end_'):
+                    entry_count += 1
+        
+        if not found_entries:
+            raise ValueError("Invalid import file: 'entries' key not found")
             
-        except Exception as e:
-            # Show error message
-            main_window.set_status_message("Import failed")
+        return entry_count, self._iter_import_entries(file_path)
+    
+    def _check_import_file_header(self, file_path: str):
+        """
+        Check that an import file starts like an export.
+        
+        Only the first few kilobytes are read, so malformed files are rejected
+        before the whole file is parsed.
+        
+        Args:
+            file_path: Path of the file to check
             
-            self.publish_event('error:dialog', {
-                'message': f"Import failed: {str(e)}"
-            })
+        Raises:
+            ValueError: If the file is not a JSON object, or is small enough to
+                read whole and has no 'entries' key
+        """
+        with open(file_path, 'rb') as f:
+            header = f.read(_IMPORT_HEADER_SIZE + 1)
+        
+        if not header.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'{'):
+            raise ValueError("Invalid import file: not a JSON object")
             
-            # Publish import failed event
-            self.publish_event('dictionary:import_failed', {
-                'file_path': file_path,
-                'error': str(e)
-            })
+        # Larger files may have other keys before the entries, leave those to the parser
+        if len(header) <= _IMPORT_HEADER_SIZE and b'"entries"' not in header:
+            raise ValueError("Invalid import file: 'entries' key not found")
+    
+    def _iter_import_entries(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Parse the entries of a JSON import file one at a time.
+        
+        Args:
+            file_path: Path of the file to read
+            
+        Yields:
+            Each entry in the file's 'entries' array
+        """
+        with open(file_path, 'rb', buffering=_IMPORT_BUFFER_SIZE) as f:
+            yield from ijson.items(f, 'entries.item', use_float=True)
+    
+    # Entries saved per transaction during import
+    _IMPORT_BATCH_SIZE = 1000
+    
+    # Entries between dictionary:import_progress events
+    _IMPORT_PROGRESS_INTERVAL = 500
+    
+    def _import_worker(self, entries: Iterable[Dict[str, Any]], entry_count: int, dictionary_model,
+                       progress_callback=None):
+        """
+        Save imported entries to the dictionary.
+        
+        Entries already in the dictionary, or repeated in the file, are skipped
+        before reaching the database. The rest are saved in batches of
+        _IMPORT_BATCH_SIZE, one transaction each. Runs on a background thread
+        and publishes dictionary:import_progress every _IMPORT_PROGRESS_INTERVAL
+        entries.
+        
+        Args:
+            entries: Entries to import
+            entry_count: Number of entries in the import file
+            dictionary_model: The dictionary model to save entries with
+            progress_callback: Progress callback supplied by the async service (unused)
+            
+        Returns:
+            Tuple of (success_count, skip_count, fail_count)
+        """
+        success_count = 0
+        skip_count = 0
+        fail_count = 0
+        batch = []
+        
+        # Keys of entries that exist or are already queued for saving
+        known_keys = dictionary_model.get_entry_keys()
+        
+        def flush():
+            nonlocal success_count, skip_count, fail_count
+            saved, skipped, failed = dictionary_model.save_entries_bulk(batch, validated=True)
+            success_count += saved
+            skip_count += skipped
+            fail_count += failed
+            batch.clear()
+        
+        for done, entry in enumerate(entries, 1):
+            if done % self._IMPORT_PROGRESS_INTERVAL == 0:
+                self.publish_event('dictionary:import_progress', {
+                    'done': done,
+                    'total': entry_count
+                })
+                
+            if not dictionary_model.is_valid_entry(entry):
+                skip_count += 1
+                continue
+                
+            metadata = entry['metadata']
+            key = (entry['headword'], metadata['source_language'],
+                   metadata['target_language'], metadata['definition_language'])
+            try:
+                is_known = key in known_keys
+            except TypeError:
+                # Headword or language values that aren't strings can't be saved
+                skip_count += 1
+                continue
+            if is_known:
+                skip_count += 1
+                continue
+            known_keys.add(key)
+            
+            batch.append(entry)
+            if len(batch) >= self._IMPORT_BATCH_SIZE:
+                flush()
+        
+        if batch:
+            flush()
+        
+        return success_count, skip_count, fail_count
+    
+    def _run_in_background(self, func: Callable, on_done: Callable, on_error: Callable, *args):
+        """
+        Run a function on the async service and deliver its outcome on the Tk main loop.
+        
+        Falls back to running the function directly when no async service is available.
+        
+        Args:
+            func: The function to run
+            on_done: Called on the main loop with the function's result
+            on_error: Called on the main loop with the error message if it raises
+            *args: Positional arguments for the function
+        """
+        async_service = self._async_service
+        if not async_service:
+            try:
+                result = func(*args)
+            except Exception as e:
+                on_error(str(e))
+                return
+            on_done(result)
+            return
+        
+        async_service.submit_task(
+            func,
+            *args,
+            name=func.__name__,
+            callback=lambda result: self.root.after(0, on_done, result),
+            error_callback=lambda error: self.root.after(0, on_error, error)
+        )
+    
+    def _poll_io_progress(self, message: str):
+        """
+        Show the progress of a background export until it finishes.
+        
+        Args:
+            message: Status message template with a {count} placeholder
+        """
+        if self._io_progress is None:
+            return
+            
+        main_window = self._main_window
+        if main_window and self._io_progress:
+            main_window.set_status_message(message.format(count=self._io_progress))
+            
+        self.root.after(100, self._poll_io_progress, message)
             
     def _get_current_datetime(self) -> str:
         """
@@ -871,5 +1352,4 @@ class AppController(BaseController):
         Returns:
             Current date and time as a string
         """
-        from datetime import datetime
         return datetime.now().isoformat()
\ No newline at end of file
@@ -5,7 +5,9 @@ This module provides a base controller class that all specific controllers
 will inherit from, establishing common functionality and interfaces.
 """
 
-from typing import Dict, Any, Optional, Callable
+import functools
+import weakref
+from typing import Dict, Any, Optional, Callable, Tuple
 
 from src.utils import logger
 
@@ -20,6 +22,8 @@ class BaseController:
         models: Dictionary of models accessible to the controller
         views: Dictionary of views accessible to the controller
         event_bus: Event system for controller-related notifications
+        log_trace, log_debug, log_info, log_warning, log_error: Application
+            logger methods bound to the controller's log module
     """
     
     def __init__(self, models=None, views=None, event_bus=None):
@@ -34,12 +38,28 @@ class BaseController:
         self.models = models or {}
         self.views = views or {}
         self.event_bus = event_bus
-        self.event_handlers = {}
+        # Handlers for each event, as an insertion-ordered set
+        self.event_handlers: Dict[str, Dict[Callable, None]] = {}
+        
+        # Event bus subscription for each handled event, kept so it can be unsubscribed
+        self._bus_callbacks: Dict[str, Callable] = {}
+        
+        # Trace log sanitizer for each event name and payload shape
+        self._sanitizer_cache: Dict[Tuple[str, Tuple[str, ...]], Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
         
         # Get controller name from class name
         self.controller_name = self.__class__.__name__
         self.log_module = self.controller_name.lower().replace("controller", "")
         
+        # Logging helpers bound to this controller's module, called like
+        # self.log_info(message, **context); log_error also takes exc_info
+        app_logger = logger.app_logger
+        self.log_trace = functools.partial(app_logger.trace, module=self.log_module)
+        self.log_debug = functools.partial(app_logger.debug, module=self.log_module)
+        self.log_info = functools.partial(app_logger.info, module=self.log_module)
+        self.log_warning = functools.partial(app_logger.warning, module=self.log_module)
+        self.log_error = functools.partial(app_logger.error, module=self.log_module)
+        
         # Log initialization
         logger.debug(f"Initializing {self.controller_name}", self.log_module)
         
@@ -49,14 +69,19 @@ class BaseController:
         # Log initialization completion
         logger.debug(f"{self.controller_name} initialized", self.log_module)
     
+    # (event_name, method_name) pairs registered by _register_event_handlers
+    _EVENT_HANDLERS: Tuple[Tuple[str, str], ...] = ()
+    
     def _register_event_handlers(self):
         """
         Register event handlers for the controller.
         
-        This method should be overridden by subclasses to register their
-        specific event handlers.
+        Registers the handlers listed in _EVENT_HANDLERS. Subclasses can
+        list their handlers there, or override this method to register
+        handlers that need more than a method name.
         """
-        pass
+        for event_name, method_name in self._EVENT_HANDLERS:
+            self.register_event_handler(event_name, getattr(self, method_name))
     
     def register_event_handler(self, event_name: str, handler: Callable):
         """
@@ -66,18 +91,45 @@ class BaseController:
             event_name: Name of the event to handle
             handler: Function to call when the event occurs
         """
-        if event_name not in self.event_handlers:
-            self.event_handlers[event_name] = []
+        handlers = self.event_handlers.setdefault(event_name, {})
             
-        if handler not in self.event_handlers[event_name]:
-            self.event_handlers[event_name].append(handler)
+        if handler not in handlers:
+            handlers[handler] = None
             
             # Log handler registration
             logger.trace(f"Registered handler for event: {event_name}", self.log_module)
             
-        # Subscribe to the event if event bus is available
-        if self.event_bus:
-            self.event_bus.subscribe(event_name, lambda data: self._dispatch_event(event_name, data))
+        # Subscribe to the event once, however many handlers it has
+        if self.event_bus and event_name not in self._bus_callbacks:
+            callback = self._make_bus_callback(event_name)
+            self._bus_callbacks[event_name] = callback
+            self.event_bus.subscribe(event_name, callback)
+    
+    def _make_bus_callback(self, event_name: str) -> Callable:
+        """
+        Create the event bus subscription for an event.
+        
+        The callback only holds a weak reference to the controller, so the event
+        bus does not keep a discarded controller alive. Once the controller has
+        been collected, the callback unsubscribes itself.
+        
+        Args:
+            event_name: Name of the event
+            
+        Returns:
+            Callback that dispatches the event to this controller's handlers
+        """
+        dispatch_ref = weakref.WeakMethod(self._dispatch_event)
+        event_bus = self.event_bus
+        
+        def callback(data: Optional[Dict[str, Any]] = None):
+            dispatch = dispatch_ref()
+            if dispatch is None:
+                event_bus.unsubscribe(event_name, callback)
+                return
+            dispatch(event_name, data)
+            
+        return callback
     
     def unregister_event_handler(self, event_name: str, handler: Callable):
         """
@@ -88,14 +140,16 @@ class BaseController:
             handler: Function to unregister
         """
         if event_name in self.event_handlers and handler in self.event_handlers[event_name]:
-            self.event_handlers[event_name].remove(handler)
+            del self.event_handlers[event_name][handler]
             
             # Log handler unregistration
             logger.trace(f"Unregistered handler for event: {event_name}", self.log_module)
             
             # If no more handlers for this event, unsubscribe
-            if not self.event_handlers[event_name] and self.event_bus:
-                self.event_bus.unsubscribe(event_name, lambda data: self._dispatch_event(event_name, data))
+            if not self.event_handlers[event_name] and event_name in self._bus_callbacks:
+                callback = self._bus_callbacks.pop(event_name)
+                if self.event_bus:
+                    self.event_bus.unsubscribe(event_name, callback)
     
     def _dispatch_event(self, event_name: str, data: Optional[Dict[str, Any]] = None):
         """
@@ -105,20 +159,14 @@ class BaseController:
             event_name: Name of the event
             data: Data associated with the event
         """
-        if event_name in self.event_handlers:
-            # Log event dispatch at trace level
-            if isinstance(data, dict):
-                # Make a copy to avoid modifying the original
-                log_data = data.copy()
-                # Truncate large values or remove binary data for logging
-                for key, value in log_data.items():
-                    if isinstance(value, str) and len(value) > 100:
-                        log_data[key] = f"{value[:100]}... (truncated)"
-                logger.trace(f"Dispatching event: {event_name}", self.log_module, **log_data)
-            else:
-                logger.trace(f"Dispatching event: {event_name}", self.log_module, data=str(data)[:100] if data else None)
+        # Snapshot the handlers so they can unregister themselves during dispatch
+        handlers = tuple(self.event_handlers.get(event_name, ()))
+        if handlers:
+            # Log event dispatch at trace level, skipping the data preparation when trace is off
+            if logger.is_enabled_for(logger.TRACE, self.log_module):
+                self._trace_dispatch(event_name, data)
             
-            for handler in self.event_handlers[event_name]:
+            for handler in handlers:
                 try:
                     handler(data)
                 except Exception as e:
@@ -137,6 +185,49 @@ class BaseController:
                             'controller': self.controller_name
                         })
     
+    def _trace_dispatch(self, event_name: str, data: Optional[Dict[str, Any]] = None):
+        """
+        Log the dispatch of an event at trace level.
+        
+        Args:
+            event_name: Name of the event
+            data: Data associated with the event
+        """
+        if isinstance(data, dict):
+            # Events of the same name usually carry the same keys, so reuse the sanitizer
+            shape = (event_name, tuple(data))
+            sanitize = self._sanitizer_cache.get(shape)
+            if sanitize is None:
+                sanitize = self._sanitizer_cache[shape] = self._build_sanitizer(data)
+            logger.trace(f"Dispatching event: {event_name}", self.log_module, **sanitize(data))
+        else:
+            logger.trace(f"Dispatching event: {event_name}", self.log_module, data=str(data)[:100] if data else None)
+    
+    @staticmethod
+    def _build_sanitizer(data: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Build a function that truncates long strings in event data for logging.
+        
+        Only the keys holding strings in the sample data are checked.
+        
+        Args:
+            data: Sample event data
+            
+        Returns:
+            Function returning the data with long strings truncated, leaving the original unmodified
+        """
+        str_keys = tuple(key for key, value in data.items() if isinstance(value, str))
+        
+        def sanitize(event_data: Dict[str, Any]) -> Dict[str, Any]:
+            truncated = {
+                key: f"{event_data[key][:100]}... (truncated)"
+                for key in str_keys
+                if isinstance(event_data[key], str) and len(event_data[key]) > 100
+            }
+            return {**event_data, **truncated} if truncated else event_data
+            
+        return sanitize
+    
     def get_model(self, name: str) -> Any:
         """
         Get a model by name.
@@ -166,54 +257,14 @@ class BaseController:
         if result is None:
             logger.warning(f"View '{name}' not found", self.log_module)
         return result
-        
-    def log_debug(self, message: str, **kwargs):
-        """
-        Log a debug message with controller context.
-        
-        Args:
-            message: Message to log
-            **kwargs: Additional context
-        """
-        logger.debug(message, self.log_module, **kwargs)
     
-    def log_info(self, message: str, **kwargs):
+    def publish_event(self, event_name: str, data: Optional[Dict[str, Any]] = None):
         """
-        Log an info message with controller context.
+        Publish an event to the event bus, if one is available.
         
         Args:
-            message: Message to log
-            **kwargs: Additional context
+            event_name: Name of the event to publish
+            data: Data to include with the event
         """
-        logger.info(message, self.log_module, **kwargs)
-    
-    def log_warning(self, message: str, **kwargs):
-        """
-        Log a warning message with controller context.
-        
-        Args:
-            message: Message to log
-            **kwargs: Additional context
-        """
-        logger.warning(message, self.log_module, **kwargs)
-    
-    def log_error(self, message: str, exc_info=None, **kwargs):
-        """
-        Log an error message with controller context.
-        
-        Args:
-            message: Message to log
-            exc_info: Exception info
-            **kwargs: Additional context
-        """
-        logger.error(message, self.log_module, exc_info=exc_info, **kwargs)
-        
-    def log_trace(self, message: str, **kwargs):
-        """
-        Log a trace message with controller context.
-        
-        Args:
-            message: Message to log
-            **kwargs: Additional context
-        """
-        logger.trace(message, self.log_module, **kwargs)
\ No newline at end of file
+        if self.event_bus:
+            self.event_bus.publish(event_name, data)
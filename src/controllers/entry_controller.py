@@ -5,8 +5,11 @@ This module provides the entry controller, which manages dictionary entry
 operations such as displaying, regenerating, and exporting entries.
 """
 
+import functools
+import time
+from collections import ChainMap
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List, Tuple
-import json
 
 from .base_controller import BaseController
 
@@ -24,6 +27,55 @@ class EntryController(BaseController):
         current_entry: Currently displayed dictionary entry
     """
     
+    # Fixed per-instance state; BaseController keeps an instance __dict__
+    # because its log_* helpers are bound per instance
+    __slots__ = (
+        'current_entry', 'current_headword', '_current_langs',
+        'focused_meaning_index', 'focused_example_index',
+        '_entry_display', '_main_window', '_dictionary_model',
+        '_anki_model', '_user_model', '_request_service',
+        '_anki_settings', '_anki_connected_result', '_anki_connected_at',
+    )
+    
+    # Anki field mappings used when the note type has none configured
+    _DEFAULT_FIELD_MAPPINGS = MappingProxyType({
+        'Word': 'headword',
+        'Definition': 'selected_meaning.definition',
+        'Example': 'selected_example.sentence',
+        'Translation': 'selected_example.translation'
+    })
+    
+    # Event handlers registered by BaseController._register_event_handlers
+    _EVENT_HANDLERS = (
+        # Entry events
+        ('entry:displayed', '_on_entry_displayed'),
+        ('entry:display_cleared', '_on_entry_display_cleared'),
+        ('entry:meaning_focused', '_on_meaning_focused'),
+        ('entry:example_focused', '_on_example_focused'),
+        ('entry:copied', '_on_entry_copied'),
+        
+        # Settings events
+        ('settings:updated', '_on_settings_updated'),
+    )
+    
+    # Seconds an Anki connection test result is reused for
+    _ANKI_CONNECTION_TTL = 2.0
+    
+    # Status bar prefix for each kind of error reported by _report_error
+    _ERROR_MESSAGES = {
+        'regeneration': "Error regenerating entry",
+        'anki_export': "Error exporting to Anki",
+        'entry_deletion': "Error deleting entry",
+    }
+    
+    # Action request events and the methods that carry them out
+    _ACTION_REQUESTS = {
+        'entry:regenerate_requested': 'regenerate_entry',
+        'entry:export_requested': 'export_entry',
+        'entry:export_example_requested': 'export_example',
+        'entry:delete_requested': 'delete_entry',
+    }
+    
     def __init__(self, models=None, views=None, event_bus=None):
         """
         Initialize the entry controller.
@@ -38,23 +90,33 @@ class EntryController(BaseController):
         # Internal state
         self.current_entry = None
         self.current_headword = None
+        # (target, source, definition) languages of the current entry
+        self._current_langs = (None, None, None)
         self.focused_meaning_index = -1
         self.focused_example_index = -1
+        
+        # Handles to the models and views this controller uses, looked up once
+        self._entry_display = self.get_view('entry_display')
+        self._main_window = self.get_view('main_window')
+        self._dictionary_model = self.get_model('dictionary')
+        self._anki_model = self.get_model('anki')
+        self._user_model = self.get_model('user')
+        self._request_service = self.get_model('request_service')
+        
+        # Anki export settings, read on first export and cleared when settings change
+        self._anki_settings = None
+        
+        # Result and time of the last Anki connection test
+        self._anki_connected_result = False
+        self._anki_connected_at = None
     
     def _register_event_handlers(self):
         """Register event handlers for the entry controller."""
-        # Entry events
-        self.register_event_handler('entry:displayed', self._on_entry_displayed)
-        self.register_event_handler('entry:display_cleared', self._on_entry_display_cleared)
-        self.register_event_handler('entry:meaning_focused', self._on_meaning_focused)
-        self.register_event_handler('entry:example_focused', self._on_example_focused)
+        super()._register_event_handlers()
         
         # Action events
-        self.register_event_handler('entry:regenerate_requested', self._on_regenerate_requested)
-        self.register_event_handler('entry:export_requested', self._on_export_requested)
-        self.register_event_handler('entry:export_example_requested', self._on_export_example_requested)
-        self.register_event_handler('entry:delete_requested', self._on_delete_requested)
-        self.register_event_handler('entry:copied', self._on_entry_copied)
+        for event_name in self._ACTION_REQUESTS:
+            self.register_event_handler(event_name, functools.partial(self._on_action_requested, event_name))
     
     def display_entry(self, entry: Dict[str, Any]):
         """
@@ -64,13 +126,12 @@ class EntryController(BaseController):
             entry: The dictionary entry to display
         """
         # Update internal state
-        self.current_entry = entry
-        self.current_headword = entry.get('headword', '')
+        self._set_current_entry(entry)
         self.focused_meaning_index = -1
         self.focused_example_index = -1
         
         # Display in view
-        entry_display = self.get_view('entry_display')
+        entry_display = self._entry_display
         if entry_display:
             entry_display.display_entry(entry)
             
@@ -84,16 +145,41 @@ class EntryController(BaseController):
     def clear_display(self):
         """Clear the entry display."""
         # Reset internal state
-        self.current_entry = None
-        self.current_headword = None
-        self.focused_meaning_index = -1
-        self.focused_example_index = -1
+        self._reset_state()
         
         # Clear view
-        entry_display = self.get_view('entry_display')
+        entry_display = self._entry_display
         if entry_display:
             entry_display.clear_display()
     
+    def _reset_state(self):
+        """Clear the current entry and focus."""
+        (self.current_entry, self.current_headword, self._current_langs,
+         self.focused_meaning_index, self.focused_example_index) = (None, None, (None, None, None), -1, -1)
+    
+    def _set_current_entry(self, entry: Optional[Dict[str, Any]]):
+        """
+        Make an entry the current entry.
+        
+        Args:
+            entry: The entry, or None to clear the current entry
+        """
+        self.current_entry = entry
+        if entry is None:
+            self.current_headword = None
+            self._current_langs = (None, None, None)
+            return
+            
+        self.current_headword = entry.get('headword', '')
+        
+        # The languages don't change while the entry is current, so read them once
+        metadata = entry.get('metadata') or {}
+        self._current_langs = (
+            metadata.get('target_language'),
+            metadata.get('source_language'),
+            metadata.get('definition_language')
+        )
+    
     def focus_meaning(self, meaning_index: int):
         """
         Focus a specific meaning in the entry.
@@ -104,7 +190,11 @@ class EntryController(BaseController):
         if not self.current_entry:
             return
             
-        meanings = self.current_entry.get('meanings', [])
+        # Nothing to do if this meaning is already focused
+        if meaning_index == self.focused_meaning_index and self.focused_example_index == -1:
+            return
+            
+        meanings = self.current_entry.get('meanings') or ()
         if meaning_index < 0 or meaning_index >= len(meanings):
             return
             
@@ -113,7 +203,7 @@ class EntryController(BaseController):
         self.focused_example_index = -1
         
         # Update view
-        entry_display = self.get_view('entry_display')
+        entry_display = self._entry_display
         if entry_display:
             entry_display.focus_meaning(meaning_index)
     
@@ -128,11 +218,15 @@ class EntryController(BaseController):
         if not self.current_entry:
             return
             
-        meanings = self.current_entry.get('meanings', [])
+        # Nothing to do if this example is already focused
+        if meaning_index == self.focused_meaning_index and example_index == self.focused_example_index:
+            return
+            
+        meanings = self.current_entry.get('meanings') or ()
         if meaning_index < 0 or meaning_index >= len(meanings):
             return
             
-        examples = meanings[meaning_index].get('examples', [])
+        examples = meanings[meaning_index].get('examples') or ()
         if example_index < 0 or example_index >= len(examples):
             return
             
@@ -141,7 +235,7 @@ class EntryController(BaseController):
         self.focused_example_index = example_index
         
         # Update view
-        entry_display = self.get_view('entry_display')
+        entry_display = self._entry_display
         if entry_display:
             entry_display.focus_example(meaning_index, example_index)
     
@@ -151,10 +245,10 @@ class EntryController(BaseController):
             self.log_warning("Attempted to regenerate entry with no current entry")
             return
             
-        dictionary_model = self.get_model('dictionary')
-        request_service = self.get_model('request_service')
-        entry_display = self.get_view('entry_display')
-        main_window = self.get_view('main_window')
+        dictionary_model = self._dictionary_model
+        request_service = self._request_service
+        entry_display = self._entry_display
+        main_window = self._main_window
         
         if not dictionary_model or not request_service:
             self.log_error("Missing required models for regeneration", 
@@ -163,153 +257,196 @@ class EntryController(BaseController):
             return
             
         # Log regeneration attempt
-        self.log_info(f"Regenerating entry for '{self.current_headword}'", 
-                     headword=self.current_headword)
+        headword = self.current_headword
+        self.log_info(f"Regenerating entry for '{headword}'", 
+                     headword=headword)
             
         # Show loading state
         if entry_display:
             entry_display.set_loading_state(True)
             
         if main_window:
-            main_window.set_status_message(f"Regenerating entry for '{self.current_headword}'...")
+            main_window.set_status_message(f"Regenerating entry for '{headword}'...")
             
         try:
-            # Get metadata from current entry
-            metadata = self.current_entry.get('metadata', {})
-            target_language = metadata.get('target_language')
-            source_language = metadata.get('source_language')
-            definition_language = metadata.get('definition_language')
+            # Get the languages of the current entry
+            target_language, source_language, definition_language = self._current_langs
             
             self.log_debug("Entry metadata retrieved", 
                           target_language=target_language,
                           source_language=source_language,
                           definition_language=definition_language)
             
-            # Define success and error callbacks
-            def on_regenerate_success(entry):
-                self.log_debug("Regeneration callback received")
-                
-                # Handle the regenerated entry
-                if not entry:
-                    self.log_warning(f"Failed to regenerate entry for '{self.current_headword}' - no entry returned")
-                    
-                    if main_window:
-                        main_window.set_status_message(f"Failed to regenerate entry for '{self.current_headword}'")
-                        
-                    # Reset loading state
-                    if entry_display:
-                        entry_display.set_loading_state(False)
-                    return
-                    
-                # Save the entry to the database
-                entry_id = dictionary_model.save_entry(entry)
-                
-                if entry_id:
-                    self.log_info(f"Successfully regenerated entry for '{self.current_headword}'", 
-                                 headword=self.current_headword,
-                                 entry_id=entry_id)
-                    
-                    # Display the new entry
-                    if entry_display:
-                        entry_display.display_entry(entry)
-                        
-                    if main_window:
-                        main_window.set_status_message(f"Regenerated entry for '{self.current_headword}'")
-                        
-                    # Update current entry
-                    self.current_entry = entry
-                    
-                    # Notify of regeneration success
-                    if self.event_bus:
-                        self.event_bus.publish('entry:regenerated', {
-                            'headword': self.current_headword,
-                            'entry_id': entry_id
-                        })
-                else:
-                    self.log_error(f"Failed to save regenerated entry for '{self.current_headword}'",
-                                  headword=self.current_headword)
-                    
-                    if main_window:
-                        main_window.set_status_message(f"Failed to save regenerated entry for '{self.current_headword}'")
-                        
-                # Reset loading state
-                if entry_display:
-                    entry_display.set_loading_state(False)
-                    
-            def on_regenerate_error(error):
-                # Log the error
-                self.log_error(f"Error regenerating entry for '{self.current_headword}'", 
-                              exc_info=True,
-                              error=str(error),
-                              headword=self.current_headword)
-                
-                if self.event_bus:
-                    self.event_bus.publish('error:regeneration', {
-                        'message': f"Error regenerating entry: {error}",
-                        'headword': self.current_headword
-                    })
-                    
-                # Update UI
-                if main_window:
-                    main_window.set_status_message(f"Error regenerating entry: {error}")
-                    
-                # Reset loading state
-                if entry_display:
-                    entry_display.set_loading_state(False)
-            
             self.log_debug("Submitting regeneration request to service")
                     
-            # Request regeneration
+            # Request regeneration; the request runs on a worker thread and
+            # its outcome is handled on the Tk main loop
             request_service.regenerate_entry(
-                self.current_headword,
+                headword,
                 target_language,
                 source_language,
                 definition_language,
-                on_regenerate_success,
-                on_regenerate_error
+                functools.partial(self._call_on_ui, self._on_regenerate_success, headword),
+                functools.partial(self._call_on_ui, self._on_regenerate_error, headword)
             )
                 
         except Exception as e:
             # Handle unexpected errors
-            self.log_error(f"Unexpected error regenerating entry for '{self.current_headword}'", 
+            self.log_error(f"Unexpected error regenerating entry for '{headword}'", 
                           exc_info=True,
                           error=str(e),
-                          headword=self.current_headword)
+                          headword=headword)
+            
+            self._report_error('regeneration', e, clear_loading=True)
+    
+    def _call_on_ui(self, func, *args):
+        """
+        Call a function on the Tk main loop.
+        
+        Calls it directly when there is no main window to schedule it on.
+        
+        Args:
+            func: The function to call
+            *args: Positional arguments for the function
+        """
+        main_window = self._main_window
+        root = getattr(main_window, 'root', None)
+        if root:
+            root.after(0, func, *args)
+        else:
+            func(*args)
+    
+    def _on_regenerate_success(self, headword: str, entry: Optional[Dict[str, Any]]):
+        """
+        Handle a completed regeneration request.
+        
+        Args:
+            headword: The headword that was regenerated
+            entry: The regenerated entry, or None if none was returned
+        """
+        entry_display = self._entry_display
+        main_window = self._main_window
+        
+        self.log_debug("Regeneration callback received")
+        
+        # Handle the regenerated entry
+        if not entry:
+            self.log_warning(f"Failed to regenerate entry for '{headword}' - no entry returned")
             
-            if self.event_bus:
-                self.event_bus.publish('error:regeneration', {
-                    'message': f"Error regenerating entry: {str(e)}"
-                })
-                
             if main_window:
-                main_window.set_status_message(f"Error regenerating entry: {str(e)}")
+                main_window.set_status_message(f"Failed to regenerate entry for '{headword}'")
                 
             # Reset loading state
             if entry_display:
                 entry_display.set_loading_state(False)
+            return
+            
+        # Save the entry to the database
+        entry_id = self._dictionary_model.save_entry(entry)
+        
+        if entry_id:
+            self.log_info(f"Successfully regenerated entry for '{headword}'", 
+                         headword=headword,
+                         entry_id=entry_id)
+            
+            # Display the new entry
+            if entry_display:
+                entry_display.display_entry(entry)
+                
+            if main_window:
+                main_window.set_status_message(f"Regenerated entry for '{headword}'")
+                
+            # Update current entry
+            self._set_current_entry(entry)
+            
+            # Notify of regeneration success
+            if self.event_bus:
+                self.event_bus.publish('entry:regenerated', {
+                    'headword': headword,
+                    'entry_id': entry_id
+                })
+        else:
+            self.log_error(f"Failed to save regenerated entry for '{headword}'",
+                          headword=headword)
+            
+            if main_window:
+                main_window.set_status_message(f"Failed to save regenerated entry for '{headword}'")
+                
+        # Reset loading state
+        if entry_display:
+            entry_display.set_loading_state(False)
+    
+    def _on_regenerate_error(self, headword: str, error: Any):
+        """
+        Handle a failed regeneration request.
+        
+        Args:
+            headword: The headword that failed to regenerate
+            error: The error reported by the request service
+        """
+        # Log the error
+        self.log_error(f"Error regenerating entry for '{headword}'", 
+                      error=str(error),
+                      headword=headword)
+        
+        self._report_error('regeneration', error, clear_loading=True, headword=headword)
+    
+    def _get_anki_settings(self) -> Tuple[bool, str, str, Dict[str, Any], List[str]]:
+        """
+        Get the user settings used for Anki export.
+        
+        Returns:
+            Tuple of (anki_enabled, default_deck, default_note_type, note_types, tags)
+        """
+        if self._anki_settings is None:
+            user_model = self._user_model
+            self._anki_settings = (
+                user_model.get_setting('anki_enabled', False),
+                user_model.get_setting('default_deck', 'Language Learning'),
+                user_model.get_setting('default_note_type', 'Example-Based'),
+                user_model.get_setting('note_types', {}),
+                user_model.get_setting('tags', ['AI-Dictionary'])
+            )
+        return self._anki_settings
+    
+    def _anki_connected(self) -> bool:
+        """
+        Check whether Anki is reachable.
+        
+        The result of a connection test is reused for _ANKI_CONNECTION_TTL
+        seconds, so exporting several examples in a row tests the connection once.
+        
+        Returns:
+            True if Anki is connected, False otherwise
+        """
+        now = time.monotonic()
+        if self._anki_connected_at is None or now - self._anki_connected_at >= self._ANKI_CONNECTION_TTL:
+            self._anki_connected_result = self._anki_model.test_connection()
+            self._anki_connected_at = now
+        return self._anki_connected_result
     
     def export_entry(self):
         """Export the current entry to Anki."""
         if not self.current_entry or not self.current_headword:
             return
             
-        anki_model = self.get_model('anki')
-        user_model = self.get_model('user')
-        main_window = self.get_view('main_window')
+        anki_model = self._anki_model
+        user_model = self._user_model
+        main_window = self._main_window
         
         if not anki_model or not user_model:
             return
             
         try:
             # Check if Anki is enabled and connected
-            anki_enabled = user_model.get_setting('anki_enabled', False)
+            anki_enabled = self._get_anki_settings()[0]
             if not anki_enabled:
                 if main_window:
                     main_window.set_status_message("Anki integration is not enabled")
                 return
                 
             # Test connection
-            connected = anki_model.test_connection()
+            connected = self._anki_connected()
             if not connected:
                 if main_window:
                     main_window.set_status_message("Cannot connect to Anki")
@@ -324,13 +461,7 @@ class EntryController(BaseController):
                 main_window.set_status_message("Anki export dialog not implemented yet")
                 
         except Exception as e:
-            if self.event_bus:
-                self.event_bus.publish('error:anki_export', {
-                    'message': f"Error exporting to Anki: {str(e)}"
-                })
-                
-            if main_window:
-                main_window.set_status_message(f"Error exporting to Anki: {str(e)}")
+            self._report_error('anki_export', e)
     
     def export_example(self, meaning_index: int, example_index: int):
         """
@@ -343,23 +474,23 @@ class EntryController(BaseController):
         if not self.current_entry or not self.current_headword:
             return
             
-        anki_model = self.get_model('anki')
-        user_model = self.get_model('user')
-        main_window = self.get_view('main_window')
+        anki_model = self._anki_model
+        user_model = self._user_model
+        main_window = self._main_window
         
         if not anki_model or not user_model:
             return
             
         try:
             # Check if Anki is enabled and connected
-            anki_enabled = user_model.get_setting('anki_enabled', False)
+            anki_enabled, deck_name, note_type, note_types, tags = self._get_anki_settings()
             if not anki_enabled:
                 if main_window:
                     main_window.set_status_message("Anki integration is not enabled")
                 return
                 
             # Test connection
-            connected = anki_model.test_connection()
+            connected = self._anki_connected()
             if not connected:
                 if main_window:
                     main_window.set_status_message("Cannot connect to Anki")
@@ -380,30 +511,17 @@ class EntryController(BaseController):
                 
             example = examples[example_index]
             
-            # Get Anki settings
-            deck_name = user_model.get_setting('default_deck', 'Language Learning')
-            note_type = user_model.get_setting('default_note_type', 'Example-Based')
-            
-            note_types = user_model.get_setting('note_types', {})
+            # Use the note type's own field mappings and deck when configured
             if note_type in note_types:
                 note_config = note_types[note_type]
                 field_mappings = note_config.get('field_mappings', {})
                 deck_name = note_config.get('deck', deck_name)
             else:
-                field_mappings = {
-                    'Word': 'headword',
-                    'Definition': 'selected_meaning.definition',
-                    'Example': 'selected_example.sentence',
-                    'Translation': 'selected_example.translation'
-                }
+                field_mappings = self._DEFAULT_FIELD_MAPPINGS
                 
-            # Prepare enriched entry with selected meaning and example
-            enriched_entry = self.current_entry.copy()
-            enriched_entry['selected_meaning'] = meaning
-            enriched_entry['selected_example'] = example
-            
-            # Add tags
-            tags = user_model.get_setting('tags', ['AI-Dictionary'])
+            # Layer the selected meaning and example over the entry without copying it
+            enriched_entry = ChainMap({'selected_meaning': meaning, 'selected_example': example},
+                                      self.current_entry)
             
             # Create note
             note_id = anki_model.create_note(
@@ -423,31 +541,22 @@ class EntryController(BaseController):
                     main_window.set_status_message("Failed to export example to Anki")
                     
         except Exception as e:
-            if self.event_bus:
-                self.event_bus.publish('error:anki_export', {
-                    'message': f"Error exporting to Anki: {str(e)}"
-                })
-                
-            if main_window:
-                main_window.set_status_message(f"Error exporting to Anki: {str(e)}")
+            self._report_error('anki_export', e)
     
     def delete_entry(self):
         """Delete the current dictionary entry."""
         if not self.current_entry or not self.current_headword:
             return
             
-        dictionary_model = self.get_model('dictionary')
-        main_window = self.get_view('main_window')
+        dictionary_model = self._dictionary_model
+        main_window = self._main_window
         
         if not dictionary_model:
             return
             
         try:
-            # Get metadata from current entry
-            metadata = self.current_entry.get('metadata', {})
-            target_language = metadata.get('target_language')
-            source_language = metadata.get('source_language')
-            definition_language = metadata.get('definition_language')
+            # Get the languages of the current entry
+            target_language, source_language, definition_language = self._current_langs
             
             # Delete the entry
             success = dictionary_model.delete_entry(
@@ -459,42 +568,50 @@ class EntryController(BaseController):
             
             if success:
                 # Clear display
+                headword = self.current_headword
                 self.clear_display()
                 
                 if main_window:
-                    main_window.set_status_message(f"Deleted entry for '{self.current_headword}'")
+                    main_window.set_status_message(f"Deleted entry for '{headword}'")
                     
-                # Notify that entry was deleted
-                if self.event_bus:
-                    self.event_bus.publish('entry:deleted', {
-                        'headword': self.current_headword
-                    })
-                    
-                # Request filter refresh
-                if self.event_bus:
-                    self.event_bus.publish('search_filter:changed', {
-                        'filter_text': ''  # Refresh all entries
-                    })
+                # The dictionary model publishes entry:deleted, which also
+                # refreshes the search results
             else:
                 if main_window:
                     main_window.set_status_message(f"Failed to delete entry for '{self.current_headword}'")
                     
         except Exception as e:
-            if self.event_bus:
-                self.event_bus.publish('error:entry_deletion', {
-                    'message': f"Error deleting entry: {str(e)}"
-                })
-                
-            if main_window:
-                main_window.set_status_message(f"Error deleting entry: {str(e)}")
+            self._report_error('entry_deletion', e)
+    
+    def _report_error(self, kind: str, error: Any, *, clear_loading: bool = False, **details):
+        """
+        Report a failed entry operation.
+        
+        Publishes an 'error:<kind>' event and shows the error in the status bar.
+        
+        Args:
+            kind: The kind of error, a key of _ERROR_MESSAGES
+            error: The error that occurred
+            clear_loading: Whether to reset the entry display's loading state
+            **details: Additional event data
+        """
+        message = f"{self._ERROR_MESSAGES[kind]}: {error}"
+        
+        if self.event_bus:
+            self.event_bus.publish(f'error:{kind}', {'message': message, **details})
+            
+        main_window = self._main_window
+        if main_window:
+            main_window.set_status_message(message)
+            
+        entry_display = self._entry_display
+        if clear_loading and entry_display:
+            entry_display.set_loading_state(False)
     
     # Event handlers
     
-    def _on_entry_displayed(self, data: Optional[Dict[str, Any]] = None):
+    def _on_entry_displayed(self, data: Dict[str, Any]):
         """Handle entry displayed event."""
-        if not data:
-            return
-            
         # Extract entry data
         headword = data.get('headword', '')
         entry_id = data.get('entry_id')
@@ -503,19 +620,13 @@ class EntryController(BaseController):
         self.current_headword = headword
         # Note: We don't update current_entry here because we don't have the full entry
     
-    def _on_entry_display_cleared(self, data: Optional[Dict[str, Any]] = None):
+    def _on_entry_display_cleared(self, data: Dict[str, Any]):
         """Handle entry display cleared event."""
         # Reset internal state
-        self.current_entry = None
-        self.current_headword = None
-        self.focused_meaning_index = -1
-        self.focused_example_index = -1
+        self._reset_state()
     
-    def _on_meaning_focused(self, data: Optional[Dict[str, Any]] = None):
+    def _on_meaning_focused(self, data: Dict[str, Any]):
         """Handle meaning focused event."""
-        if not data:
-            return
-            
         # Extract focus data
         meaning_index = data.get('meaning_index', -1)
         
@@ -523,11 +634,8 @@ class EntryController(BaseController):
         self.focused_meaning_index = meaning_index
         self.focused_example_index = -1
     
-    def _on_example_focused(self, data: Optional[Dict[str, Any]] = None):
+    def _on_example_focused(self, data: Dict[str, Any]):
         """Handle example focused event."""
-        if not data:
-            return
-            
         # Extract focus data
         meaning_index = data.get('meaning_index', -1)
         example_index = data.get('example_index', -1)
@@ -536,76 +644,38 @@ class EntryController(BaseController):
         self.focused_meaning_index = meaning_index
         self.focused_example_index = example_index
     
-    def _on_regenerate_requested(self, data: Optional[Dict[str, Any]] = None):
-        """Handle regenerate entry request event."""
-        if not data:
-            return
-            
-        # Extract entry data
-        entry = data.get('entry')
+    def _on_action_requested(self, event_name: str, data: Dict[str, Any]):
+        """
+        Handle an entry action request event.
         
-        if entry:
-            # Update current entry
-            self.current_entry = entry
-            self.current_headword = entry.get('headword', '')
-            
-        # Regenerate the entry
-        self.regenerate_entry()
-    
-    def _on_export_requested(self, data: Optional[Dict[str, Any]] = None):
-        """Handle export entry request event."""
-        if not data:
-            return
-            
+        Args:
+            event_name: The request event, a key of _ACTION_REQUESTS
+            data: Event data, optionally with the 'entry' to act on
+        """
         # Extract entry data
         entry = data.get('entry')
         
         if entry:
             # Update current entry
-            self.current_entry = entry
-            self.current_headword = entry.get('headword', '')
-            
-        # Export the entry
-        self.export_entry()
-    
-    def _on_export_example_requested(self, data: Optional[Dict[str, Any]] = None):
-        """Handle export example request event."""
-        if not data:
-            return
-            
-        # Extract entry and example data
-        entry = data.get('entry')
-        meaning_index = data.get('meaning_index', -1)
-        example_index = data.get('example_index', -1)
-        
-        if entry:
-            # Update current entry
-            self.current_entry = entry
-            self.current_headword = entry.get('headword', '')
-            
-        # Export the example
-        self.export_example(meaning_index, example_index)
+            self._set_current_entry(entry)
+            
+        # Perform the action
+        action = getattr(self, self._ACTION_REQUESTS[event_name])
+        if event_name == 'entry:export_example_requested':
+            action(data.get('meaning_index', -1), data.get('example_index', -1))
+        else:
+            action()
     
-    def _on_delete_requested(self, data: Optional[Dict[str, Any]] = None):
-        """Handle delete entry request event."""
-        if not data:
-            return
-            
-        # Extract entry data
-        entry = data.get('entry')
-        
-        if entry:
-            # Update current entry
-            self.current_entry = entry
-            self.current_headword = entry.get('headword', '')
-            
-        # Delete the entry
-        self.delete_entry()
+    def _on_settings_updated(self, data: Dict[str, Any]):
+        """Handle settings updated event."""
+        # Read the Anki settings and test the connection again on the next export
+        self._anki_settings = None
+        self._anki_connected_at = None
     
-    def _on_entry_copied(self, data: Optional[Dict[str, Any]] = None):
+    def _on_entry_copied(self, data: Dict[str, Any]):
         """Handle entry copied event."""
-        main_window = self.get_view('main_window')
+        main_window = self._main_window
         
-        if main_window and data and 'headword' in data:
+        if main_window and 'headword' in data:
             headword = data.get('headword', '')
             main_window.set_status_message(f"Entry for '{headword}' copied to clipboard")
\ No newline at end of file
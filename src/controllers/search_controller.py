@@ -5,10 +5,16 @@ This module provides the search controller, which manages all search operations
 including word lookup, filtering, history, and language selection.
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+import functools
+import string
+import threading
+from typing import Dict, Any, Optional, List, Tuple, Callable
 
 from .base_controller import BaseController
 
+# SQLite's LIKE ignores case for ASCII letters only
+_LIKE_CASE_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
 class SearchController(BaseController):
     """
     Controller for search operations.
@@ -20,9 +26,26 @@ class SearchController(BaseController):
         models: Dictionary of models accessible to the controller
         views: Dictionary of views accessible to the controller
         event_bus: Event system for controller-related notifications
-        filtered_entries: Currently filtered list of dictionary entries
+        filtered_headwords: Headwords of the currently filtered dictionary entries
     """
     
+    # Fixed per-instance state; BaseController keeps an instance __dict__
+    # because its log_* helpers are bound per instance
+    __slots__ = (
+        'filtered_headwords', 'current_search_term', 'current_filter_text',
+        'current_language_filters',
+        '_dictionary_model', '_user_model', '_request_service', '_async_service',
+        '_main_window', '_entry_display', '_search_panel', '_language_filter',
+        '_filter_timer_id', '_filter_generation', '_filter_base',
+        '_inflight_lookups', '_inflight_lock',
+    )
+    
+    # Milliseconds to wait after the last filter change before refreshing entries
+    _FILTER_DEBOUNCE_MS = 150
+    
+    # Maximum number of headwords requested per filter search
+    _FILTER_RESULT_LIMIT = 50
+    
     def __init__(self, models=None, views=None, event_bus=None):
         """
         Initialize the search controller.
@@ -35,7 +58,7 @@ class SearchController(BaseController):
         super().__init__(models, views, event_bus)
         
         # Internal state
-        self.filtered_entries = []
+        self.filtered_headwords = []
         self.current_search_term = ""
         self.current_filter_text = ""
         self.current_language_filters = {
@@ -43,6 +66,28 @@ class SearchController(BaseController):
             'definition_language': None
         }
         
+        # Handles to the models and views this controller uses, looked up once
+        self._dictionary_model = self.get_model('dictionary')
+        self._user_model = self.get_model('user')
+        self._request_service = self.get_model('request_service')
+        self._async_service = self.get_model('async_service')
+        self._main_window = self.get_view('main_window')
+        self._entry_display = self.get_view('entry_display')
+        self._search_panel = self.get_view('search_panel')
+        self._language_filter = self.get_view('language_filter')
+        
+        # Pending Tk timer for a debounced filter refresh
+        self._filter_timer_id = None
+        # Incremented for each refresh so results of superseded refreshes are dropped
+        self._filter_generation = 0
+        # (filters, headwords) of the last filter search run against the database
+        self._filter_base = None
+        
+        # (found, error) callbacks waiting on each entry lookup in flight; replies
+        # arrive on the async service's worker threads, hence the lock
+        self._inflight_lookups: Dict[Tuple[Optional[str], ...], List[Tuple[Callable, Callable]]] = {}
+        self._inflight_lock = threading.Lock()
+        
         # Initial data loading
         self._load_initial_data()
     
@@ -61,6 +106,11 @@ class SearchController(BaseController):
         self.register_event_handler('language_filter:changed', self._on_language_filter_changed)
         self.register_event_handler('search_filter:changed', self._on_search_filter_changed)
         
+        # Entry events
+        self.register_event_handler('entry:deleted', self._on_entry_deleted)
+        self.register_event_handler('entry:saved', self._on_entries_saved)
+        self.register_event_handler('entries:saved', self._on_entries_saved)
+        
         # Clipboard events
         self.register_event_handler('clipboard:monitoring_changed', self._on_clipboard_monitoring_changed)
     
@@ -74,8 +124,8 @@ class SearchController(BaseController):
     
     def _apply_language_preferences(self):
         """Apply language preferences from user settings."""
-        user_model = self.get_model('user')
-        language_filter = self.get_view('language_filter')
+        user_model = self._user_model
+        language_filter = self._language_filter
         
         if not user_model or not language_filter:
             return
@@ -95,10 +145,10 @@ class SearchController(BaseController):
     
     def _refresh_filtered_entries(self):
         """Refresh the filtered entries list based on current filters."""
-        dictionary_model = self.get_model('dictionary')
-        language_filter = self.get_view('language_filter')
-        main_window = self.get_view('main_window')
-        async_service = self.get_model('async_service')
+        dictionary_model = self._dictionary_model
+        language_filter = self._language_filter
+        main_window = self._main_window
+        async_service = self._async_service
         
         if not dictionary_model or not language_filter or not async_service:
             return
@@ -107,6 +157,9 @@ class SearchController(BaseController):
         if main_window:
             main_window.set_status_message("Loading entries...")
             
+        self._filter_generation += 1
+        generation = self._filter_generation
+            
         try:
             # Prepare search filters
             filters = {
@@ -115,26 +168,25 @@ class SearchController(BaseController):
                 'definition_language': self.current_language_filters.get('definition_language')
             }
             
-            # Define callbacks
-            def on_search_success(entries):
-                # Update filtered entries
-                self.filtered_entries = entries
-                
-                # Update language filter view with filtered entries
-                language_filter.update_headword_list(self.filtered_entries)
+            # Narrow the last search result in memory when it already holds every match
+            narrowed = self._narrow_filtered_entries(filters)
+            if narrowed is not None:
+                self._show_filtered_entries(narrowed, filters)
+                return
                 
-                # Notify of filter update
-                if self.event_bus:
-                    self.event_bus.publish('search:filter_updated', {
-                        'count': len(self.filtered_entries),
-                        'filters': filters
-                    })
+            # Define callbacks
+            def on_search_success(headwords):
+                # Ignore results of a refresh that has been superseded
+                if generation != self._filter_generation:
+                    return
                     
-                # Update status message
-                if main_window:
-                    main_window.set_status_message(f"Found {len(entries)} entries")
+                self._filter_base = (filters, headwords)
+                self._show_filtered_entries(headwords, filters)
             
             def on_search_error(error):
+                if generation != self._filter_generation:
+                    return
+                    
                 # Notify of error
                 if self.event_bus:
                     self.event_bus.publish('error:search', {
@@ -145,11 +197,13 @@ class SearchController(BaseController):
                 if main_window:
                     main_window.set_status_message(f"Error loading entries: {error}")
             
-            # Get filtered entries asynchronously
-            dictionary_model.search_entries_async(
+            # Get the headwords of the filtered entries asynchronously; full
+            # entries are loaded when a headword is selected
+            dictionary_model.search_headwords_async(
                 filters,
                 on_search_success,
-                on_search_error
+                on_search_error,
+                limit=self._FILTER_RESULT_LIMIT
             )
                 
         except Exception as e:
@@ -162,6 +216,73 @@ class SearchController(BaseController):
             if main_window:
                 main_window.set_status_message(f"Error filtering entries: {str(e)}")
     
+    def _narrow_filtered_entries(self, filters: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Filter the last search result in memory instead of searching the database.
+        
+        This is possible when only the filter text changed, the new text contains
+        the previous text, and the previous result was not cut off at the result
+        limit, since every headword containing the new text then contains the
+        previous text too.
+        
+        Args:
+            filters: The search filters to apply
+            
+        Returns:
+            The matching headwords, or None if the database has to be searched
+        """
+        if self._filter_base is None:
+            return None
+            
+        base_filters, base_headwords = self._filter_base
+        search_term = filters['search_term']
+        base_term = base_filters['search_term']
+        
+        if (len(base_headwords) >= self._FILTER_RESULT_LIMIT
+                or search_term == base_term
+                or '%' in search_term or '_' in search_term
+                or base_filters['target_language'] != filters['target_language']
+                or base_filters['definition_language'] != filters['definition_language']):
+            return None
+            
+        folded_term = search_term.translate(_LIKE_CASE_FOLD)
+        if base_term.translate(_LIKE_CASE_FOLD) not in folded_term:
+            return None
+            
+        return [
+            headword for headword in base_headwords
+            if folded_term in headword.translate(_LIKE_CASE_FOLD)
+        ]
+    
+    def _show_filtered_entries(self, headwords: List[str], filters: Dict[str, Any]):
+        """
+        Show the headwords of the entries matching the current filters.
+        
+        Args:
+            headwords: The matching headwords
+            filters: The search filters that were applied
+        """
+        language_filter = self._language_filter
+        main_window = self._main_window
+        
+        # Update filtered headwords
+        self.filtered_headwords = headwords
+        
+        # Update language filter view with filtered headwords
+        if language_filter:
+            language_filter.update_headword_list(self.filtered_headwords)
+        
+        # Notify of filter update
+        if self.event_bus:
+            self.event_bus.publish('search:filter_updated', {
+                'count': len(self.filtered_headwords),
+                'filters': filters
+            })
+            
+        # Update status message
+        if main_window:
+            main_window.set_status_message(f"Found {len(headwords)} entries")
+    
     def search_word(self, word: str, context: Optional[str] = None):
         """
         Search for a word in the dictionary.
@@ -170,11 +291,11 @@ class SearchController(BaseController):
             word: Word to search for
             context: Optional context sentence
         """
-        dictionary_model = self.get_model('dictionary')
-        user_model = self.get_model('user')
-        request_service = self.get_model('request_service')
-        entry_display = self.get_view('entry_display')
-        main_window = self.get_view('main_window')
+        dictionary_model = self._dictionary_model
+        user_model = self._user_model
+        request_service = self._request_service
+        entry_display = self._entry_display
+        main_window = self._main_window
         
         if not dictionary_model or not user_model or not request_service:
             return
@@ -200,58 +321,16 @@ class SearchController(BaseController):
             if not definition_language:
                 definition_language = user_model.get_setting('definition_language')
                 
-            # Define callbacks for entry lookup
-            def on_entry_found(entry):
-                if entry:
-                    # Entry exists, display it
-                    if entry_display:
-                        entry_display.display_entry(entry)
-                        
-                    if main_window:
-                        main_window.set_status_message(f"Found existing entry for '{word}'")
-                        
-                    # Add to recent lookups
-                    user_model.add_recent_lookup(word, target_language, definition_language)
-                    
-                    # Update search history in view
-                    search_panel = self.get_view('search_panel')
-                    if search_panel:
-                        search_panel.update_history_list(user_model.get_recent_lookups())
-                        
-                    # Reset loading state since we're done
-                    if entry_display:
-                        entry_display.set_loading_state(False)
-                else:
-                    # Entry doesn't exist, need to create it
-                    if main_window:
-                        main_window.set_status_message(f"Creating new entry for '{word}'...")
-                        
-                    # Start with lemmatization request
-                    self._start_lemmatization(word, context, target_language, definition_language)
-            
-            def on_entry_error(error):
-                if main_window:
-                    main_window.set_status_message(f"Error looking up '{word}': {error}")
-                    
-                # Reset loading state
-                if entry_display:
-                    entry_display.set_loading_state(False)
-                    
-                if self.event_bus:
-                    self.event_bus.publish('error:search', {
-                        'message': f"Error looking up word: {error}"
-                    })
-            
             # Check if entry already exists in database (asynchronously)
-            dictionary_model.get_entry_by_headword_async(
+            self._lookup_entry(
                 word, 
                 target_language, 
-                definition_language, 
                 definition_language,
-                on_entry_found,
-                on_entry_error
+                definition_language,
+                functools.partial(self._on_search_entry_found, word, context, target_language, definition_language),
+                functools.partial(self._on_search_entry_error, word)
             )
-                
+            
         except Exception as e:
             # Handle error
             if self.event_bus:
@@ -266,9 +345,151 @@ class SearchController(BaseController):
             if entry_display:
                 entry_display.set_loading_state(False)
     
+    def _lookup_entry(
+        self, 
+        headword: str, 
+        target_language: Optional[str],
+        source_language: Optional[str],
+        definition_language: Optional[str],
+        on_found: Callable,
+        on_error: Callable
+    ):
+        """
+        Look up an entry asynchronously, joining an identical lookup already in flight.
+        
+        Args:
+            headword: The headword to look up
+            target_language: Target language filter
+            source_language: Source language filter
+            definition_language: Definition language filter
+            on_found: Function to call with the entry, or None if there is none
+            on_error: Function to call with the error message on failure
+        """
+        key = (headword, target_language, source_language, definition_language)
+        with self._inflight_lock:
+            waiting = self._inflight_lookups.get(key)
+            if waiting is not None:
+                waiting.append((on_found, on_error))
+                return
+            self._inflight_lookups[key] = [(on_found, on_error)]
+            
+        try:
+            self._dictionary_model.get_entry_by_headword_async(
+                headword, 
+                target_language, 
+                source_language, 
+                definition_language,
+                functools.partial(self._on_lookup_done, key, 0),
+                functools.partial(self._on_lookup_done, key, 1)
+            )
+        except Exception:
+            with self._inflight_lock:
+                self._inflight_lookups.pop(key, None)
+            raise
+    
+    def _on_lookup_done(self, key: Tuple[Optional[str], ...], outcome: int, result: Any):
+        """
+        Pass the result of an entry lookup to every caller waiting on it.
+        
+        Args:
+            key: The lookup's (headword, target, source, definition) key
+            outcome: 0 if the lookup succeeded, 1 if it failed
+            result: The entry or the error message
+        """
+        with self._inflight_lock:
+            waiting = self._inflight_lookups.pop(key, ())
+            
+        for callbacks in waiting:
+            try:
+                callbacks[outcome](result)
+            except Exception as e:
+                self.log_error(f"Error handling entry lookup for '{key[0]}'", exc_info=True, error=str(e))
+    
+    def _on_search_entry_found(
+        self, 
+        word: str,
+        context: Optional[str],
+        target_language: str,
+        definition_language: str,
+        entry: Optional[Dict[str, Any]]
+    ):
+        """
+        Handle the result of looking up a searched word.
+        
+        Args:
+            word: The word that was searched for
+            context: Optional context sentence
+            target_language: Target language
+            definition_language: Definition language
+            entry: The existing entry, or None if the word has no entry yet
+        """
+        entry_display = self._entry_display
+        main_window = self._main_window
+        
+        if entry:
+            # Entry exists, display it
+            if entry_display:
+                entry_display.display_entry(entry)
+                
+            if main_window:
+                main_window.set_status_message(f"Found existing entry for '{word}'")
+                
+            # Add to recent lookups and update search history in view
+            self._add_recent_lookup(word, target_language, definition_language)
+            
+            # Reset loading state since we're done
+            if entry_display:
+                entry_display.set_loading_state(False)
+        else:
+            # Entry doesn't exist, need to create it
+            if main_window:
+                main_window.set_status_message(f"Creating new entry for '{word}'...")
+                
+            # Start with lemmatization request
+            self._start_lemmatization(word, context, target_language, definition_language)
+    
+    def _on_search_entry_error(self, word: str, error: Any):
+        """
+        Handle a failed lookup of a searched word.
+        
+        Args:
+            word: The word that was searched for
+            error: The error reported by the dictionary model
+        """
+        main_window = self._main_window
+        entry_display = self._entry_display
+        
+        if main_window:
+            main_window.set_status_message(f"Error looking up '{word}': {error}")
+            
+        # Reset loading state
+        if entry_display:
+            entry_display.set_loading_state(False)
+            
+        if self.event_bus:
+            self.event_bus.publish('error:search', {
+                'message': f"Error looking up word: {error}"
+            })
+    
+    def _add_recent_lookup(self, word: str, target_language: str, definition_language: str):
+        """
+        Add a word to the recent lookups and show the updated search history.
+        
+        Args:
+            word: The word that was looked up
+            target_language: Target language
+            definition_language: Definition language
+        """
+        user_model = self._user_model
+        user_model.add_recent_lookup(word, target_language, definition_language)
+        
+        search_panel = self._search_panel
+        if search_panel:
+            search_panel.update_history_list(user_model.get_recent_lookups())
+    
     def _start_lemmatization(
         self, 
-        word: str, 
+        word: str,
         context: Optional[str],
         target_language: str,
         definition_language: str
@@ -282,8 +503,8 @@ class SearchController(BaseController):
             target_language: Target language
             definition_language: Definition language
         """
-        request_service = self.get_model('request_service')
-        main_window = self.get_view('main_window')
+        request_service = self._request_service
+        main_window = self._main_window
         
         if not request_service:
             return
@@ -292,28 +513,63 @@ class SearchController(BaseController):
         if main_window:
             main_window.set_status_message(f"Getting lemma for '{word}'...")
             
-        # Define success and error callbacks
-        def on_lemma_success(lemma):
-            # Proceed to entry creation with the lemmatized word
-            self._start_entry_creation(lemma, context, target_language, definition_language)
-            
-        def on_lemma_error(error):
-            # Log the error
-            if self.event_bus:
-                self.event_bus.publish('error:lemmatization', {
-                    'message': f"Error getting lemma: {error}",
-                    'word': word
-                })
-                
-            # Continue with the original word if lemmatization fails
-            self._start_entry_creation(word, context, target_language, definition_language)
-            
-        # Request lemmatization
-        request_service.get_lemma(word, context, on_lemma_success, on_lemma_error)
+        # Request lemmatization, proceeding to entry creation with the lemma
+        request_service.get_lemma(
+            word, 
+            context,
+            functools.partial(self._on_lemma_success, context, target_language, definition_language),
+            functools.partial(self._on_lemma_error, word, context, target_language, definition_language)
+        )
+    
+    def _on_lemma_success(
+        self, 
+        context: Optional[str],
+        target_language: str,
+        definition_language: str,
+        lemma: str
+    ):
+        """
+        Create an entry for the lemma of a searched word.
+        
+        Args:
+            context: Optional context sentence
+            target_language: Target language
+            definition_language: Definition language
+            lemma: The lemmatized word
+        """
+        self._start_entry_creation(lemma, context, target_language, definition_language)
+    
+    def _on_lemma_error(
+        self, 
+        word: str,
+        context: Optional[str],
+        target_language: str,
+        definition_language: str,
+        error: Any
+    ):
+        """
+        Handle a failed lemmatization request.
+        
+        Args:
+            word: The word that failed to lemmatize
+            context: Optional context sentence
+            target_language: Target language
+            definition_language: Definition language
+            error: The error reported by the request service
+        """
+        # Log the error
+        if self.event_bus:
+            self.event_bus.publish('error:lemmatization', {
+                'message': f"Error getting lemma: {error}",
+                'word': word
+            })
+            
+        # Continue with the original word if lemmatization fails
+        self._start_entry_creation(word, context, target_language, definition_language)
     
     def _start_entry_creation(
         self, 
-        word: str, 
+        word: str,
         context: Optional[str],
         target_language: str,
         definition_language: str
@@ -327,9 +583,9 @@ class SearchController(BaseController):
             target_language: Target language
             definition_language: Definition language
         """
-        request_service = self.get_model('request_service')
-        user_model = self.get_model('user')
-        main_window = self.get_view('main_window')
+        request_service = self._request_service
+        user_model = self._user_model
+        main_window = self._main_window
         
         if not request_service or not user_model:
             return
@@ -338,58 +594,61 @@ class SearchController(BaseController):
         if main_window:
             main_window.set_status_message(f"Creating dictionary entry for '{word}'...")
             
-        # Define success and error callbacks
-        def on_entry_success(entry):
-            # Process the new entry
-            self._handle_new_entry(entry, word, target_language, definition_language)
-            
-        def on_entry_error(error):
-            # Log the error
-            if self.event_bus:
-                self.event_bus.publish('error:entry_creation', {
-                    'message': f"Error creating entry: {error}",
-                    'word': word
-                })
-                
-            # Update UI
-            if main_window:
-                main_window.set_status_message(f"Error creating entry for '{word}': {error}")
-                
-            # Reset loading state
-            entry_display = self.get_view('entry_display')
-            if entry_display:
-                entry_display.set_loading_state(False)
-                
         # Request entry creation
         request_service.create_entry(
             word, 
             target_language, 
             definition_language, 
             context,
-            on_entry_success,
-            on_entry_error
+            functools.partial(self._handle_new_entry, word, target_language, definition_language),
+            functools.partial(self._on_entry_creation_error, word)
         )
     
+    def _on_entry_creation_error(self, word: str, error: Any):
+        """
+        Handle a failed entry creation request.
+        
+        Args:
+            word: The word the entry was being created for
+            error: The error reported by the request service
+        """
+        # Log the error
+        if self.event_bus:
+            self.event_bus.publish('error:entry_creation', {
+                'message': f"Error creating entry: {error}",
+                'word': word
+            })
+            
+        # Update UI
+        main_window = self._main_window
+        if main_window:
+            main_window.set_status_message(f"Error creating entry for '{word}': {error}")
+            
+        # Reset loading state
+        entry_display = self._entry_display
+        if entry_display:
+            entry_display.set_loading_state(False)
+    
     def _handle_new_entry(
         self, 
-        entry: Dict[str, Any],
         word: str,
         target_language: str,
-        definition_language: str
+        definition_language: str,
+        entry: Dict[str, Any]
     ):
         """
         Handle a newly created dictionary entry.
         
         Args:
-            entry: The new dictionary entry
             word: The word that was looked up
             target_language: Target language
             definition_language: Definition language
+            entry: The new dictionary entry
         """
-        dictionary_model = self.get_model('dictionary')
-        user_model = self.get_model('user')
-        entry_display = self.get_view('entry_display')
-        main_window = self.get_view('main_window')
+        dictionary_model = self._dictionary_model
+        user_model = self._user_model
+        entry_display = self._entry_display
+        main_window = self._main_window
         
         if not dictionary_model or not user_model:
             return
@@ -401,43 +660,13 @@ class SearchController(BaseController):
                     main_window.set_status_message(f"Failed to create entry for '{word}'")
                 return
                 
-            # Define callbacks for saving entry
-            def on_save_success(entry_id):
-                if entry_id:
-                    # Display the new entry
-                    if entry_display:
-                        entry_display.display_entry(entry)
-                        
-                    if main_window:
-                        main_window.set_status_message(f"Created new entry for '{word}'")
-                        
-                    # Add to recent lookups
-                    user_model.add_recent_lookup(word, target_language, definition_language)
-                    
-                    # Update search history in view
-                    search_panel = self.get_view('search_panel')
-                    if search_panel:
-                        search_panel.update_history_list(user_model.get_recent_lookups())
-                        
-                    # Refresh filtered entries
-                    self._refresh_filtered_entries()
-                else:
-                    if main_window:
-                        main_window.set_status_message(f"Failed to save entry for '{word}'")
-            
-            def on_save_error(error):
-                if main_window:
-                    main_window.set_status_message(f"Error saving entry for '{word}': {error}")
-                    
-                if self.event_bus:
-                    self.event_bus.publish('error:entry_saving', {
-                        'message': f"Error saving entry: {error}",
-                        'word': word
-                    })
-            
             # Save to database asynchronously
-            dictionary_model.save_entry_async(entry, on_save_success, on_save_error)
-                    
+            dictionary_model.save_entry_async(
+                entry,
+                functools.partial(self._on_new_entry_saved, entry, word, target_language, definition_language),
+                functools.partial(self._on_new_entry_save_error, word)
+            )
+            
         except Exception as e:
             if self.event_bus:
                 self.event_bus.publish('error:entry_processing', {
@@ -452,6 +681,62 @@ class SearchController(BaseController):
             if entry_display:
                 entry_display.set_loading_state(False)
     
+    def _on_new_entry_saved(
+        self, 
+        entry: Dict[str, Any],
+        word: str,
+        target_language: str,
+        definition_language: str,
+        entry_id: Optional[int]
+    ):
+        """
+        Handle the result of saving a newly created entry.
+        
+        Args:
+            entry: The new dictionary entry
+            word: The word that was looked up
+            target_language: Target language
+            definition_language: Definition language
+            entry_id: ID of the saved entry, or None if it was not saved
+        """
+        entry_display = self._entry_display
+        main_window = self._main_window
+        
+        if entry_id:
+            # Display the new entry
+            if entry_display:
+                entry_display.display_entry(entry)
+                
+            if main_window:
+                main_window.set_status_message(f"Created new entry for '{word}'")
+                
+            # Add to recent lookups and update search history in view
+            self._add_recent_lookup(word, target_language, definition_language)
+            
+            # Refresh filtered entries
+            self._refresh_filtered_entries()
+        else:
+            if main_window:
+                main_window.set_status_message(f"Failed to save entry for '{word}'")
+    
+    def _on_new_entry_save_error(self, word: str, error: Any):
+        """
+        Handle a failed save of a newly created entry.
+        
+        Args:
+            word: The word that was looked up
+            error: The error reported by the dictionary model
+        """
+        main_window = self._main_window
+        if main_window:
+            main_window.set_status_message(f"Error saving entry for '{word}': {error}")
+            
+        if self.event_bus:
+            self.event_bus.publish('error:entry_saving', {
+                'message': f"Error saving entry: {error}",
+                'word': word
+            })
+    
     def select_headword(self, headword: str):
         """
         Select and display a headword from the filtered list.
@@ -459,9 +744,9 @@ class SearchController(BaseController):
         Args:
             headword: Headword to select
         """
-        dictionary_model = self.get_model('dictionary')
-        entry_display = self.get_view('entry_display')
-        main_window = self.get_view('main_window')
+        dictionary_model = self._dictionary_model
+        entry_display = self._entry_display
+        main_window = self._main_window
         
         if not dictionary_model or not entry_display:
             return
@@ -477,44 +762,16 @@ class SearchController(BaseController):
             target_language = self.current_language_filters.get('target_language')
             definition_language = self.current_language_filters.get('definition_language')
             
-            # Define callbacks for entry lookup
-            def on_entry_found(entry):
-                if entry:
-                    # Display the entry
-                    entry_display.display_entry(entry)
-                    
-                    if main_window:
-                        main_window.set_status_message(f"Loaded entry for '{headword}'")
-                else:
-                    if main_window:
-                        main_window.set_status_message(f"Entry not found for '{headword}'")
-                        
-                # Reset loading state
-                entry_display.set_loading_state(False)
-            
-            def on_entry_error(error):
-                if main_window:
-                    main_window.set_status_message(f"Error loading entry for '{headword}': {error}")
-                    
-                if self.event_bus:
-                    self.event_bus.publish('error:entry_selection', {
-                        'message': f"Error loading entry: {error}",
-                        'headword': headword
-                    })
-                    
-                # Reset loading state
-                entry_display.set_loading_state(False)
-            
             # Get the entry asynchronously
-            dictionary_model.get_entry_by_headword_async(
+            self._lookup_entry(
                 headword, 
                 target_language, 
                 None, 
                 definition_language,
-                on_entry_found,
-                on_entry_error
+                functools.partial(self._on_selected_entry_found, headword),
+                functools.partial(self._on_selected_entry_error, headword)
             )
-                    
+            
         except Exception as e:
             if self.event_bus:
                 self.event_bus.publish('error:entry_selection', {
@@ -528,6 +785,50 @@ class SearchController(BaseController):
             # Reset loading state
             entry_display.set_loading_state(False)
     
+    def _on_selected_entry_found(self, headword: str, entry: Optional[Dict[str, Any]]):
+        """
+        Handle the result of looking up a selected headword.
+        
+        Args:
+            headword: The selected headword
+            entry: The entry, or None if it was not found
+        """
+        entry_display = self._entry_display
+        main_window = self._main_window
+        
+        if entry:
+            # Display the entry
+            entry_display.display_entry(entry)
+            
+            if main_window:
+                main_window.set_status_message(f"Loaded entry for '{headword}'")
+        else:
+            if main_window:
+                main_window.set_status_message(f"Entry not found for '{headword}'")
+                
+        # Reset loading state
+        entry_display.set_loading_state(False)
+    
+    def _on_selected_entry_error(self, headword: str, error: Any):
+        """
+        Handle a failed lookup of a selected headword.
+        
+        Args:
+            headword: The selected headword
+            error: The error reported by the dictionary model
+        """
+        main_window = self._main_window
+        if main_window:
+            main_window.set_status_message(f"Error loading entry for '{headword}': {error}")
+            
+        if self.event_bus:
+            self.event_bus.publish('error:entry_selection', {
+                'message': f"Error loading entry: {error}",
+                'headword': headword
+            })
+            
+        # Reset loading state
+        self._entry_display.set_loading_state(False)
     # Event handlers
     
     def _on_search_requested(self, data: Optional[Dict[str, Any]] = None):
@@ -571,7 +872,7 @@ class SearchController(BaseController):
             return
             
         # Get the history item
-        user_model = self.get_model('user')
+        user_model = self._user_model
         if not user_model:
             return
             
@@ -589,7 +890,7 @@ class SearchController(BaseController):
             return
             
         # Update language filters if needed
-        language_filter = self.get_view('language_filter')
+        language_filter = self._language_filter
         if language_filter and target_language and definition_language:
             language_filter.set_language_filters(target_language, definition_language)
             
@@ -604,8 +905,8 @@ class SearchController(BaseController):
     
     def _on_clear_history_requested(self, data: Optional[Dict[str, Any]] = None):
         """Handle clear history request event."""
-        user_model = self.get_model('user')
-        search_panel = self.get_view('search_panel')
+        user_model = self._user_model
+        search_panel = self._search_panel
         
         if not user_model or not search_panel:
             return
@@ -629,7 +930,7 @@ class SearchController(BaseController):
             return
             
         # Update search entry with selected text
-        search_panel = self.get_view('search_panel')
+        search_panel = self._search_panel
         if search_panel:
             search_panel.set_search_term(selected_text)
     
@@ -652,7 +953,7 @@ class SearchController(BaseController):
         self._refresh_filtered_entries()
         
         # Save to user settings
-        user_model = self.get_model('user')
+        user_model = self._user_model
         if user_model:
             settings_to_update = {}
             
@@ -676,9 +977,35 @@ class SearchController(BaseController):
         # Update current filter
         self.current_filter_text = filter_text
         
-        # Refresh filtered entries
+        # Refresh filtered entries once typing pauses, restarting the wait on each change
+        main_window = self._main_window
+        root = getattr(main_window, 'root', None)
+        if not root:
+            self._refresh_filtered_entries()
+            return
+            
+        if self._filter_timer_id is not None:
+            root.after_cancel(self._filter_timer_id)
+        self._filter_timer_id = root.after(self._FILTER_DEBOUNCE_MS, self._on_filter_timer)
+    
+    def _on_filter_timer(self):
+        """Refresh filtered entries after a debounced filter change."""
+        self._filter_timer_id = None
         self._refresh_filtered_entries()
     
+    def _on_entry_deleted(self, data: Optional[Dict[str, Any]] = None):
+        """Handle entry deleted event."""
+        # The last search result may hold the deleted headword, so don't narrow it
+        self._filter_base = None
+        
+        # Drop the deleted entry from the filtered entries
+        self._refresh_filtered_entries()
+    
+    def _on_entries_saved(self, data: Optional[Dict[str, Any]] = None):
+        """Handle entry saved events."""
+        # New entries may match the filters, so the next refresh searches the database
+        self._filter_base = None
+    
     def _on_clipboard_monitoring_changed(self, data: Optional[Dict[str, Any]] = None):
         """Handle clipboard monitoring change event."""
         if not data:
@@ -688,6 +1015,6 @@ class SearchController(BaseController):
         active = data.get('active', False)
         
         # Update user settings
-        user_model = self.get_model('user')
+        user_model = self._user_model
         if user_model:
             user_model.set_setting('monitor_clipboard', active)
\ No newline at end of file
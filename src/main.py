@@ -35,7 +35,6 @@ from src.views.language_filter import LanguageFilterView
 from src.controllers.app_controller import AppController
 from src.controllers.search_controller import SearchController
 from src.controllers.entry_controller import EntryController
-from src.controllers.settings_controller import SettingsController
 
 # Services
 from src.services.anki_service import AnkiService
@@ -114,7 +113,6 @@ def main():
         # Create controllers
         search_controller = SearchController(models, views, event_bus)
         entry_controller = EntryController(models, views, event_bus)
-        settings_controller = SettingsController(models, views, event_bus)
         
         # Create the main app controller
         app_controller = AppController(root, models, views, event_bus)
@@ -122,7 +120,7 @@ def main():
         # Add child controllers to app controller
         app_controller.add_controller('search', search_controller)
         app_controller.add_controller('entry', entry_controller)
-        app_controller.add_controller('settings', settings_controller)
+        # The settings controller is created when settings are first opened
         
         # Start the application
         logger.info("Starting DeepDict UI", "main")
@@ -8,6 +8,8 @@ communication with Anki Connect and managing note creation and synchronization.
 import json
 import urllib.request
 import time
+from collections import ChainMap
+from collections.abc import Mapping
 from typing import Dict, List, Any, Optional, Union, Tuple
 
 from ..utils.type_definitions import DictionaryEntry, AnkiFieldMapping
@@ -251,10 +253,8 @@ class AnkiModel:
                 
             example = examples[example_index]
             
-            # Create enriched entry with selected meaning and example
-            enriched_entry = entry.copy()
-            enriched_entry['selected_meaning'] = meaning
-            enriched_entry['selected_example'] = example
+            # Layer the selected meaning and example over the entry without copying it
+            enriched_entry = ChainMap({'selected_meaning': meaning, 'selected_example': example}, entry)
             
             # Now create the note with the enriched entry
             return self.create_note(
@@ -304,7 +304,7 @@ class AnkiModel:
             
         return fields
     
-    def _get_value_from_path(self, data: Dict, path: str) -> Any:
+    def _get_value_from_path(self, data: Mapping, path: str) -> Any:
         """
         Get a value from a nested dictionary using a dot-notation path.
         
@@ -330,7 +330,7 @@ class AnkiModel:
                         return None
                 else:
                     # Regular dictionary access
-                    if isinstance(current, dict) and part in current:
+                    if isinstance(current, Mapping) and part in current:
                         current = current[part]
                     else:
                         return None
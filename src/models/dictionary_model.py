@@ -6,12 +6,17 @@ retrieval, and manipulation operations.
 """
 
 import json
-from typing import List, Dict, Optional, Any, Union, Callable
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, Union, Callable, Iterator, Tuple, Set
 from datetime import datetime
 
 from ..utils.type_definitions import DictionaryEntry, SearchFilters
 from ..utils.text_processing import normalize_language_name, clean_json_content
 
+# Fields every dictionary entry and its metadata must have
+_REQUIRED_ENTRY_FIELDS = frozenset(('headword', 'metadata', 'meanings'))
+_REQUIRED_METADATA_FIELDS = frozenset(('source_language', 'target_language', 'definition_language'))
+
 class DictionaryModel:
     """
     Model for dictionary entry operations.
@@ -22,7 +27,7 @@ class DictionaryModel:
     
     Attributes:
         db_manager: The database manager for storage operations
-        cached_entries: Dictionary of recently accessed entries
+        cached_entries: Recently accessed entries, least recently used first
         event_bus: Event system for model-related notifications
     """
     
@@ -38,9 +43,8 @@ class DictionaryModel:
         self.db_service = db_service
         self.async_service = async_service
         self.event_bus = event_bus
-        self.cached_entries = {}
+        self.cached_entries = OrderedDict()
         self.max_cache_size = 100
-        self.cache_access_order = []
     
     def get_entry_by_headword(
         self, 
@@ -268,6 +272,104 @@ class DictionaryModel:
             error_callback=on_search_error
         )
     
+    def search_headwords(self, filters: SearchFilters, limit: int = 50) -> List[str]:
+        """
+        Search for the headwords of dictionary entries matching filters.
+        
+        Args:
+            filters: Dictionary of search filters
+            limit: Maximum number of headwords to return
+            
+        Returns:
+            List of matching headwords
+        """
+        search_term = filters.get('search_term', '')
+        headwords = self.db_service.search_headwords(
+            search_term,
+            filters.get('source_language'),
+            filters.get('target_language'),
+            filters.get('definition_language'),
+            limit
+        )
+        
+        # Emit event with results if event bus exists
+        if self.event_bus:
+            self.event_bus.publish('search:completed', {
+                'search_term': search_term,
+                'count': len(headwords),
+                'filters': filters
+            })
+            
+        return headwords
+    
+    def search_headwords_async(self, filters: SearchFilters, callback: Callable = None, error_callback: Callable = None,
+                               limit: int = 50) -> None:
+        """
+        Search for the headwords of dictionary entries asynchronously.
+        
+        Args:
+            filters: Dictionary of search filters
+            callback: Function to call with the headwords on success
+            error_callback: Function to call with error message on failure
+            limit: Maximum number of headwords to return
+        """
+        search_term = filters.get('search_term', '')
+        
+        # Get async service
+        async_service = getattr(self, 'async_service', None)
+        if not async_service:
+            # Fall back to synchronous search if async service not available
+            try:
+                headwords = self.search_headwords(filters, limit)
+                if callback:
+                    callback(headwords)
+            except Exception as e:
+                if error_callback:
+                    error_callback(str(e))
+                elif self.event_bus:
+                    self.event_bus.publish('error:search', {
+                        'message': f'Error in search: {str(e)}'
+                    })
+            return
+            
+        # Define wrapper callbacks
+        def on_search_success(headwords):
+            # Emit event with results
+            if self.event_bus:
+                self.event_bus.publish('search:completed', {
+                    'search_term': search_term,
+                    'count': len(headwords),
+                    'filters': filters
+                })
+                
+            # Call user callback
+            if callback:
+                callback(headwords)
+                
+        def on_search_error(error):
+            # Emit error event
+            if self.event_bus:
+                self.event_bus.publish('error:search', {
+                    'message': f'Error in search: {error}',
+                    'search_term': search_term
+                })
+                
+            # Call user error callback
+            if error_callback:
+                error_callback(error)
+        
+        # Perform async database search
+        self.db_service.search_headwords_async(
+            async_service,
+            search_term, 
+            filters.get('source_language'), 
+            filters.get('target_language'), 
+            filters.get('definition_language'),
+            limit,
+            callback=on_search_success,
+            error_callback=on_search_error
+        )
+    
     def save_entry(self, entry: DictionaryEntry) -> Optional[int]:
         """
         Save a dictionary entry to storage.
@@ -303,6 +405,34 @@ class DictionaryModel:
             
         return entry_id
         
+    def save_entries_bulk(self, entries: List[DictionaryEntry], validated: bool = False) -> Tuple[int, int, int]:
+        """
+        Save several dictionary entries to storage in one transaction.
+        
+        Invalid entries and entries that already exist are skipped. Entries
+        the database fails to save are counted separately.
+        
+        Args:
+            entries: The dictionary entries to save
+            validated: Whether the caller already checked the entries with is_valid_entry
+            
+        Returns:
+            Tuple of (saved_count, skipped_count, failed_count)
+        """
+        valid_entries = entries if validated else [entry for entry in entries if self._validate_entry(entry)]
+        invalid_count = len(entries) - len(valid_entries)
+        
+        saved_count, skipped_count, failed_count = (
+            self.db_service.add_entries_bulk(valid_entries) if valid_entries else (0, 0, 0)
+        )
+        
+        if saved_count and self.event_bus:
+            self.event_bus.publish('entries:saved', {
+                'saved_count': saved_count
+            })
+            
+        return saved_count, skipped_count + invalid_count, failed_count
+        
     def save_entry_async(self, entry: DictionaryEntry, callback: Callable = None, error_callback: Callable = None) -> None:
         """
         Save a dictionary entry to storage asynchronously.
@@ -403,10 +533,7 @@ class DictionaryModel:
         cache_key = self._get_cache_key(headword, target_lang, source_lang, definition_lang)
         
         # Remove from cache if present
-        if cache_key in self.cached_entries:
-            del self.cached_entries[cache_key]
-            if cache_key in self.cache_access_order:
-                self.cache_access_order.remove(cache_key)
+        self.cached_entries.pop(cache_key, None)
         
         # Delete from database
         success = self.db_service.delete_entry(
@@ -447,10 +574,7 @@ class DictionaryModel:
         cache_key = self._get_cache_key(headword, target_lang, source_lang, definition_lang)
         
         # Remove from cache if present
-        if cache_key in self.cached_entries:
-            del self.cached_entries[cache_key]
-            if cache_key in self.cache_access_order:
-                self.cache_access_order.remove(cache_key)
+        self.cached_entries.pop(cache_key, None)
                 
         # Get async service
         async_service = getattr(self, 'async_service', None)
@@ -507,6 +631,27 @@ class DictionaryModel:
             error_callback=on_delete_error
         )
     
+    def count_entries(self) -> int:
+        """
+        Count the entries in the dictionary.
+        
+        Returns:
+            Number of entries
+        """
+        return self.db_service.count_entries()
+    
+    def get_all_entries(self, batch_size: int = 1000) -> Iterator[DictionaryEntry]:
+        """
+        Iterate over every entry in the dictionary.
+        
+        Args:
+            batch_size: Number of database rows to fetch at a time
+            
+        Returns:
+            Iterator of dictionary entries, fetched lazily in batches
+        """
+        return self.db_service.iter_all_entries(batch_size)
+    
     def get_all_languages(self) -> Dict[str, List[str]]:
         """
         Get all languages used in the dictionary.
@@ -516,6 +661,15 @@ class DictionaryModel:
         """
         return self.db_service.get_all_languages()
         
+    def get_entry_keys(self) -> Set[Tuple[str, str, str, str]]:
+        """
+        Get the unique key of every entry in the dictionary.
+        
+        Returns:
+            Set of (headword, source_language, target_language, definition_language) tuples
+        """
+        return self.db_service.get_entry_keys()
+        
     def get_all_languages_async(self, callback: Callable = None, error_callback: Callable = None) -> None:
         """
         Get all languages used in the dictionary asynchronously.
@@ -638,7 +792,6 @@ class DictionaryModel:
     def clear_cache(self) -> None:
         """Clear the entry cache."""
         self.cached_entries.clear()
-        self.cache_access_order.clear()
     
     def _validate_entry(self, entry: DictionaryEntry) -> bool:
         """
@@ -651,29 +804,21 @@ class DictionaryModel:
             True if valid, False otherwise
         """
         # Check required top-level fields
-        required_fields = ['headword', 'metadata', 'meanings']
-        for field in required_fields:
-            if field not in entry:
-                return False
+        if not isinstance(entry, dict) or not entry.keys() >= _REQUIRED_ENTRY_FIELDS:
+            return False
         
         # Check metadata
-        metadata = entry.get('metadata', {})
-        required_metadata = ['source_language', 'target_language', 'definition_language']
-        for field in required_metadata:
-            if field not in metadata:
-                return False
+        metadata = entry['metadata']
+        if not isinstance(metadata, dict) or not metadata.keys() >= _REQUIRED_METADATA_FIELDS:
+            return False
         
         # Check at least one meaning
-        meanings = entry.get('meanings', [])
+        meanings = entry['meanings']
         if not meanings or not isinstance(meanings, list):
             return False
         
         # Check meaning structure
-        for meaning in meanings:
-            if 'definition' not in meaning:
-                return False
-        
-        return True
+        return all('definition' in meaning for meaning in meanings)
         
     def is_valid_entry(self, entry: DictionaryEntry) -> bool:
         """
@@ -726,14 +871,12 @@ class DictionaryModel:
             entry: The dictionary entry to cache
         """
         # If cache is full, remove least recently used entry
-        if len(self.cached_entries) >= self.max_cache_size and self.cache_access_order:
-            lru_key = self.cache_access_order.pop(0)
-            if lru_key in self.cached_entries:
-                del self.cached_entries[lru_key]
+        if cache_key not in self.cached_entries and len(self.cached_entries) >= self.max_cache_size:
+            self.cached_entries.popitem(last=False)
         
-        # Add new entry to cache
+        # Add new entry to cache as the most recently used
         self.cached_entries[cache_key] = entry
-        self.cache_access_order.append(cache_key)
+        self.cached_entries.move_to_end(cache_key)
     
     def _update_cache_access(self, cache_key: str) -> None:
         """
@@ -742,6 +885,5 @@ class DictionaryModel:
         Args:
             cache_key: The cache key to update
         """
-        if cache_key in self.cache_access_order:
-            self.cache_access_order.remove(cache_key)
-            self.cache_access_order.append(cache_key)
\ No newline at end of file
+        if cache_key in self.cached_entries:
+            self.cached_entries.move_to_end(cache_key)
\ No newline at end of file
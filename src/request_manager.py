@@ -212,6 +212,13 @@ class RequestManager:
                     result = self.dictionary_engine.validate_language(language_name)
                     request.complete(result)
                 
+                elif request.request_type == 'anki_export':
+                    exporter = request.params['exporter']
+                    entry = request.params.get('entry')
+                    note_type = request.params.get('note_type')
+                    result = exporter.export_entry(entry, note_type)
+                    request.complete(result)
+                
                 else:
                     request.fail(f"Unknown request type: {request.request_type}")
             
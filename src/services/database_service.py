@@ -13,7 +13,7 @@ import threading
 import queue
 from pathlib import Path
 from contextlib import contextmanager
-from typing import List, Dict, Optional, Any, Union, Tuple, Callable
+from typing import List, Dict, Optional, Any, Union, Tuple, Callable, Iterator, Set
 
 from .base_service import BaseService
 
@@ -155,6 +155,11 @@ class DatabaseService(BaseService):
                 (headword, part_of_speech, source_language, target_language, definition_language, has_context)
                 VALUES (?, ?, ?, ?, ?, ?)
             """,
+            'insert_entry_or_ignore': """
+                INSERT OR IGNORE INTO entries 
+                (headword, part_of_speech, source_language, target_language, definition_language, has_context)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
             'delete_entry': """
                 DELETE FROM entries 
                 WHERE headword = ?
@@ -337,6 +342,100 @@ class DatabaseService(BaseService):
                 'path': str(self.db_path)
             })
     
+    def _insert_entry(self, cursor, entry: Dict[str, Any], ignore_duplicate: bool = False) -> Optional[int]:
+        """
+        Insert an entry with its meanings, examples and context sentence.
+        
+        Runs inside the caller's transaction.
+        
+        Args:
+            cursor: Cursor of the connection holding the transaction
+            entry: Dictionary entry to insert
+            ignore_duplicate: Skip the entry instead of raising if it already exists
+            
+        Returns:
+            ID of the new entry, or None if it was skipped as a duplicate
+        """
+        # Extract entry data
+        headword = entry.get('headword', '')
+        metadata = entry.get('metadata', {})
+        part_of_speech = entry.get('part_of_speech', '')
+        
+        # Get language data
+        source_language = metadata.get('source_language', '')
+        target_language = metadata.get('target_language', '')
+        definition_language = metadata.get('definition_language', '')
+        
+        # Check if entry has context sentence
+        has_context = 0
+        if 'context_sentence' in metadata and metadata['context_sentence']:
+            has_context = 1
+        
+        # Insert entry
+        statement = self.statements['insert_entry_or_ignore' if ignore_duplicate else 'insert_entry']
+        cursor.execute(statement, (
+            headword,
+            part_of_speech,
+            source_language,
+            target_language,
+            definition_language,
+            has_context
+        ))
+        
+        # An ignored insert leaves the existing entry untouched
+        if not cursor.rowcount:
+            return None
+        
+        # Get the ID of the new entry
+        entry_id = cursor.lastrowid
+        
+        # Add meanings
+        meanings = entry.get('meanings', [])
+        for meaning in meanings:
+            # Get meaning data
+            definition = meaning.get('definition', '')
+            noun_type = meaning.get('noun_type', '')
+            verb_type = meaning.get('verb_type', '')
+            comparison = meaning.get('comparison', '')
+            
+            # Insert meaning
+            cursor.execute(self.statements['insert_meaning'], (
+                entry_id,
+                definition,
+                noun_type,
+                verb_type,
+                comparison
+            ))
+            
+            # Get the ID of the new meaning
+            meaning_id = cursor.lastrowid
+            
+            # Add examples
+            examples = meaning.get('examples', [])
+            cursor.executemany(self.statements['insert_example'], [
+                (
+                    meaning_id,
+                    example.get('sentence', ''),
+                    example.get('translation', ''),
+                    example.get('is_context', 0)
+                )
+                for example in examples
+            ])
+        
+        # Add context sentence if present
+        if has_context:
+            context_sentence = metadata.get('context_sentence', '')
+            selected_text = metadata.get('selected_text', headword)
+            
+            if context_sentence and selected_text:
+                cursor.execute(self.statements['save_sentence_context'], (
+                    entry_id,
+                    context_sentence,
+                    selected_text
+                ))
+        
+        return entry_id
+    
     def add_entry(self, entry: Dict[str, Any], progress_callback: Callable = None) -> Optional[int]:
         """
         Add a dictionary entry to the database.
@@ -356,89 +455,14 @@ class DatabaseService(BaseService):
                 cursor.execute("BEGIN TRANSACTION")
                 
                 try:
-                    # Extract entry data
-                    headword = entry.get('headword', '')
-                    metadata = entry.get('metadata', {})
-                    part_of_speech = entry.get('part_of_speech', '')
-                    
-                    # Get language data
-                    source_language = metadata.get('source_language', '')
-                    target_language = metadata.get('target_language', '')
-                    definition_language = metadata.get('definition_language', '')
-                    
-                    # Check if entry has context sentence
-                    has_context = 0
-                    if 'context_sentence' in metadata and metadata['context_sentence']:
-                        has_context = 1
-                    
-                    # Insert entry
-                    cursor.execute(self.statements['insert_entry'], (
-                        headword,
-                        part_of_speech,
-                        source_language,
-                        target_language,
-                        definition_language,
-                        has_context
-                    ))
-                    
-                    # Get the ID of the new entry
-                    entry_id = cursor.lastrowid
-                    
-                    # Add meanings
-                    meanings = entry.get('meanings', [])
-                    for meaning in meanings:
-                        # Get meaning data
-                        definition = meaning.get('definition', '')
-                        noun_type = meaning.get('noun_type', '')
-                        verb_type = meaning.get('verb_type', '')
-                        comparison = meaning.get('comparison', '')
-                        
-                        # Insert meaning
-                        cursor.execute(self.statements['insert_meaning'], (
-                            entry_id,
-                            definition,
-                            noun_type,
-                            verb_type,
-                            comparison
-                        ))
-                        
-                        # Get the ID of the new meaning
-                        meaning_id = cursor.lastrowid
-                        
-                        # Add examples
-                        examples = meaning.get('examples', [])
-                        for example in examples:
-                            # Get example data
-                            sentence = example.get('sentence', '')
-                            translation = example.get('translation', '')
-                            is_context = example.get('is_context', 0)
-                            
-                            # Insert example
-                            cursor.execute(self.statements['insert_example'], (
-                                meaning_id,
-                                sentence,
-                                translation,
-                                is_context
-                            ))
-                    
-                    # Add context sentence if present
-                    if has_context:
-                        context_sentence = metadata.get('context_sentence', '')
-                        selected_text = metadata.get('selected_text', headword)
-                        
-                        if context_sentence and selected_text:
-                            cursor.execute(self.statements['save_sentence_context'], (
-                                entry_id,
-                                context_sentence,
-                                selected_text
-                            ))
+                    entry_id = self._insert_entry(cursor, entry)
                     
                     # Commit the transaction
                     conn.commit()
                     
                     self.publish_event('database:entry_added', {
                         'entry_id': entry_id,
-                        'headword': headword
+                        'headword': entry.get('headword', '')
                     })
                     
                     return entry_id
@@ -463,6 +487,85 @@ class DatabaseService(BaseService):
             
             return None
     
+    def add_entries_bulk(self, entries: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """
+        Add several dictionary entries in a single transaction.
+        
+        Entries that already exist are skipped. An entry that fails to insert
+        is rolled back on its own without affecting the rest of the batch.
+        
+        Args:
+            entries: Dictionary entries to add
+            
+        Returns:
+            Tuple of (added_count, skipped_count, failed_count)
+        """
+        added_count = 0
+        skipped_count = 0
+        failed_count = 0
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Start a transaction
+                cursor.execute("BEGIN TRANSACTION")
+                
+                try:
+                    for entry in entries:
+                        # A savepoint lets one bad entry roll back without losing the batch
+                        cursor.execute("SAVEPOINT bulk_entry")
+                        try:
+                            # Duplicates are ignored by the insert rather than raised
+                            entry_id = self._insert_entry(cursor, entry, ignore_duplicate=True)
+                        except Exception as e:
+                            cursor.execute("ROLLBACK TO bulk_entry")
+                            cursor.execute("RELEASE bulk_entry")
+                            failed_count += 1
+                            
+                            self.publish_event('database:error', {
+                                'operation': 'add_entries_bulk',
+                                'error': str(e),
+                                'headword': entry.get('headword', '') if isinstance(entry, dict) else ''
+                            })
+                            continue
+                        cursor.execute("RELEASE bulk_entry")
+                        
+                        if entry_id:
+                            added_count += 1
+                        else:
+                            skipped_count += 1
+                    
+                    # Commit the transaction
+                    conn.commit()
+                    
+                except Exception as e:
+                    # Roll back the transaction on error
+                    conn.rollback()
+                    
+                    self.publish_event('database:error', {
+                        'operation': 'add_entries_bulk',
+                        'error': str(e)
+                    })
+                    
+                    return 0, 0, len(entries)
+        
+        except Exception as e:
+            self.publish_event('database:connection_error', {
+                'operation': 'add_entries_bulk',
+                'error': str(e)
+            })
+            
+            return 0, 0, len(entries)
+        
+        self.publish_event('database:entries_added', {
+            'added_count': added_count,
+            'skipped_count': skipped_count,
+            'failed_count': failed_count
+        })
+        
+        return added_count, skipped_count, failed_count
+    
     def get_entry_by_headword(
         self, 
         headword: str, 
@@ -546,25 +649,10 @@ class DatabaseService(BaseService):
                 cursor = conn.cursor()
                 
                 # Build the query dynamically
-                query = "SELECT * FROM entries WHERE 1=1"
-                params = []
-                
-                # Add filters if provided
-                if search_term:
-                    query += " AND headword LIKE ?"
-                    params.append(f"%{search_term}%")
-                
-                if source_lang:
-                    query += " AND source_language = ?"
-                    params.append(source_lang)
-                
-                if target_lang:
-                    query += " AND target_language = ?"
-                    params.append(target_lang)
-                
-                if definition_lang:
-                    query += " AND definition_language = ?"
-                    params.append(definition_lang)
+                conditions, params = self._build_search_conditions(
+                    search_term, source_lang, target_lang, definition_lang
+                )
+                query = "SELECT * FROM entries WHERE 1=1" + conditions
                 
                 # First count total results to calculate progress
                 count_query = f"SELECT COUNT(*) as count FROM ({query})"
@@ -622,6 +710,116 @@ class DatabaseService(BaseService):
             
             return []
             
+    def search_headwords(
+        self, 
+        search_term: str = None, 
+        source_lang: str = None, 
+        target_lang: str = None, 
+        definition_lang: str = None,
+        limit: int = 50,
+        offset: int = 0,
+        progress_callback: Callable = None
+    ) -> List[str]:
+        """
+        Search for the headwords of dictionary entries.
+        
+        Matches the same entries as search_entries, in the same order, without
+        loading their meanings and examples.
+        
+        Args:
+            search_term: Optional search term (substring of headword)
+            source_lang: Optional source language filter
+            target_lang: Optional target language filter
+            definition_lang: Optional definition language filter
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            progress_callback: Optional callback for reporting progress
+            
+        Returns:
+            List of matching headwords
+            
+        Raises:
+            Exception: If the search fails, after publishing database:error
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                conditions, params = self._build_search_conditions(
+                    search_term, source_lang, target_lang, definition_lang
+                )
+                query = (
+                    "SELECT headword FROM entries WHERE 1=1" + conditions +
+                    " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+                )
+                params.append(limit)
+                params.append(offset)
+                
+                cursor.execute(query, params)
+                headwords = [row['headword'] for row in cursor.fetchall()]
+                
+                if progress_callback:
+                    progress_callback(100)
+                
+                # Publish event with search results
+                self.publish_event('database:search_completed', {
+                    'search_term': search_term,
+                    'count': len(headwords)
+                })
+                
+                return headwords
+                
+        except Exception as e:
+            self.publish_event('database:error', {
+                'operation': 'search_headwords',
+                'error': str(e),
+                'search_term': search_term
+            })
+            
+            # Unlike an empty result, a failure must not look like "no matches"
+            raise
+    
+    def _build_search_conditions(
+        self, 
+        search_term: Optional[str], 
+        source_lang: Optional[str], 
+        target_lang: Optional[str], 
+        definition_lang: Optional[str]
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the WHERE conditions for an entry search.
+        
+        Args:
+            search_term: Optional search term (substring of headword)
+            source_lang: Optional source language filter
+            target_lang: Optional target language filter
+            definition_lang: Optional definition language filter
+            
+        Returns:
+            Tuple of (conditions to append after "WHERE 1=1", query parameters)
+        """
+        conditions = ""
+        params = []
+        
+        # Add filters if provided
+        if search_term:
+            conditions += " AND headword LIKE ?"
+            params.append(f"%{search_term}%")
+        
+        if source_lang:
+            conditions += " AND source_language = ?"
+            params.append(source_lang)
+        
+        if target_lang:
+            conditions += " AND target_language = ?"
+            params.append(target_lang)
+        
+        if definition_lang:
+            conditions += " AND definition_language = ?"
+            params.append(definition_lang)
+            
+        return conditions, params
+            
     def search_entries_async(
         self,
         async_service,
@@ -669,6 +867,110 @@ class DatabaseService(BaseService):
             error_callback=error_callback
         )
     
+    def search_headwords_async(
+        self,
+        async_service,
+        search_term: str = None, 
+        source_lang: str = None, 
+        target_lang: str = None, 
+        definition_lang: str = None,
+        limit: int = 50,
+        offset: int = 0,
+        callback: Callable = None,
+        error_callback: Callable = None
+    ) -> str:
+        """
+        Search for the headwords of dictionary entries asynchronously.
+        
+        Args:
+            async_service: The async service to use
+            search_term: Optional search term (substring of headword)
+            source_lang: Optional source language filter
+            target_lang: Optional target language filter
+            definition_lang: Optional definition language filter
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            callback: Function to call with result on success
+            error_callback: Function to call with error on failure
+            
+        Returns:
+            Task ID for the async operation
+        """
+        search_desc = f"'{search_term}'" if search_term else "all headwords"
+        if target_lang:
+            search_desc += f" in {target_lang}"
+            
+        return async_service.submit_task(
+            self.search_headwords,
+            search_term,
+            source_lang,
+            target_lang,
+            definition_lang,
+            limit,
+            offset,
+            name=f"Search Headwords: {search_desc}",
+            description=f"Searching for {search_desc} in the dictionary",
+            callback=callback,
+            error_callback=error_callback
+        )
+    
+    def count_entries(self) -> int:
+        """
+        Count the entries in the dictionary.
+        
+        Returns:
+            Number of entries, or 0 if the count failed
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) AS count FROM entries")
+                return cursor.fetchone()['count']
+                
+        except Exception as e:
+            self.publish_event('database:error', {
+                'operation': 'count_entries',
+                'error': str(e)
+            })
+            
+            return 0
+    
+    def iter_all_entries(self, batch_size: int = 1000) -> Iterator[Dict]:
+        """
+        Iterate over every dictionary entry using a single query.
+        
+        Entry rows are fetched in batches of batch_size, so the whole table is
+        never held in memory at once.
+        
+        Args:
+            batch_size: Number of entry rows to fetch per batch
+            
+        Yields:
+            Complete entry dictionaries, newest first
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # Entries are built with their own cursor so the batched result set stays intact
+                entry_cursor = conn.cursor()
+                
+                cursor.execute("SELECT id FROM entries ORDER BY created_at DESC")
+                
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                        
+                    for row in rows:
+                        yield self._construct_entry_dict(row['id'], entry_cursor)
+                        
+        except Exception as e:
+            self.publish_event('database:error', {
+                'operation': 'iter_all_entries',
+                'error': str(e)
+            })
+            raise
+    
     def get_all_languages(self) -> Dict[str, List[str]]:
         """
         Get all languages used in the dictionary.
@@ -712,6 +1014,29 @@ class DatabaseService(BaseService):
                 'definition_languages': []
             }
     
+    def get_entry_keys(self) -> Set[Tuple[str, str, str, str]]:
+        """
+        Get the unique key of every entry in the dictionary.
+        
+        Returns:
+            Set of (headword, source_language, target_language, definition_language) tuples
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT headword, source_language, target_language, definition_language FROM entries"
+                )
+                return {tuple(row) for row in cursor.fetchall()}
+                
+        except Exception as e:
+            self.publish_event('database:error', {
+                'operation': 'get_entry_keys',
+                'error': str(e)
+            })
+            
+            return set()
+    
     def get_all_languages_async(self, async_service, callback: Callable = None, error_callback: Callable = None) -> str:
         """
         Get all languages used in the dictionary asynchronously.
@@ -10,6 +10,8 @@ class UserSettings:
         """Initialize user settings manager"""
         self.settings_file = settings_file
         self.settings = self.load_settings()
+        # Incremented on every save so callers can tell when cached values are stale
+        self.version = 0
     
     def load_settings(self):
         """Load settings from file if it exists"""
@@ -64,6 +66,7 @@ class UserSettings:
     
     def save_settings(self):
         """Save current settings to file"""
+        self.version += 1
         try:
             # Ensure directory exists if settings file is in a subdirectory
             settings_dir = os.path.dirname(self.settings_file)
@@ -1,5 +1,6 @@
 import threading
-from typing import Dict, List, Callable, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Callable, Any, Optional, Iterator
 
 class EventBus:
     """
@@ -24,6 +25,11 @@ class EventBus:
         """Initialize the event bus."""
         self.subscribers: Dict[str, List[Callable]] = {}
         self.lock = threading.RLock()
+        
+        # Events held back by batched(), latest payload per event type
+        self._batch_events: Dict[str, Any] = {}
+        self._batch_depth = 0
+        self._batch_thread: Optional[int] = None
     
     def subscribe(self, event_type: str, callback: Callable) -> None:
         """
@@ -63,11 +69,21 @@ class EventBus:
         
         Args:
             event_type: The type of event to publish
-            data: Data to pass to subscribers (optional)
+            data: Data to pass to subscribers (optional, an empty dict if omitted)
             
         Returns:
-            int: Number of subscribers notified
+            int: Number of subscribers notified (0 if the event was deferred by batched())
         """
+        if data is None:
+            data = {}
+            
+        if self._batch_depth and self._batch_thread == threading.get_ident():
+            with self.lock:
+                # Keep only the latest payload, delivered in order of last publish
+                self._batch_events.pop(event_type, None)
+                self._batch_events[event_type] = data
+            return 0
+            
         if event_type not in self.subscribers:
             return 0
             
@@ -100,6 +116,43 @@ class EventBus:
         )
         thread.start()
         
+    @contextmanager
+    def batched(self) -> Iterator["EventBus"]:
+        """
+        Hold back events published inside the block and deliver them when it ends.
+        
+        Only the most recent payload of each event type is delivered, so
+        subscribers see one update per event type instead of one per publish.
+        Events published from other threads are delivered immediately, and
+        nested batches are delivered when the outermost one ends.
+        
+        Usage:
+            with event_bus.batched():
+                event_bus.publish("ui:theme_changed", {"theme": "dark"})
+                event_bus.publish("ui:theme_changed", {"theme": "light"})
+            # Subscribers are called once, with {"theme": "light"}
+        """
+        thread_id = threading.get_ident()
+        with self.lock:
+            if self._batch_depth and self._batch_thread != thread_id:
+                raise RuntimeError("An event batch is already open on another thread")
+            self._batch_thread = thread_id
+            self._batch_depth += 1
+            
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self._batch_depth -= 1
+                pending = {}
+                if not self._batch_depth:
+                    pending = self._batch_events
+                    self._batch_events = {}
+                    self._batch_thread = None
+                    
+            for event_type, data in pending.items():
+                self.publish(event_type, data)
+        
     def clear_all_subscriptions(self) -> None:
         """Clear all event subscriptions."""
         with self.lock:
@@ -62,6 +62,7 @@ class LogHandler:
             # Informational events (INFO level)
             'database:initialized': logger.INFO,
             'database:entry_added': logger.INFO,
+            'database:entries_added': logger.INFO,
             'database:entry_deleted': logger.INFO,
             'database:cache_cleared': logger.INFO,
             
@@ -118,6 +119,7 @@ class LogHandler:
             
             # Entry events
             'entry:saved': logger.INFO,
+            'entries:saved': logger.INFO,
             'entry:retrieved': logger.DEBUG,
             
             # Cache events
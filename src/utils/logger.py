@@ -188,6 +188,22 @@ class Logger:
             # Update specific handler
             self.handlers[handler].setLevel(level)
     
+    def is_enabled_for(self, level: int, module: Optional[str] = None) -> bool:
+        """
+        Check whether messages at a level would be logged.
+        
+        Use this to skip building expensive log arguments that would be discarded.
+        
+        Args:
+            level: Log level
+            module: Module name (uses root logger if None)
+            
+        Returns:
+            True if messages at the level are logged
+        """
+        logger = self.root_logger if module is None else self.get_logger(module)
+        return logger.isEnabledFor(level)
+    
     def log(self, level: int, message: str, module: Optional[str] = None, exc_info=None, **kwargs):
         """
         Log a message at the specified level.
@@ -202,6 +218,10 @@ class Logger:
         # Get logger
         logger = self.root_logger if module is None else self.get_logger(module)
         
+        # Skip formatting the context for messages that would be discarded
+        if not logger.isEnabledFor(level):
+            return
+        
         # Combine context
         context = {**self.context, **kwargs}
         
@@ -381,6 +401,10 @@ def get_logger(module_name: str) -> logging.Logger:
     """
     return app_logger.get_logger(module_name)
 
+def is_enabled_for(level: int, module: Optional[str] = None) -> bool:
+    """Check whether messages at a level would be logged."""
+    return app_logger.is_enabled_for(level, module)
+
 def trace(message: str, module: Optional[str] = None, **kwargs):
     """Log a TRACE message."""
     app_logger.trace(message, module, **kwargs)
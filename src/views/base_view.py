@@ -59,9 +59,10 @@ class BaseView:
         # Create the view frame
         self._create_frame()
         
-        # Register for scale factor updates if event bus provided
+        # Register for scale factor and theme updates if event bus provided
         if self.event_bus:
             self.event_bus.subscribe('ui:scale_factor_changed', self._on_scale_factor_changed)
+            self.event_bus.subscribe('ui:theme_changed', self._on_theme_changed)
     
     def _create_frame(self):
         """Create the main frame for this view."""
@@ -222,7 +223,8 @@ class BaseView:
         Args:
             data: Event data including the new scale factor
         """
-        if 'scale_factor' in data:
+        # Views that already use this scale factor have nothing to update
+        if 'scale_factor' in data and data['scale_factor'] != self.scale_factor:
             self.scale_factor = data['scale_factor']
             self.update_scale()
     
@@ -235,11 +237,35 @@ class BaseView:
         """
         pass
     
+    def _on_theme_changed(self, data: Dict[str, Any]):
+        """
+        Handle changes to the UI theme.
+        
+        Args:
+            data: Event data including the theme name and its colors
+        """
+        if 'theme' in data:
+            self.apply_theme(data['theme'], data.get('colors', {}))
+    
+    def apply_theme(self, theme: str, colors: Dict[str, str]):
+        """
+        Update UI elements for a new theme.
+        
+        ttk widgets already follow the application's ttk styles; this method
+        should be overridden by subclasses that use plain tk widgets.
+        
+        Args:
+            theme: The applied theme ('light' or 'dark')
+            colors: Color scheme for the theme
+        """
+        pass
+    
     def destroy(self):
         """Clean up resources and destroy the view."""
         # Unsubscribe from events
         if self.event_bus:
             self.event_bus.unsubscribe('ui:scale_factor_changed', self._on_scale_factor_changed)
+            self.event_bus.unsubscribe('ui:theme_changed', self._on_theme_changed)
             
             # Unsubscribe from all registered events
             for event_name in self.event_handlers:
@@ -7,7 +7,7 @@ to filter the dictionary by target and definition languages.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any, Optional, List, Callable, Set
+from typing import Dict, Optional, List, Callable, Set
 
 from .base_view import BaseView
 
@@ -233,20 +233,19 @@ class LanguageFilterView(BaseView):
         # Trigger language change event
         self._on_language_change()
     
-    def update_headword_list(self, headwords: List[Dict[str, Any]]):
+    def update_headword_list(self, headwords: List[str]):
         """
         Update the headword listbox with filtered entries.
         
         Args:
-            headwords: List of entry dictionaries with headword and metadata
+            headwords: Headwords of the filtered entries
         """
         # Clear the listbox
         self.headword_listbox.delete(0, tk.END)
         
-        # Add headwords to the listbox
-        for entry in headwords:
-            headword = entry.get('headword', '')
-            self.headword_listbox.insert(tk.END, headword)
+        # Add headwords to the listbox in a single call
+        if headwords:
+            self.headword_listbox.insert(tk.END, *headwords)
             
         # Update listbox appearance
         self._update_listbox_appearance()
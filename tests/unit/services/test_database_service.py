@@ -236,6 +236,107 @@ class TestDatabaseService:
         assert len(results) == 1
         assert results[0]["headword"] != "apple"  # Should be second entry
     
+    def test_search_headwords(self, db_service):
+        """Test searching for the headwords of dictionary entries."""
+        for headword, target_lang in [("apple", "Czech"), ("banana", "Czech"), ("pineapple", "Spanish")]:
+            db_service.add_entry({
+                "headword": headword,
+                "part_of_speech": "noun",
+                "metadata": {
+                    "source_language": "English",
+                    "target_language": target_lang,
+                    "definition_language": "English"
+                },
+                "meanings": [{"definition": "A fruit"}]
+            })
+        
+        # Same matches and order as search_entries
+        assert db_service.search_headwords() == [e["headword"] for e in db_service.search_entries()]
+        assert sorted(db_service.search_headwords(search_term="apple")) == ["apple", "pineapple"]
+        assert db_service.search_headwords(search_term="apple", target_lang="Czech") == ["apple"]
+        assert len(db_service.search_headwords(limit=2)) == 2
+        
+        # A failed search raises rather than looking like an empty result
+        with patch.object(db_service, "get_connection", side_effect=sqlite3.OperationalError("database is locked")):
+            with pytest.raises(sqlite3.OperationalError):
+                db_service.search_headwords(search_term="apple")
+    
+    def test_iter_all_entries(self, db_service):
+        """Test iterating over all entries in batches."""
+        # Add more entries than fit in one batch, across two target languages
+        for i, target_lang in enumerate(["Czech", "Spanish", "Czech", "Spanish", "Czech"]):
+            db_service.add_entry({
+                "headword": f"word{i}",
+                "part_of_speech": "noun",
+                "metadata": {
+                    "source_language": "English",
+                    "target_language": target_lang,
+                    "definition_language": "English"
+                },
+                "meanings": [{"definition": f"Definition {i}", "examples": [{"sentence": f"Sentence {i}"}]}]
+            })
+        
+        # Every entry is returned, complete with meanings and examples
+        results = list(db_service.iter_all_entries(batch_size=2))
+        assert len(results) == 5
+        assert db_service.count_entries() == 5
+        assert sorted(r["headword"] for r in results) == [f"word{i}" for i in range(5)]
+        assert all(r["meanings"][0]["examples"] for r in results)
+        
+        # An empty database yields nothing
+        for entry in results:
+            db_service.delete_entry(entry["headword"], entry["metadata"]["source_language"],
+                                    entry["metadata"]["target_language"], entry["metadata"]["definition_language"])
+        assert list(db_service.iter_all_entries()) == []
+    
+    def test_add_entries_bulk(self, db_service):
+        """Test adding several entries in one transaction."""
+        def make_entry(headword):
+            return {
+                "headword": headword,
+                "part_of_speech": "noun",
+                "metadata": {
+                    "source_language": "English",
+                    "target_language": "Czech",
+                    "definition_language": "English"
+                },
+                "meanings": [{"definition": f"Definition of {headword}", "examples": [{"sentence": "Sentence"}]}]
+            }
+        
+        # Add an entry up front so the batch contains a duplicate
+        assert db_service.add_entry(make_entry("pes")) is not None
+        
+        added, skipped, failed = db_service.add_entries_bulk([
+            make_entry("kočka"),
+            make_entry("pes"),
+            make_entry("dům"),
+            make_entry("kočka")
+        ])
+        
+        # Duplicates of saved entries and within the batch are skipped
+        assert (added, skipped, failed) == (2, 2, 0)
+        entry = db_service.get_entry_by_headword("dům")
+        assert entry["meanings"][0]["examples"][0]["sentence"] == "Sentence"
+        assert len(list(db_service.iter_all_entries())) == 3
+        
+        # Every saved entry is reported by its unique key
+        assert db_service.get_entry_keys() == {
+            (headword, "English", "Czech", "English") for headword in ("pes", "kočka", "dům")
+        }
+        
+        # An entry that fails to insert is rolled back on its own
+        broken = make_entry("broken")
+        broken["meanings"][0]["examples"] = ["just a string"]
+        added, skipped, failed = db_service.add_entries_bulk([
+            make_entry("strom"),
+            broken,
+            make_entry("les")
+        ])
+        assert (added, skipped, failed) == (2, 0, 1)
+        assert db_service.get_entry_by_headword("strom") is not None
+        assert db_service.get_entry_by_headword("les") is not None
+        assert db_service.get_entry_by_headword("broken") is None
+    
     def test_get_all_languages(self, db_service):
         """Test getting all languages."""
         # Add entries with different languages
@@ -136,6 +136,16 @@ class TestEventBus:
         assert count == 1  # Only one callback succeeded
         assert normal_called is True
     
+    def test_publish_without_data(self):
+        """Test that subscribers receive an empty dict when no data is published."""
+        event_bus = EventBus()
+        received = []
+        event_bus.subscribe("test_event", received.append)
+        
+        event_bus.publish("test_event")
+        
+        assert received == [{}]
+    
     def test_async_publish(self):
         """Test publishing events asynchronously."""
         event_bus = EventBus()
@@ -162,6 +172,44 @@ class TestEventBus:
         # Now it should be called
         assert called is True
     
+    def test_batched_publish(self):
+        """Test that batched events are deferred and deduplicated by type."""
+        event_bus = EventBus()
+        
+        received = []
+        event_bus.subscribe("event1", lambda data: received.append(("event1", data)))
+        event_bus.subscribe("event2", lambda data: received.append(("event2", data)))
+        
+        with event_bus.batched():
+            assert event_bus.publish("event1", {"value": 1}) == 0
+            event_bus.publish("event2", {"value": 2})
+            event_bus.publish("event1", {"value": 3})
+            
+            # Nothing is delivered inside the batch, even when nested
+            with event_bus.batched():
+                event_bus.publish("event2", {"value": 4})
+            assert received == []
+        
+        # Latest payload per event type, in order of last publish
+        assert received == [("event1", {"value": 3}), ("event2", {"value": 4})]
+        
+        # Publishing after the batch is immediate again
+        event_bus.publish("event1", {"value": 5})
+        assert received[-1] == ("event1", {"value": 5})
+    
+    def test_batched_publish_other_thread(self):
+        """Test that events from other threads bypass an open batch."""
+        event_bus = EventBus()
+        
+        received = []
+        event_bus.subscribe("test_event", received.append)
+        
+        with event_bus.batched():
+            thread = threading.Thread(target=event_bus.publish, args=("test_event", "from thread"))
+            thread.start()
+            thread.join()
+            assert received == ["from thread"]
+    
     def test_clear_event_subscriptions(self):
         """Test clearing all subscriptions for a specific event."""
         event_bus = EventBus()
@@ -86,6 +86,17 @@ class TestLogger:
             # Check that all levels were updated
             assert logger.handlers['console'].level == logging.INFO
             assert logger.handlers['file'].level == logging.INFO
+            
+            # Check which levels are enabled
+            assert logger.is_enabled_for(logging.INFO, "test_module")
+            assert not logger.is_enabled_for(TRACE, "test_module")
+            assert not logger.is_enabled_for(logging.DEBUG)
+            
+            # Context of discarded messages is never formatted
+            class Unformattable:
+                def __repr__(self):
+                    raise AssertionError("context formatted for a discarded message")
+            logger.debug("Discarded message", "test_module", value=Unformattable())
     
     def test_log_methods(self):
         """Test different logging methods."""